@@ -5,13 +5,1526 @@ Created on Sun Jul  3 18:43:51 2022
 @author: panna
 """
 
-import requests
-from requests.auth import HTTPBasicAuth
-import jxmlease
+# requests, urllib3, jxmlease, asyncio, datetime, concurrent.futures, ssl, socket, base64, json and random are imported
+# where they are first used, so that importing this module stays cheap for short-lived scripts that spawn one interpreter per task
+import ipaddress
+import itertools
+import os
+import re
+import sys
+import threading
 import time
-import typing
-from datetime import datetime, timezone
-from functools import wraps
+from collections import deque, namedtuple
+from collections.abc import Mapping
+from contextlib import asynccontextmanager, contextmanager
+from functools import lru_cache
+from urllib.parse import urlsplit, parse_qs
+from xml.parsers import expat
+import xml.etree.ElementTree as ET
+
+
+class RoomOSError(Exception):
+    """Base of the errors of this library. str() is the message the functions have always returned,
+    status_code is the HTTP status of the answer when there was one and details the Error element of the device"""
+    
+    def __init__(self, message : str, status_code : int = None, details = None):
+        super().__init__(message)
+        self.status_code:int = status_code
+        self.details = details
+
+
+class AuthenticationError(RoomOSError):
+    """The device refused the credentials"""
+
+
+class TransportError(RoomOSError):
+    """No usable answer from the device: connection failure, timeout, open circuit breaker or an HTTP error status"""
+
+
+class ConfigurationError(RoomOSError):
+    """A configuration write was refused by the device"""
+
+
+class CommandError(RoomOSError):
+    """A command was answered with status Error"""
+
+
+def _http_error(status_code : int):
+    """Typed error of an answer that is not HTTP 200"""
+    if status_code == 401:
+        return AuthenticationError("Authorisation Failed , Please check Credentials\n", status_code)
+    elif status_code == 400:
+        return TransportError("Connection Failed , Please check Connection\n", status_code)
+    return TransportError(f"Error: {status_code}", status_code)
+
+
+# xml.sax.saxutils would pull in urllib.request, http.client and email at import
+def _xml_escape(data : str):
+    return data.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _xml_unescape(data : str):
+    return data.replace("&lt;", "<").replace("&gt;", ">").replace("&amp;", "&")
+
+
+def _quoteattr(data : str):
+    data = _xml_escape(data).replace("\n", "&#10;").replace("\r", "&#13;").replace("\t", "&#9;")
+    if '"' not in data:
+        return f'"{data}"'
+    if "'" not in data:
+        return f"'{data}'"
+    return '"' + data.replace('"', "&quot;") + '"'
+
+
+@lru_cache(maxsize=1)
+def _resuming_ssl_context_class():
+    """_ResumingSSLContext, defined on first use since it derives from ssl.SSLContext"""
+    import ssl
+    
+    class _ResumingSSLSocket(ssl.SSLSocket):
+        """Hands its TLS session back to the context when closed, TLS 1.3 tickets only arrive after the handshake"""
+        
+        def _real_close(self):
+            try:
+                self.context._remember_session(self.server_hostname, self)
+            except Exception:
+                pass
+            super()._real_close()
+    
+    class _ResumingSSLContext(ssl.SSLContext):
+        """SSLContext that offers the last TLS session of a host when it opens a new connection to it,
+        so pooled and re-opened connections resume instead of doing a full handshake"""
+        sslsocket_class = _ResumingSSLSocket
+        
+        def __init__(self, protocol : int = ssl.PROTOCOL_TLS_CLIENT):
+            self._tls_sessions = {}
+            self._tls_lock = threading.Lock()
+            self.handshakes:int = 0
+            self.resumed:int = 0
+        
+        def _remember_session(self, host : str, sslsock : ssl.SSLSocket):
+            session = sslsock.session
+            if session is not None and (session.has_ticket or sslsock.version() != "TLSv1.3"):
+                with self._tls_lock:
+                    self._tls_sessions[host] = session
+        
+        def wrap_socket(self, sock, *args, server_hostname : str = None, session = None, **kwargs):
+            if session is None:
+                with self._tls_lock:
+                    session = self._tls_sessions.get(server_hostname)
+            sslsock = super().wrap_socket(sock, *args, server_hostname=server_hostname, session=session, **kwargs)
+            with self._tls_lock:
+                self.handshakes += 1
+                if sslsock.session_reused:
+                    self.resumed += 1
+            self._remember_session(server_hostname, sslsock)
+            return sslsock
+    
+    return _ResumingSSLContext
+
+
+_ssl_contexts = {}
+_ssl_contexts_lock = threading.Lock()
+# ssl.TLSVersion member of each accepted minimum TLS version
+_TLS_VERSIONS = {"TLSv1.1": "TLSv1_1", "TLSv1.2": "TLSv1_2", "TLSv1.3": "TLSv1_3"}
+
+def _shared_ssl_context(verify, min_tls : str = "TLSv1.2"):
+    """One preconfigured SSL context per (verify, minimum TLS version), shared by every client in the process.
+    verify is False to skip certificate checks, True for the system CA store or the path of a CA bundle or directory"""
+    import ssl
+    key = (verify, min_tls)
+    with _ssl_contexts_lock:
+        context = _ssl_contexts.get(key)
+        if context is None:
+            if min_tls not in _TLS_VERSIONS:
+                raise Exception("Unidentified TLS version requested, please choose TLSv1.1, TLSv1.2 or TLSv1.3")
+            context = _resuming_ssl_context_class()(ssl.PROTOCOL_TLS_CLIENT)
+            context.minimum_version = ssl.TLSVersion[_TLS_VERSIONS[min_tls]]
+            if verify is False:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+            elif isinstance(verify, str):
+                if os.path.isdir(verify):
+                    context.load_verify_locations(capath=verify)
+                else:
+                    context.load_verify_locations(cafile=verify)
+            else:
+                context.load_default_certs()
+            _ssl_contexts[key] = context
+        return context
+
+
+# seconds spent resolving host names by the current thread, read around a request to time its resolution
+_resolution_time = threading.local()
+
+def _resolution_seconds():
+    return getattr(_resolution_time, "seconds", 0.0)
+
+
+class _DNSCache:
+    """Addresses of device host names shared by every client, each entry is kept for the ttl it was resolved with"""
+    
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def lookup(host : str, port : int):
+        import socket
+        addresses = []
+        for family, _, _, _, sockaddr in socket.getaddrinfo(host, port, type=socket.SOCK_STREAM):
+            if sockaddr[0] not in addresses:
+                addresses.append(sockaddr[0])
+        return addresses
+    
+    def resolve(self, host : str, port : int, ttl : float):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(host)
+        if entry is not None and entry[1] > now:
+            return entry[0]
+        addresses = self.lookup(host, port)
+        with self._lock:
+            self._entries[host] = (addresses, now + ttl)
+        return addresses
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_dns_cache = _DNSCache()
+
+
+def _is_ip(host : str):
+    try:
+        ipaddress.ip_address(host)
+        return True
+    except ValueError:
+        return False
+
+
+class _ResolvingConnection:
+    """Mixin for urllib3 connections that resolves the host name itself, through the shared cache when dns_ttl is set,
+    times the lookup and connects to the addresses in turn. TLS still checks the certificate against the host name"""
+    dns_ttl = None
+    
+    def _new_conn(self):
+        import socket
+        import urllib3
+        host = self._dns_host
+        if _is_ip(host.strip("[]")):
+            return super()._new_conn()
+        started = time.perf_counter()
+        try:
+            if self.dns_ttl:
+                addresses = _dns_cache.resolve(host, self.port, self.dns_ttl)
+            else:
+                addresses = _DNSCache.lookup(host, self.port)
+        except socket.gaierror as e:
+            raise urllib3.exceptions.NewConnectionError(self, f"Failed to resolve {host}: {e}") from e
+        finally:
+            _resolution_time.seconds = _resolution_seconds() + time.perf_counter() - started
+        error = None
+        for address in addresses:
+            self._dns_host = address
+            try:
+                return super()._new_conn()
+            except (urllib3.exceptions.NewConnectionError, urllib3.exceptions.ConnectTimeoutError) as e:
+                error = e
+            finally:
+                self._dns_host = host
+        raise error
+
+
+@lru_cache(maxsize=None)
+def _resolving_pool_classes(dns_ttl : float):
+    """urllib3 pool classes whose connections resolve through _ResolvingConnection with dns_ttl, shared by every adapter with that ttl"""
+    import urllib3
+    pools = {}
+    for scheme, pool_class in (("http", urllib3.HTTPConnectionPool), ("https", urllib3.HTTPSConnectionPool)):
+        connection_class = type(f"Resolving{pool_class.ConnectionCls.__name__}", (_ResolvingConnection, pool_class.ConnectionCls), {"dns_ttl": dns_ttl})
+        pools[scheme] = type(f"Resolving{pool_class.__name__}", (pool_class,), {"ConnectionCls": connection_class})
+    return pools
+
+
+@lru_cache(maxsize=1)
+def _tls_adapter_class():
+    """_TLSAdapter, defined on first use since it derives from the HTTPAdapter of requests"""
+    from requests.adapters import HTTPAdapter
+    
+    class _TLSAdapter(HTTPAdapter):
+        """HTTPAdapter whose HTTPS pools use a shared SSL context and whose connections time their name resolution,
+        caching it for dns_ttl seconds when set"""
+        
+        def __init__(self, ssl_context, dns_ttl : float = None, **kwargs):
+            self._ssl_context = ssl_context
+            self._dns_ttl = dns_ttl
+            super().__init__(**kwargs)
+        
+        def init_poolmanager(self, *args, **kwargs):
+            kwargs["ssl_context"] = self._ssl_context
+            super().init_poolmanager(*args, **kwargs)
+            self.poolmanager.pool_classes_by_scheme = _resolving_pool_classes(self._dns_ttl)
+        
+        def build_connection_pool_key_attributes(self, request, verify, cert=None):
+            host_params, pool_kwargs = super().build_connection_pool_key_attributes(request, verify, cert)
+            # the CA bundle is already loaded in the shared context, do not reload it for every connection
+            pool_kwargs.pop("ca_certs", None)
+            pool_kwargs.pop("ca_cert_dir", None)
+            return host_params, pool_kwargs
+    
+    return _TLSAdapter
+
+
+class _CircuitBreaker:
+    """Fails fast for a cooldown once a device had threshold consecutive transport failures"""
+    
+    def __init__(self, threshold : int, cooldown : float):
+        self.threshold:int = threshold
+        self.cooldown:float = cooldown
+        self.failures:int = 0
+        self.opened_at:float = None
+        self._lock = threading.Lock()
+    
+    def check(self, address : str):
+        with self._lock:
+            if self.opened_at is None:
+                return
+            remaining = self.opened_at + self.cooldown - time.monotonic()
+            if remaining > 0:
+                raise TransportError(f"Connection Failed , {address} is failing, retry in {remaining:.0f} seconds\n")
+            # half open: let requests through again, the next failure opens the circuit right away
+            self.opened_at = None
+            self.failures = self.threshold - 1
+    
+    def record(self, ok : bool):
+        with self._lock:
+            if ok:
+                self.failures = 0
+                self.opened_at = None
+            else:
+                self.failures += 1
+                if self.failures >= self.threshold:
+                    self.opened_at = time.monotonic()
+
+
+class _XAPIResponse:
+    """Status code and XML text of a request answered by a transport other than HTTP, so the response ladders apply unchanged"""
+    
+    def __init__(self, status_code : int, text : str = "", parsed = None):
+        self.status_code:int = status_code
+        self.text:str = text
+        # the xAPI value the text was rendered from, when there is one
+        self.parsed = parsed
+    
+    @property
+    def content(self):
+        return self.text.encode()
+    
+    def iter_content(self, chunk_size : int = 1):
+        content = self.content
+        for start in range(0, len(content), chunk_size):
+            yield content[start:start + chunk_size]
+    
+    def close(self):
+        pass
+
+
+def _xapi_path(location : str):
+    """getxml location to a JSON-RPC path, item numbers become integers: /Status/Call/3/Duration -> ["Status", "Call", 3, "Duration"]"""
+    return [int(part) if part.isdigit() else part for part in location.strip("/").split("/") if part]
+
+
+def _to_xml(name : str, value, item = None):
+    """Render a JSON-RPC xAPI value as the XML element getxml returns for it, list entries carry their id as item attribute"""
+    if isinstance(value, list):
+        return "".join(_to_xml(name, entry, entry.get("id") if isinstance(entry, dict) else None) for entry in value)
+    attribute = f' item="{item}"' if item is not None else ""
+    if isinstance(value, dict):
+        children = "".join(_to_xml(key, child) for key, child in value.items() if key != "id")
+        return f"<{name}{attribute}>{children}</{name}>"
+    if value is None:
+        return f"<{name}{attribute}/>"
+    if isinstance(value, bool):
+        value = "True" if value else "False"
+    return f"<{name}{attribute}>{_xml_escape(str(value))}</{name}>"
+
+
+def _wrap_xml(path : list, value):
+    """XML document of a getxml request for path answered with value"""
+    names = []
+    for part in path:
+        if isinstance(part, int):
+            names[-1] = (names[-1][0], part)
+        else:
+            names.append((part, None))
+    name, item = names[-1]
+    body = _to_xml(name, value, item)
+    for name, item in reversed(names[:-1]):
+        attribute = f' item="{item}"' if item is not None else ""
+        body = f"<{name}{attribute}>{body}</{name}>"
+    return f'<?xml version="1.0"?>\n{body}'
+
+
+def _config_leaves(root):
+    """(path, value) of every value in a putxml Configuration document"""
+    leaves = []
+    def walk(element, path):
+        children = list(element)
+        if not children:
+            leaves.append((path, element.text or ""))
+        for child in children:
+            child_path = path + [child.tag]
+            if child.get("item"):
+                child_path.append(int(child.get("item")))
+            walk(child, child_path)
+    walk(root, [root.tag])
+    return leaves
+
+
+def _payload_leaves(payload : bytes):
+    """(path below Configuration, value) of every value a putxml Configuration document sets"""
+    return [(tuple(path[1:]), value) for path, value in _config_leaves(ET.fromstring(payload))]
+
+
+def _command_call(root):
+    """Command path and arguments of a putxml Command document. The path descends through single elements
+    that have children or no value, the values below the last one are the arguments"""
+    path, node = [], root
+    while True:
+        children = list(node)
+        if len(children) == 1 and (len(children[0]) or not (children[0].text or "").strip()):
+            node = children[0]
+            path.append(node.tag)
+        else:
+            break
+    params = {}
+    for child in children:
+        value = child.text or ""
+        if child.tag in params:
+            if not isinstance(params[child.tag], list):
+                params[child.tag] = [params[child.tag]]
+            params[child.tag].append(value)
+        else:
+            params[child.tag] = value
+    return path, params
+
+
+
+@lru_cache(maxsize=1024)
+def _path_parts(path):
+    """xAPI path as a tuple, item numbers become integers: "Call/3/Duration", "Call 3 Duration" and ("Call", "3", "Duration") give ("Call", 3, "Duration")"""
+    if isinstance(path, str):
+        path = path.replace("/", " ").split()
+    return tuple(int(part) if isinstance(part, str) and part.isdigit() else part for part in path)
+
+
+def _elements(parts : tuple):
+    """(tag, item) pairs of a path, an integer is the item of the element before it"""
+    elements = []
+    for part in parts:
+        if isinstance(part, int):
+            elements[-1] = (elements[-1][0], part)
+        else:
+            elements.append((part, None))
+    return elements
+
+
+@lru_cache(maxsize=1024)
+def _getxml_location(parts : tuple):
+    return "/getxml?location=/" + "/".join(str(part) for part in parts)
+
+
+@lru_cache(maxsize=1024)
+def _compile_payload(parts : tuple, names : tuple):
+    """putxml template of the document setting the leaves names below the path parts (whose first part is the root, Configuration or Command).
+    A name is a tuple of parts relative to the path, () being the path itself; without names the path is written as empty elements.
+    The template is a tuple of byte strings and (value index, opening tag, closing tag) slots, consumed by _render_payload"""
+    def open_tag(tag, item):
+        return f'<{tag} item="{item}">' if item is not None else f"<{tag}>"
+    tree = {}
+    for index, name in enumerate(names):
+        node = tree
+        for element in _elements(name)[:-1]:
+            node = node.setdefault(element, {})
+        if name:
+            node[_elements(name)[-1]] = index
+        else:
+            tree = index
+    elements = _elements(parts)
+    leaf = elements.pop() if isinstance(tree, int) else None
+    segments = [open_tag(tag, item) for tag, item in elements]
+    closing = [f"</{tag}>" for tag, _ in reversed(elements)]
+    def emit(node):
+        for (tag, item), child in node.items():
+            if isinstance(child, int):
+                segments.append((child, open_tag(tag, item).encode(), f"</{tag}>".encode()))
+            else:
+                segments.append(open_tag(tag, item))
+                emit(child)
+                segments.append(f"</{tag}>")
+    if leaf is not None:
+        segments.append((tree, open_tag(*leaf).encode(), f"</{leaf[0]}>".encode()))
+    else:
+        emit(tree)
+    segments.extend(closing)
+    template = []
+    for segment in segments:
+        if isinstance(segment, str):
+            if template and isinstance(template[-1], bytes):
+                template[-1] += segment.encode()
+            else:
+                template.append(segment.encode())
+        else:
+            template.append(segment)
+    return tuple(template)
+
+
+def _render_payload(template : tuple, values : tuple):
+    """putxml document of a compiled template, values are escaped and a list value repeats its element"""
+    out = []
+    for segment in template:
+        if isinstance(segment, bytes):
+            out.append(segment)
+            continue
+        index, start, end = segment
+        value = values[index]
+        for entry in (value if isinstance(value, list) else (value,)):
+            out.extend((start, _xml_escape(str(entry)).encode(), end))
+    return b"".join(out)
+
+
+def _config_xml(path, value):
+    """putxml document setting the configuration path to value, a dict value sets several leaves below path"""
+    parts = _path_parts(tuple(path) if isinstance(path, list) else path)
+    if parts[:1] != ("Configuration",):
+        parts = ("Configuration",) + parts
+    if isinstance(value, dict):
+        names = tuple(_path_parts(name) for name in value)
+        return _render_payload(_compile_payload(parts, names), tuple(value.values()))
+    return _render_payload(_compile_payload(parts, ((),)), (value,))
+
+
+def _command_xml(path, args : dict = None):
+    """putxml document running the command path with args, arguments that are None are left out"""
+    parts = _path_parts(tuple(path) if isinstance(path, list) else path)
+    if parts[:1] != ("Command",):
+        parts = ("Command",) + parts
+    args = {name: value for name, value in (args or {}).items() if value is not None}
+    return _render_payload(_compile_payload(parts, tuple((name,) for name in args)), tuple(args.values()))
+
+class _WebSocketTransport:
+    """xAPI over the JSON-RPC WebSocket of the device (/ws) instead of getxml/putxml.
+    One socket is shared by every thread using the client, requests are multiplexed by their id and the answers
+    are handed out by a reader thread. Requests are translated from the URLs and payloads of Cisco_RoomOS and the
+    answers rendered back to the XML the codec would have returned, so every method works unchanged"""
+    
+    def __init__(self, codec):
+        secure = codec.scheme == "https"
+        self.url:str = f"{'wss' if secure else 'ws'}://{codec.address}/ws"
+        import base64
+        self._credentials = base64.b64encode(f"{codec.username}:{codec.password}".encode()).decode()
+        self._ssl_context = _shared_ssl_context(codec.ssl_verify, codec.min_tls) if secure else None
+        self._socket = None
+        self._pending = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+    
+    def close(self):
+        with self._lock:
+            socket, self._socket = self._socket, None
+        if socket is not None:
+            socket.close()
+    
+    def _connect(self, timeout : float):
+        """Returns the open socket, or the HTTP status the device refused the upgrade with"""
+        with self._lock:
+            if self._socket is not None:
+                return self._socket
+            try:
+                from websockets.sync.client import connect
+                from websockets.exceptions import InvalidStatus
+            except ImportError:
+                raise ImportError("The websocket transport requires websockets, install it with pip install websockets")
+            options = {"ssl": self._ssl_context} if self._ssl_context is not None else {}
+            try:
+                socket = connect(self.url, additional_headers={"Authorization": f"Basic {self._credentials}"},
+                                 open_timeout=timeout, max_size=None, **options)
+            except InvalidStatus as e:
+                return e.response.status_code
+            except Exception as e:
+                import requests
+                raise requests.exceptions.ConnectionError(f"WebSocket connection to {self.url} failed: {e}")
+            self._socket = socket
+            threading.Thread(target=self._read, args=(socket,), daemon=True).start()
+            return socket
+    
+    def _read(self, socket):
+        import json
+        try:
+            for message in socket:
+                reply = json.loads(message)
+                # feedback notifications carry no id
+                future = self._pending.pop(reply.get("id"), None)
+                if future is not None:
+                    future.set_result(reply)
+        except Exception:
+            pass
+        with self._lock:
+            if self._socket is socket:
+                self._socket = None
+            pending, self._pending = self._pending, {}
+        import requests
+        for future in pending.values():
+            future.set_exception(requests.exceptions.ConnectionError(f"WebSocket connection to {self.url} closed"))
+    
+    def _call(self, socket, method : str, params : dict):
+        import json
+        from concurrent.futures import Future
+        future = Future()
+        request_id = next(self._ids)
+        with self._lock:
+            # once the reader gave up on the socket nobody would answer the request, fail now instead of at the timeout
+            if self._socket is not socket:
+                import requests
+                raise requests.exceptions.ConnectionError(f"WebSocket connection to {self.url} closed")
+            self._pending[request_id] = future
+        try:
+            with self._send_lock:
+                socket.send(json.dumps({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}))
+        except Exception as e:
+            import requests
+            self._pending.pop(request_id, None)
+            raise requests.exceptions.ConnectionError(f"WebSocket connection to {self.url} failed: {e}")
+        future.request_id = request_id
+        return future
+    
+    def _result(self, future, timeout : float):
+        from concurrent.futures import TimeoutError as FutureTimeoutError
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            import requests
+            self._pending.pop(future.request_id, None)
+            raise requests.exceptions.ReadTimeout(f"No answer from {self.url} in {timeout} seconds")
+    
+    def send(self, method : str, url : str, data = None, timeout = None, **kwargs):
+        """Answer the HTTP request method url with body data over the socket"""
+        connect_timeout, read_timeout = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        socket = self._connect(connect_timeout)
+        if isinstance(socket, int):
+            return _XAPIResponse(socket)
+        parts = urlsplit(url)
+        if method == "HEAD":
+            return _XAPIResponse(200)
+        if method == "GET":
+            if parts.path in ("/status.xml", "/configuration.xml"):
+                path = [parts.path[1:-len(".xml")].capitalize()]
+            elif parts.path == "/getxml":
+                path = _xapi_path(parse_qs(parts.query).get("location", [""])[0])
+            else:
+                return _XAPIResponse(404)
+            if not path:
+                return _XAPIResponse(400)
+            reply = self._result(self._call(socket, "xGet", {"Path": path}), read_timeout)
+            # like getxml, a path that does not exist on the device gives an empty document
+            value = reply.get("result")
+            return _XAPIResponse(200, _wrap_xml(path if "error" not in reply else path[:1], value), value)
+        if method == "POST" and parts.path == "/putxml":
+            try:
+                root = ET.fromstring(data)
+            except ET.ParseError:
+                return _XAPIResponse(400)
+            if root.tag == "Configuration":
+                return self._configure(socket, root, read_timeout)
+            if root.tag == "Command":
+                return self._command(socket, root, read_timeout)
+            return _XAPIResponse(400)
+        return _XAPIResponse(404)
+    
+    def _configure(self, socket, root, timeout : float):
+        # every value of the document goes out before waiting for the first answer
+        calls = [(path, self._call(socket, "xSet", {"Path": path, "Value": value})) for path, value in _config_leaves(root)]
+        errors = ""
+        for path, future in calls:
+            reply = self._result(future, timeout)
+            if "error" in reply:
+                xpath = "/".join(str(part) for part in path)
+                errors += f"<Error><Details>{_xml_escape(reply['error'].get('message', 'Error'))}</Details><XPath>/{xpath}</XPath></Error>"
+        return _XAPIResponse(200, f'<?xml version="1.0"?>\n<Configuration>{errors or "<Success/>"}</Configuration>')
+    
+    def _command(self, socket, root, timeout : float):
+        path, params = _command_call(root)
+        if not path:
+            return _XAPIResponse(400)
+        reply = self._result(self._call(socket, "xCommand/" + "/".join(path), params), timeout)
+        name = "".join(path[-2:]) + "Result"
+        if "error" in reply:
+            error = reply["error"]
+            reason = (error.get("data") or {}).get("Reason") or error.get("message", "Error")
+            body = f'<{name} status="Error"><Reason>{_xml_escape(str(reason))}</Reason></{name}>'
+            return _XAPIResponse(200, f'<?xml version="1.0"?>\n<Command>{body}</Command>', reply)
+        result = reply.get("result")
+        children = "".join(_to_xml(key, value) for key, value in result.items()) if isinstance(result, dict) else ""
+        return _XAPIResponse(200, f'<?xml version="1.0"?>\n<Command><{name} status="OK">{children}</{name}></Command>', result)
+
+
+def _render_location(element, parts : list):
+    """Elements matching the location parts below element, wrapped in their ancestors the way getxml returns them"""
+    name, rest = parts[0], parts[1:]
+    item = None
+    if rest and isinstance(rest[0], int):
+        item, rest = str(rest[0]), rest[1:]
+    body = ""
+    for child in element:
+        if child.tag != name or (item is not None and child.get("item") != item):
+            continue
+        if not rest:
+            tail, child.tail = child.tail, None
+            body += ET.tostring(child, encoding="unicode")
+            child.tail = tail
+            continue
+        inner = _render_location(child, rest)
+        if inner:
+            attributes = "".join(f" {key}={_quoteattr(value)}" for key, value in child.attrib.items())
+            body += f"<{child.tag}{attributes}>{inner}</{child.tag}>"
+    return body
+
+
+class _StatusSnapshot:
+    """One status.xml document answering the getxml status requests of a client for ttl seconds"""
+    ROOT = "Status"
+    
+    def __init__(self, ttl : float):
+        self.ttl:float = ttl
+        self.document:bytes = None
+        self.root = None
+        self.fetched_at:float = None
+        self.lock = threading.Lock()
+        # asyncio.Lock of the async client, created on its first fetch so that it binds to the running event loop
+        self.async_lock = None
+        self._index = None
+    
+    @classmethod
+    def location(cls, url : str):
+        """Path of a getxml status url, None for the urls a snapshot cannot answer"""
+        parts = urlsplit(url)
+        if parts.path != "/getxml":
+            return None
+        path = _xapi_path(parse_qs(parts.query).get("location", [""])[0])
+        if not path or path[0] != cls.ROOT:
+            return None
+        return path
+    
+    def stale(self):
+        return self.root is None or time.monotonic() - self.fetched_at > self.ttl
+    
+    def load(self, document : bytes):
+        self.root = ET.fromstring(document)
+        self.document = document
+        self.fetched_at = time.monotonic()
+        self._index = None
+    
+    def index(self, parse):
+        """StatusIndex of the current document, built once per fetch"""
+        if self._index is None:
+            self._index = StatusIndex(parse(self.document))
+        return self._index
+    
+    def render(self, path : list):
+        """XML getxml would have returned for path"""
+        if len(path) == 1:
+            return self.document
+        return f'<?xml version="1.0"?>\n<{self.ROOT}>{_render_location(self.root, path[1:])}</{self.ROOT}>'
+
+
+class _ConfigCache(_StatusSnapshot):
+    """configuration.xml answering the configuration reads of a client for ttl seconds, updated in place by its successful writes"""
+    ROOT = "Configuration"
+    
+    def invalidate(self):
+        self.root = None
+        self.document = None
+    
+    def update(self, leaves : list):
+        """Set the values written, paths below Configuration, in the document. A path it does not hold drops the document"""
+        if self.root is None:
+            return
+        for path, value in leaves:
+            element = self._element(path)
+            if element is None or len(element):
+                return self.invalidate()
+            element.text = str(value)
+        # serialised again on the next read of the whole document
+        self.document = None
+    
+    def value(self, path : tuple):
+        """Text of the value at path below Configuration, None when the document does not hold it"""
+        element = self._element(path)
+        return None if element is None or len(element) else element.text or ""
+    
+    def _element(self, path : tuple):
+        element = self.root
+        for tag, item in _elements(path):
+            element = next((child for child in element if child.tag == tag and (item is None or child.get("item") == str(item))), None)
+            if element is None:
+                return None
+        return element
+    
+    def render(self, path : list):
+        if self.document is None:
+            self.document = b'<?xml version="1.0"?>\n' + ET.tostring(self.root, encoding="unicode").encode()
+        return super().render(path)
+
+
+def _configuration_error(root):
+    """The Error element of a refused configuration write, None when it was accepted. root is the parsed Configuration
+    element of the putxml answer. The one rule for the eager, lazy and cached paths: an Error without a Success is a refusal"""
+    if not isinstance(root, dict) or "Error" not in root or "Success" in root:
+        return None
+    return root["Error"][0] if isinstance(root["Error"], list) else root["Error"]
+
+
+def _config_written(result):
+    """Whether the answer of a configuration write says the values were set"""
+    if isinstance(result, LazyResult):
+        return result.ok
+    return isinstance(result, dict) and _configuration_error(result.get("Configuration")) is None
+
+
+class XMLDict(dict):
+    """Element with child elements as returned by the fast parser, repeated children are lists.
+    The XML attributes of the element are in xml_attrs"""
+    xml_attrs = {}
+
+
+class XMLText(str):
+    """Text of an element that has XML attributes, as returned by the fast parser. The attributes are in xml_attrs"""
+    xml_attrs = {}
+
+
+def _parse_fast(document):
+    """expat based parser giving the structure jxmlease.parse gives with plain dicts, lists and strings:
+    an element with children is a dict of tag to value, repeated tags a list, any other element its stripped text.
+    document is the text or bytes of the document, or an iterable of byte chunks parsed as they arrive"""
+    root = XMLDict()
+    stack = []
+    
+    def start(tag, attrs):
+        stack.append((tag, attrs, {}, []))
+    
+    def end(_):
+        tag, attrs, children, text = stack.pop()
+        if children:
+            value = XMLDict(children)
+        else:
+            value = "".join(text).strip()
+            if attrs:
+                value = XMLText(value)
+        if attrs:
+            value.xml_attrs = attrs
+        parent = stack[-1][2] if stack else root
+        if tag in parent:
+            existing = parent[tag]
+            if type(existing) is list:
+                existing.append(value)
+            else:
+                parent[tag] = [existing, value]
+        else:
+            parent[tag] = value
+    
+    def data(text):
+        stack[-1][3].append(text)
+    
+    parser = expat.ParserCreate()
+    parser.buffer_text = True
+    parser.StartElementHandler = start
+    parser.EndElementHandler = end
+    parser.CharacterDataHandler = data
+    if isinstance(document, (bytes, str)):
+        parser.Parse(document, True)
+    else:
+        for chunk in document:
+            parser.Parse(chunk, False)
+        parser.Parse(b"", True)
+    return root
+
+
+def _parse_jxmlease(document):
+    import jxmlease
+    if not isinstance(document, (bytes, str)):
+        document = b"".join(document)
+    return jxmlease.parse(document)
+
+
+_PARSERS = {"fast": _parse_fast, "jxmlease": _parse_jxmlease}
+
+
+class LazyResult(Mapping):
+    """Answer of the device kept as raw bytes with its HTTP status, parsed on the first item access.
+    ok and error only scan the bytes, so callers that check the outcome never pay for a parse.
+    kind is status, configuration or command, it decides what ok means"""
+    
+    def __init__(self, kind : str, status_code : int, raw : bytes, parse):
+        self.kind:str = kind
+        self.status_code:int = status_code
+        self.raw:bytes = raw
+        self._parse = parse
+        self._parsed = None
+    
+    @property
+    def parsed(self):
+        if self._parsed is None:
+            self._parsed = self._parse(self.raw) if self.raw else {}
+        return self._parsed
+    
+    @property
+    def ok(self):
+        if self.status_code != 200:
+            return False
+        if self.kind == "configuration":
+            # only an answer carrying an Error is parsed to apply the rule of _configuration_error
+            return b"<Error" not in self.raw or _configuration_error(self.parsed.get("Configuration")) is None
+        if self.kind == "command":
+            return b'status="OK"' in self.raw
+        return True
+    
+    @property
+    def exception(self):
+        """None when ok, else the typed error the eager result would raise"""
+        if self.ok:
+            return None
+        if self.status_code != 200:
+            return _http_error(self.status_code)
+        error = ConfigurationError if self.kind == "configuration" else CommandError
+        tag = b"Details" if self.kind == "configuration" else b"Reason"
+        start = self.raw.find(b"<" + tag + b">")
+        if start == -1:
+            return error("Error", self.status_code)
+        start += len(tag) + 2
+        end = self.raw.find(b"</" + tag + b">", start)
+        return error("Error: " + _xml_unescape(self.raw[start:end].decode("utf-8", "replace")), self.status_code)
+    
+    @property
+    def error(self):
+        """None when ok, else the message the eager result would carry"""
+        exception = self.exception
+        return None if exception is None else str(exception)
+    
+    def __getitem__(self, key):
+        return self.parsed[key]
+    
+    def __iter__(self):
+        return iter(self.parsed)
+    
+    def __len__(self):
+        return len(self.parsed)
+    
+    def __repr__(self):
+        return repr(self.parsed)
+
+
+class PendingWrite:
+    """Outcome of a set_* call made inside codec.transaction(), settled once the transaction is sent.
+    ok, error and exception read as those of LazyResult for the values of this call only,
+    result is the parsed answer of the putxml request that carried them"""
+    
+    def __init__(self, leaves : list, size : int, output_debug : bool):
+        self.leaves:list = leaves
+        self.size:int = size
+        self.output_debug:bool = output_debug
+        self.done:bool = False
+        self.result = None
+        self.exception = None
+    
+    @property
+    def paths(self):
+        """Configuration paths written by the call"""
+        return ["/".join(str(part) for part in path) for path, _ in self.leaves]
+    
+    @property
+    def ok(self):
+        return self.done and self.exception is None
+    
+    @property
+    def error(self):
+        return None if self.exception is None else str(self.exception)
+    
+    def __repr__(self):
+        state = "pending" if not self.done else "ok" if self.exception is None else repr(self.exception)
+        return f"PendingWrite({', '.join(self.paths)}: {state})"
+
+
+class ConfigTransaction:
+    """Configuration writes collected by codec.transaction(), sent merged into as few putxml documents as max_bytes allows.
+    A later write of the same value wins, a call is never split across documents"""
+    
+    def __init__(self, max_bytes : int):
+        self.max_bytes:int = max_bytes
+        self.writes:list = []
+        self.requests:int = 0
+        self.lock = threading.Lock()
+    
+    @property
+    def failed(self):
+        """Settled writes that did not succeed"""
+        return [write for write in self.writes if write.done and write.exception is not None]
+    
+    def add(self, payloads : list, output_debug : bool = False, skipped : bool = False):
+        """Record the putxml documents of one set_* call, returns its PendingWrite. A skipped write is settled at once and never sent"""
+        leaves = [leaf for payload in payloads for leaf in _payload_leaves(payload)]
+        write = PendingWrite(leaves, sum(len(payload) for payload in payloads), output_debug)
+        if skipped:
+            write.done = True
+            return write
+        with self.lock:
+            self.writes.append(write)
+        return write
+    
+    def chunks(self):
+        """(putxml document, writes it carries) of every request to send, in the order of the calls"""
+        chunk, size = [], 0
+        for write in self.writes:
+            if chunk and size + write.size > self.max_bytes:
+                yield self._document(chunk), chunk
+                chunk, size = [], 0
+            chunk.append(write)
+            size += write.size
+        if chunk:
+            yield self._document(chunk), chunk
+    
+    @staticmethod
+    def _document(writes : list):
+        leaves = {}
+        for write in writes:
+            leaves.update(write.leaves)
+        return _config_xml(("Configuration",), leaves)
+    
+    def settle(self, writes : list, parsed = None, exception : Exception = None):
+        """Give each write of one request its outcome: the error whose XPath names one of its values, else success.
+        An error naming no value of the request, a failed request or an HTTP error fails every write it carried"""
+        self.requests += 1
+        errors = {}
+        root = parsed.get("Configuration") if parsed is not None else None
+        found = root.get("Error", []) if isinstance(root, dict) else []
+        for error in (found if isinstance(found, list) else [found]):
+            # /Configuration/NetworkServices/NTP/Server[1]/Address and .../Server/1/Address name the same value
+            xpath = _path_parts(str(error.get("XPath", "")).replace("[", "/").replace("]", ""))
+            errors[xpath[1:] if xpath[:1] == ("Configuration",) else xpath] = ConfigurationError(f"Error: {error.get('Details')}", 200, error)
+        written = {path for write in writes for path, _ in write.leaves}
+        unmatched = next((error for path, error in errors.items() if path not in written), None)
+        for write in writes:
+            write.done = True
+            write.result = parsed
+            write.exception = exception or next((errors[path] for path, _ in write.leaves if path in errors), unmatched)
+            if write.output_debug:
+                print(write.result if write.exception is None else write.exception)
+
+
+class ConfigChange(namedtuple("ConfigChange", ("path", "current", "desired", "error"), defaults=(None,))):
+    """One value written by apply_desired_config: current is None when configuration.xml has no such value, error is None once written"""
+    __slots__ = ()
+
+
+class ConfigReport(namedtuple("ConfigReport", ("changed", "failed", "unchanged", "requests"))):
+    """Outcome of apply_desired_config: the ConfigChange of every value written and of every write that failed,
+    the paths already at their desired value and the putxml requests sent"""
+    __slots__ = ()
+    
+    @property
+    def ok(self):
+        return not self.failed
+
+
+def _desired_leaves(spec : dict, prefix : tuple = ()):
+    """{path parts below Configuration: value} of a desired configuration, a dict value holds the paths below its key"""
+    leaves = {}
+    for path, value in spec.items():
+        parts = prefix + _path_parts(tuple(path) if isinstance(path, list) else path)
+        if parts[:1] == ("Configuration",):
+            parts = parts[1:]
+        if isinstance(value, dict):
+            leaves.update(_desired_leaves(value, parts))
+        else:
+            leaves[parts] = value
+    return leaves
+
+
+def _index_key(parts : tuple):
+    """StatusIndex form of a configuration path: ("NetworkServices", "NTP", "Server", 1, "Address") -> Configuration/NetworkServices/NTP/Server[1]/Address"""
+    return "/".join(["Configuration"] + [f"{tag}[{item}]" if item is not None else tag for tag, item in _elements(parts)])
+
+
+def _desired_changes(desired : dict, matches : list):
+    """ConfigChange of every desired value that differs from the (index key, value) matches read from configuration.xml,
+    and the paths already at their desired value. Values compare as text"""
+    current = {}
+    for key, value in matches:
+        for parts in desired:
+            if parts not in current and _index_pattern(_index_key(parts)).fullmatch(key):
+                current[parts] = value
+                break
+    changes, unchanged = [], []
+    for parts, value in desired.items():
+        path = "/".join(str(part) for part in parts)
+        if current.get(parts) == str(value):
+            unchanged.append(path)
+        else:
+            changes.append(ConfigChange(path, current.get(parts), str(value)))
+    return changes, unchanged
+
+
+_NO_CONFIG_CACHE = "No configuration cache, create the object with config_cache=<seconds> or skip_unchanged=True\n"
+_IN_TRANSACTION = "apply_desired_config can not run inside codec.transaction(), call it outside the block or with dry_run=True\n"
+
+
+def _config_report(changes : list, unchanged : list, writes : list = None, requests : int = 0):
+    """ConfigReport of changes, settled with the PendingWrite of each when they were written"""
+    if writes:
+        changes = [change._replace(error=write.exception) for change, write in zip(changes, writes)]
+    return ConfigReport([change for change in changes if change.error is None], [change for change in changes if change.error is not None],
+                        unchanged, requests)
+
+
+@lru_cache(maxsize=256)
+def _index_pattern(pattern : str):
+    """Regular expression matching the StatusIndex paths of a query pattern.
+    Name[*] or a bare Name matches every instance of Name, Name[3] only the third, * any one element"""
+    segments = []
+    for segment in StatusIndex.normalize(pattern).split("/"):
+        if segment == "*":
+            segments.append(r"[^/]+")
+            continue
+        name, _, item = segment.partition("[")
+        if item and item != "*]":
+            segments.append(re.escape(segment))
+        else:
+            segments.append(re.escape(name) + r"(?:\[[^\]]*\])?")
+    return re.compile("/".join(segments))
+
+
+class StatusIndex(Mapping):
+    """Flat view of a parsed status document: normalized xAPI path of every leaf to its value, built in one pass.
+    Paths carry the item of each instance, Status/Call[2]/Duration, Status/MediaChannels/Call[2]/Channel[5]/NetStat/Jitter,
+    repeated elements without an item attribute are numbered from 1 in document order.
+    Usage: index = codec.get_device_status("index")
+           index["Status/Call[2]/Duration"]
+           index.query("Status/MediaChannels/Call[*]/Channel[*]/NetStat/Loss")
+           index.prefix("Status/Call[2]")"""
+    
+    def __init__(self, document):
+        if isinstance(document, (bytes, str)):
+            document = _parse_fast(document)
+        self._values:dict = {}
+        self._add(document, "")
+    
+    def _add(self, node, path : str):
+        values = self._values
+        for tag, value in node.items():
+            repeated = type(value) is list
+            for position, entry in enumerate(value if repeated else (value,), 1):
+                item = getattr(entry, "xml_attrs", None)
+                item = item.get("item") if item else None
+                if item is None and repeated:
+                    item = position
+                key = f"{path}/{tag}" if path else tag
+                if item is not None:
+                    key = f"{key}[{item}]"
+                if isinstance(entry, dict):
+                    self._add(entry, key)
+                else:
+                    values[key] = entry
+    
+    @staticmethod
+    def normalize(path : str):
+        """Index form of a path given as Status/Call[2]/Duration, /Status/Call/2/Duration or Status Call 2 Duration"""
+        parts = []
+        for part in path.replace(" ", "/").split("/"):
+            if not part:
+                continue
+            if part.isdigit() and parts:
+                parts[-1] = f"{parts[-1]}[{part}]"
+            else:
+                parts.append(part)
+        return "/".join(parts)
+    
+    def __getitem__(self, path : str):
+        """Value of one leaf. A path that leaves out the item of an element with a single instance also finds it"""
+        try:
+            return self._values[path]
+        except KeyError:
+            pass
+        key = self.normalize(path)
+        if key in self._values:
+            return self._values[key]
+        matches = self.query(key)
+        if len(matches) == 1:
+            return next(iter(matches.values()))
+        raise KeyError(path)
+    
+    def __iter__(self):
+        return iter(self._values)
+    
+    def __len__(self):
+        return len(self._values)
+    
+    def __repr__(self):
+        return f"StatusIndex({len(self._values)} leaves)"
+    
+    def query(self, pattern : str):
+        """Every leaf whose path matches pattern, as a dict of path to value in document order"""
+        match = _index_pattern(pattern).fullmatch
+        return {path: value for path, value in self._values.items() if match(path)}
+    
+    def prefix(self, path : str):
+        """Every leaf at or below path, as a dict of path to value in document order.
+        path may use the same wildcards as query"""
+        match = _index_pattern(path).match
+        found = {}
+        for key, value in self._values.items():
+            head = match(key)
+            if head and key[head.end():head.end() + 1] in ("", "/"):
+                found[key] = value
+        return found
+
+
+def _number(text : str):
+    """int or float of a numeric xAPI leaf, the text itself when it is not a number"""
+    try:
+        return int(text)
+    except ValueError:
+        try:
+            return float(text)
+        except ValueError:
+            return text
+
+
+# enumerated values repeat in every record, interning keeps one copy of each
+_enum = sys.intern
+
+
+def _record_slots(items : dict, fields : dict):
+    return tuple(dict.fromkeys([*items.values(), *(slot for slot, _ in fields.values())]))
+
+
+class _Record:
+    """Base of the typed result records. _ANCHOR is the path of the element a record is built from,
+    _ITEMS the slots taking the item attribute of the anchor elements and _FIELDS the path below the anchor
+    of each leaf with its slot and converter. Leaves missing from the document are None"""
+    __slots__ = ()
+    _ANCHOR = ()
+    _ITEMS = {}
+    _FIELDS = {}
+    
+    def __init__(self, **values):
+        for slot in self.__slots__:
+            setattr(self, slot, values.get(slot))
+    
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(f'{slot}={getattr(self, slot)!r}' for slot in self.__slots__)})"
+    
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, slot) == getattr(other, slot) for slot in self.__slots__)
+    
+    def as_dict(self):
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+    
+    @classmethod
+    def parse(cls, document):
+        """Records of every anchor element of an XML document, built while expat reads it without a tree in between"""
+        anchor = cls._ANCHOR
+        depth = len(anchor)
+        items_of = cls._ITEMS
+        fields = cls._FIELDS
+        records = []
+        stack = []
+        text = []
+        items = {}
+        # number of leading elements of the open path that match the anchor, and the record being filled
+        matched = 0
+        current = None
+        
+        def start(tag, attrs):
+            nonlocal matched, current
+            stack.append(tag)
+            level = len(stack)
+            if current is not None:
+                text.clear()
+            elif level == matched + 1 and level <= depth and tag == anchor[level - 1]:
+                matched = level
+                if tag in items_of:
+                    items[items_of[tag]] = _number(attrs.get("item", ""))
+                if level == depth:
+                    current = cls(**items)
+        
+        def end(tag):
+            nonlocal matched, current
+            level = len(stack)
+            if current is not None:
+                if level > depth:
+                    spec = fields.get("/".join(stack[depth:]))
+                    if spec is not None:
+                        setattr(current, spec[0], spec[1]("".join(text).strip()))
+                else:
+                    records.append(current)
+                    current = None
+            if level == matched:
+                matched -= 1
+            stack.pop()
+        
+        parser = expat.ParserCreate()
+        parser.buffer_text = True
+        parser.StartElementHandler = start
+        parser.EndElementHandler = end
+        parser.CharacterDataHandler = text.append
+        parser.Parse(document, True)
+        return records
+
+
+class CallStatus(_Record):
+    """One Status/Call of the device, as returned by get_status_call_records"""
+    _ANCHOR = ("Status", "Call")
+    _ITEMS = {"Call": "call_id"}
+    _FIELDS = {
+        "AnswerState": ("answer_state", _enum),
+        "AttendedTransferFrom": ("attended_transfer_from", _number),
+        "CallType": ("call_type", _enum),
+        "CallbackNumber": ("callback_number", str),
+        "DeviceType": ("device_type", _enum),
+        "Direction": ("direction", _enum),
+        "DisplayName": ("display_name", str),
+        "Duration": ("duration", _number),
+        "Encryption/Type": ("encryption_type", _enum),
+        "FacilityServiceId": ("facility_service_id", _number),
+        "HoldReason": ("hold_reason", _enum),
+        "Ice": ("ice", _enum),
+        "PlacedOnHold": ("placed_on_hold", _enum),
+        "Protocol": ("protocol", _enum),
+        "ReceiveCallRate": ("receive_call_rate", _number),
+        "RemoteNumber": ("remote_number", str),
+        "Status": ("status", _enum),
+        "TransmitCallRate": ("transmit_call_rate", _number),
+    }
+    __slots__ = _record_slots(_ITEMS, _FIELDS)
+
+
+class MediaChannelStat(_Record):
+    """One Status/MediaChannels/Call/Channel with its NetStat counters, as returned by get_status_netStat_records"""
+    _ANCHOR = ("Status", "MediaChannels", "Call", "Channel")
+    _ITEMS = {"Call": "call_id", "Channel": "channel_id"}
+    _FIELDS = {
+        "Direction": ("direction", _enum),
+        "Type": ("type", _enum),
+        "Encryption": ("encryption", _enum),
+        "ParticipantId": ("participant_id", str),
+        "Audio/Protocol": ("protocol", _enum),
+        "Video/Protocol": ("protocol", _enum),
+        "Video/ChannelRole": ("channel_role", _enum),
+        "Video/FrameRate": ("frame_rate", _number),
+        "Video/ResolutionX": ("resolution_x", _number),
+        "Video/ResolutionY": ("resolution_y", _number),
+        "NetStat/Bytes": ("bytes", _number),
+        "NetStat/ChannelRate": ("channel_rate", _number),
+        "NetStat/Jitter": ("jitter", _number),
+        "NetStat/LastIntervalLost": ("last_interval_lost", _number),
+        "NetStat/LastIntervalReceived": ("last_interval_received", _number),
+        "NetStat/Loss": ("loss", _number),
+        "NetStat/MaxJitter": ("max_jitter", _number),
+        "NetStat/Packets": ("packets", _number),
+    }
+    __slots__ = _record_slots(_ITEMS, _FIELDS)
+
+
+class ConnectedDevice(_Record):
+    """One Status/Peripherals/ConnectedDevice, as returned by get_status_connectedHardware_records"""
+    _ANCHOR = ("Status", "Peripherals", "ConnectedDevice")
+    _ITEMS = {"ConnectedDevice": "device_id"}
+    _FIELDS = {
+        "HardwareInfo": ("hardware_info", str),
+        "ID": ("id", str),
+        "Name": ("name", str),
+        "SerialNumber": ("serial_number", str),
+        "SoftwareInfo": ("software_info", str),
+        "Status": ("status", _enum),
+        "Type": ("type", _enum),
+        "UpgradeStatus": ("upgrade_status", _enum),
+        "RoomAnalytics/AmbientTemperature": ("ambient_temperature", _number),
+        "RoomAnalytics/RelativeHumidity": ("relative_humidity", _number),
+        "RoomAnalytics/AirQuality/Index": ("air_quality_index", _number),
+    }
+    __slots__ = _record_slots(_ITEMS, _FIELDS)
+
+
+class CallHistoryEntry(_Record):
+    """One Entry of the CallHistory Get result, as returned by get_call_history_records"""
+    _ANCHOR = ("Command", "CallHistoryGetResult", "Entry")
+    _ITEMS = {"Entry": "entry_id"}
+    _FIELDS = {
+        "CallHistoryId": ("call_history_id", _number),
+        "CallbackNumber": ("callback_number", str),
+        "RemoteNumber": ("remote_number", str),
+        "DisplayName": ("display_name", str),
+        "Direction": ("direction", _enum),
+        "CallType": ("call_type", _enum),
+        "RequestedCallType": ("requested_call_type", _enum),
+        "OccurrenceType": ("occurrence_type", _enum),
+        "IsAcknowledged": ("is_acknowledged", _enum),
+        "Protocol": ("protocol", _enum),
+        "CallRate": ("call_rate", _number),
+        "Encryption": ("encryption", _enum),
+        "StartTime": ("start_time", str),
+        "StartTimeUTC": ("start_time_utc", str),
+        "EndTime": ("end_time", str),
+        "EndTimeUTC": ("end_time_utc", str),
+        "Duration": ("duration", _number),
+        "DisconnectCause": ("disconnect_cause", str),
+        "DisconnectCauseType": ("disconnect_cause_type", _enum),
+        "DisconnectCauseCode": ("disconnect_cause_code", _number),
+        "DisconnectCauseOrigin": ("disconnect_cause_origin", _enum),
+    }
+    __slots__ = _record_slots(_ITEMS, _FIELDS)
+
+
+class _StreamExtractor:
+    """Incremental expat parse that keeps only the elements matching paths, given as for StatusIndex.query.
+    A path without a wildcard is done at its first match, one with [*] or * once the parent of its first wildcard closes,
+    instances of an element follow each other in xAPI documents. Matches are (path, value) with path keyed like StatusIndex,
+    the item of an element only when it has one, and value the leaf text or the subtree in the shape of the fast parser"""
+    
+    def __init__(self, paths : list):
+        self._patterns = [_index_pattern(path).fullmatch for path in paths]
+        self._scopes = []
+        for path in paths:
+            segments = StatusIndex.normalize(path).split("/")
+            wildcard = [depth for depth, segment in enumerate(segments) if "*" in segment]
+            self._scopes.append(wildcard[0] if wildcard else None)
+        self._pending = set(range(len(paths)))
+        self._matched = set()
+        self._keys = []
+        self._captures = []
+        self._found = []
+        parser = self._parser = expat.ParserCreate()
+        parser.buffer_text = True
+        parser.StartElementHandler = self._start
+        parser.EndElementHandler = self._end
+        parser.CharacterDataHandler = self._data
+    
+    @property
+    def done(self):
+        return not self._pending
+    
+    def feed(self, chunk, final : bool = False):
+        """Matches completed by this chunk of the document"""
+        self._parser.Parse(chunk, final)
+        found, self._found = self._found, []
+        return found
+    
+    def _start(self, tag, attrs):
+        item = attrs.get("item")
+        segment = f"{tag}[{item}]" if item is not None else tag
+        key = f"{self._keys[-1]}/{segment}" if self._keys else segment
+        self._keys.append(key)
+        for capture in self._captures:
+            capture[2].append((tag, attrs, {}, []))
+        for index in self._pending:
+            if (self._scopes[index] is not None or index not in self._matched) and self._patterns[index](key):
+                self._matched.add(index)
+                self._captures.append((index, key, [(tag, attrs, {}, [])]))
+    
+    def _data(self, text):
+        for capture in self._captures:
+            capture[2][-1][3].append(text)
+    
+    def _end(self, tag):
+        for capture in list(self._captures):
+            index, key, stack = capture
+            tag, attrs, children, text = stack.pop()
+            if children:
+                value = XMLDict(children)
+            else:
+                value = "".join(text).strip()
+                if attrs:
+                    value = XMLText(value)
+            if attrs:
+                value.xml_attrs = attrs
+            if stack:
+                parent = stack[-1][2]
+                if tag in parent:
+                    existing = parent[tag]
+                    if type(existing) is list:
+                        existing.append(value)
+                    else:
+                        parent[tag] = [existing, value]
+                else:
+                    parent[tag] = value
+                continue
+            self._captures.remove(capture)
+            self._found.append((key, value))
+            if self._scopes[index] is None:
+                self._pending.discard(index)
+        self._keys.pop()
+        depth = len(self._keys)
+        for index in list(self._pending):
+            if index in self._matched and self._scopes[index] is not None and depth < self._scopes[index]:
+                self._pending.discard(index)
+
+
+class _BackupFile:
+    """Writes a configuration.xml download to <device name>.xml as it arrives, the name is read from SystemUnit/Name on the way"""
+    
+    def __init__(self):
+        self._extractor = _StreamExtractor(["Configuration/SystemUnit/Name"])
+        self._name = None
+        self._partial = f".backup-{os.getpid()}-{threading.get_ident()}.xml.part"
+        self._file = open(self._partial, "wb")
+    
+    def write(self, chunk : bytes):
+        self._file.write(chunk)
+        if self._name is None:
+            for _, value in self._extractor.feed(chunk):
+                self._name = value
+    
+    def finish(self):
+        self._file.close()
+        if self._name is None:
+            for _, value in self._extractor.feed(b"", True):
+                self._name = value
+        if self._name is None:
+            raise Exception("Device name not found in configuration\n")
+        os.replace(self._partial, f"{self._name}.xml")
+    
+    def abort(self):
+        self._file.close()
+        try:
+            os.remove(self._partial)
+        except OSError:
+            pass
+
+    @classmethod
+    def save(cls, chunks):
+        """Write every chunk, the partial file is removed when anything fails"""
+        backup = cls()
+        try:
+            for chunk in chunks:
+                backup.write(chunk)
+            backup.finish()
+        except BaseException:
+            backup.abort()
+            raise
+
+
+class _PathOnly:
+    """Stands in for the client when a get_status_* function is only asked for its status path"""
+    
+    @staticmethod
+    def get_status(path):
+        parts = list(_path_parts(tuple(path) if isinstance(path, list) else path))
+        return parts if parts[:1] == ["Status"] else ["Status"] + parts
+
 
 class Cisco_RoomOS:
     """
@@ -24,346 +1537,1158 @@ class Cisco_RoomOS:
     __PACUrl_flag=0
     __man_flag=0
     
-    @staticmethod
-    def all_methods():
-        return [method for method in dir(Cisco_RoomOS) if callable(getattr(Cisco_RoomOS,method))]
+    # one circuit breaker per device address, shared by every instance talking to it
+    _breakers = {}
+    _breakers_lock = threading.Lock()
+    _RETRY_STATUS = (502, 503, 504)
+    # bytes read at a time by the streaming readers
+    _STREAM_CHUNK = 64 * 1024
+    # set by snapshot()
+    _snapshot = None
+    # set by transaction()
+    _transaction = None
+    # set by config_cache, the readers answer from it
+    _config_cache = None
+    # the cache writes are kept in step with and skip_unchanged compares them against: _config_cache when there is one,
+    # else a cache of its own for skip_unchanged that the readers never consult
+    _write_cache = None
+    skip_unchanged = False
+    # answer of a write skip_unchanged left out
+    _UNCHANGED_ANSWER = b'<?xml version="1.0"?>\n<Configuration><Success/></Configuration>'
+    
+    @staticmethod
+    def all_methods():
+        """Description: Names of every method of the library, the get_status_*, set_* and command_* accessors are read from their tables"""
+        return list(_all_methods())
+    
+    
+    def __init__(self,address : str ,username : str ,password :str ,ssl_verify: str = False,
+                 pool_maxsize: int = 4, idle_timeout: float = 60.0, warm_up: bool = False,
+                 auth_mode: str = "basic", timeout: tuple = (5, 60), retries: int = 2, backoff: float = 0.5,
+                 breaker_threshold: int = 5, breaker_cooldown: float = 30.0, scheme: str = "http", min_tls: str = "TLSv1.2",
+                 transport = "http", dns_ttl: float = None, parser: str = "fast", lazy_results: bool = False,
+                 raise_errors: bool = False, compression: bool = True, config_cache: float = None, skip_unchanged: bool = False):
+        """pool_maxsize: number of keep-alive connections kept open to the device
+        idle_timeout: seconds after which idle pooled connections are dropped and reopened, None to keep them forever
+        warm_up: open the first connection in a background thread so the first call does not pay for it
+        auth_mode: basic to send the credentials with every request, session to log in once and reuse the xAPI session cookie
+        timeout: (connect, read) timeout in seconds for every request
+        retries: number of retries of failed getxml reads, with exponential backoff starting at backoff seconds and full jitter.
+        Configuration writes and commands are never retried
+        breaker_threshold: consecutive connection failures after which requests to the device fail fast for breaker_cooldown seconds, None to disable.
+        Instances with the same address, threshold and cooldown share the breaker. A refused certificate is neither retried nor counted
+        scheme: http or https, set https when the device only allows HTTPS (set_http_mode("HTTPS"))
+        min_tls: lowest TLS version accepted over https, TLSv1.1/TLSv1.2/TLSv1.3
+        ssl_verify: False to skip certificate checks, True for the system CA store or the path of a CA bundle
+        transport: http for getxml/putxml, websocket to send every request over one JSON-RPC WebSocket (/ws, requires websockets),
+        or an object with send(method, url, **kwargs) returning a response with status_code and text, and close()
+        dns_ttl: seconds to keep the resolved addresses of a device host name in a cache shared by all instances,
+        None to resolve it for every new connection. Fill the cache for a whole inventory with Cisco_RoomOS.preresolve
+        parser: fast to parse responses into plain dicts, lists and strings (XMLDict, XMLText when attributes are present),
+        jxmlease for the XMLDictNode objects of jxmlease. Both give the same shape
+        lazy_results: status getters, setters and commands return a LazyResult that keeps the raw answer and parses it on
+        first access, check result.ok / result.error without parsing. Connection failures are still returned as exceptions.
+        With raise_errors an HTTP error status, a refused write or a command not answered OK raises result.exception instead
+        raise_errors: raise the typed errors (AuthenticationError, TransportError, ConfigurationError, CommandError, all RoomOSError)
+        instead of returning them. Without it the functions return the error as before, commands its message
+        compression: ask the device for gzip or deflate encoded answers, decompressed as they arrive. The bytes on the wire
+        and the decoded size of every answer are in last_timing. False asks for uncompressed answers
+        config_cache: seconds to keep configuration.xml, fetched once, to answer get_device_video_config, get_device_backup,
+        stream_extract of the configuration and apply_desired_config. Successful writes update it, refresh_config fetches it again.
+        None (default) reads the device every time
+        skip_unchanged: compare the values of every set_* call with the configuration cache and send nothing when the device
+        holds them already, the answer is a Success as from the device. skipped_writes counts them. Without config_cache the
+        values are compared with a configuration.xml of its own kept for 60 seconds, which the readers do not use, so they still
+        read the device. A change made outside this object within the ttl is not seen until refresh_config"""
+        if scheme not in ("http", "https"):
+            raise Exception("Unidentified scheme requested, please choose http or https")
+        if parser not in _PARSERS:
+            raise Exception("Unidentified parser requested, please choose fast or jxmlease")
+        self.address:str = address
+        self.scheme:str = scheme
+        self.base_url:str = f"{scheme}://{address}"
+        self.min_tls:str = min_tls
+        self.username:str = username
+        self.password:str = password
+        self.ssl_verify:bool = ssl_verify
+        self.parser:str = parser
+        self._parse = _PARSERS[parser]
+        self.lazy_results:bool = lazy_results
+        self.raise_errors:bool = raise_errors
+        self.idle_timeout:float = idle_timeout
+        if auth_mode not in ("basic", "session"):
+            raise Exception("Unidentified auth mode requested, please choose basic or session")
+        self.auth_mode:str = auth_mode
+        self.timeout:tuple = timeout
+        self.retries:int = retries
+        self.backoff:float = backoff
+        self.breaker_threshold:int = breaker_threshold
+        self.breaker_cooldown:float = breaker_cooldown
+        
+        self.dns_ttl:float = dns_ttl
+        self._timing = threading.local()
+        import requests
+        from requests.auth import HTTPBasicAuth
+        self._adapter = _tls_adapter_class()(_shared_ssl_context(ssl_verify, min_tls), dns_ttl, pool_connections=1, pool_maxsize=pool_maxsize)
+        self._session = requests.Session()
+        if auth_mode == "basic":
+            self._session.auth = HTTPBasicAuth(self.username,self.password)
+        self._session_lock = threading.Lock()
+        self._session.verify = self.ssl_verify
+        self.compression:bool = compression
+        self.skip_unchanged:bool = skip_unchanged
+        self.skipped_writes:int = 0
+        if config_cache is not None:
+            self._config_cache = self._write_cache = _ConfigCache(config_cache)
+        elif skip_unchanged:
+            self._write_cache = _ConfigCache(60.0)
+        self._session.headers["Accept-Encoding"] = "gzip, deflate" if compression else "identity"
+        self._session.mount("http://", self._adapter)
+        self._session.mount("https://", self._adapter)
+        self._last_used = time.monotonic()
+        if transport == "http":
+            self._transport = None
+        elif transport == "websocket":
+            self._transport = _WebSocketTransport(self)
+        elif isinstance(transport, str):
+            raise Exception("Unidentified transport requested, please choose http or websocket")
+        else:
+            self._transport = transport
+        if warm_up:
+            threading.Thread(target=self._warm_up, daemon=True).start()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Description: Close the pooled connections to the device, ending the xAPI session first when auth_mode is session"""
+        if self.auth_mode == "session" and self._session.cookies.get("SessionId"):
+            try:
+                self._session.post(f"{self.base_url}/xmlapi/session/end", timeout=self.timeout, verify=self.ssl_verify)
+            except Exception:
+                pass
+            self._session.cookies.clear()
+        self._session.close()
+        if self._transport is not None:
+            self._transport.close()
+    
+    def _begin_session(self, expired_cookie : str = None):
+        """Open an xAPI web session with the credentials, the SessionId cookie is kept by the pooled session"""
+        with self._session_lock:
+            if self._session.cookies.get("SessionId") != expired_cookie:
+                # another thread renewed it already
+                return
+            self._session.cookies.clear()
+            from requests.auth import HTTPBasicAuth
+            response = self._session.post(f"{self.base_url}/xmlapi/session/begin", auth=HTTPBasicAuth(self.username,self.password), timeout=self.timeout, verify=self.ssl_verify)
+            if (response.status_code==401):
+                raise _http_error(response.status_code)
+            elif not self._session.cookies.get("SessionId"):
+                raise AuthenticationError(f"Error: Session could not be started, {response.status_code}", response.status_code)
+    
+    @staticmethod
+    def preresolve(addresses : list, ttl : float = 300.0, max_workers : int = 32):
+        """Description: Resolve the host names of an inventory concurrently into the DNS cache shared by the instances created with dns_ttl
+        Usage: Supply the device addresses (host or host:port, IP addresses are skipped), returns a dict of host name to
+        its addresses, or to the exception its lookup failed with"""
+        hosts = []
+        for address in addresses:
+            host = urlsplit(f"//{address}").hostname
+            if host and not _is_ip(host) and host not in hosts:
+                hosts.append(host)
+        if not hosts:
+            return {}
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(hosts))) as executor:
+            lookups = {host: executor.submit(_dns_cache.resolve, host, None, ttl) for host in hosts}
+        resolved = {}
+        for host, lookup in lookups.items():
+            try:
+                resolved[host] = lookup.result()
+            except Exception as e:
+                resolved[host] = e
+        return resolved
+    
+    @property
+    def last_timing(self):
+        """Timing of the last request this thread sent to the device: dns is the seconds spent resolving the host name
+        (0 when a pooled connection or the cache answered), total the seconds of the whole request including retries
+        and pipeline the seconds spent classifying and parsing the answer. Over HTTP, latency is the seconds until the
+        answer headers arrived, wire_bytes the body bytes received, bytes its decoded size and encoding the
+        Content-Encoding of the answer (None when uncompressed). For the answers parsed while they download
+        (get_device_status, get_call_history, stream_extract) total also covers the download"""
+        return getattr(getattr(self, "_timing", None), "last", None)
+    
+    def _warm_up(self):
+        try:
+            self._request("HEAD", f"{self.base_url}/")
+        except Exception:
+            pass
+    
+    def _breaker(self):
+        if not self.breaker_threshold:
+            return None
+        # instances of a device share its breaker only when they agree on when it opens and for how long
+        key = (self.address, self.breaker_threshold, self.breaker_cooldown)
+        with self._breakers_lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = self._breakers[key] = _CircuitBreaker(self.breaker_threshold, self.breaker_cooldown)
+            return breaker
+    
+    def _backoff_delay(self, attempt : int):
+        """Exponential backoff with full jitter"""
+        import random
+        return random.uniform(0, self.backoff * (2 ** attempt))
+    
+    def _request(self, method : str, url : str, **kwargs):
+        """Send a request to the device with timeouts, retries of idempotent reads and the circuit breaker of the device"""
+        breaker = self._breaker()
+        if breaker is not None:
+            breaker.check(self.address)
+        kwargs.setdefault("timeout", self.timeout)
+        # passed per request, REQUESTS_CA_BUNDLE in the environment would override the session setting
+        kwargs.setdefault("verify", self.ssl_verify)
+        import requests
+        started, resolution = time.perf_counter(), _resolution_seconds()
+        self._timing.started = started
+        try:
+            response = self._attempt(method, url, breaker, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            raise TransportError(f"Connection Failed , {e}\n") from e
+        finally:
+            self._timing.last = {"dns": _resolution_seconds() - resolution, "total": time.perf_counter() - started}
+        if not kwargs.get("stream"):
+            self._record_transfer(response)
+        return response
+    
+    def _record_transfer(self, response, decoded : int = None):
+        """Adds latency, wire_bytes, bytes and encoding of a read answer to last_timing, decoded is the size of a streamed body"""
+        timing = getattr(self._timing, "last", None)
+        if timing is None:
+            return
+        raw = getattr(response, "raw", None)
+        elapsed = getattr(response, "elapsed", None)
+        if decoded is None:
+            decoded = len(response.content)
+        else:
+            timing["total"] = time.perf_counter() - self._timing.started
+        timing["latency"] = elapsed.total_seconds() if elapsed is not None else None
+        # urllib3 counts what it pulled from the socket, before the content decoding
+        timing["wire_bytes"] = raw.tell() if raw is not None and hasattr(raw, "tell") else None
+        timing["bytes"] = decoded
+        timing["encoding"] = getattr(response, "headers", {}).get("Content-Encoding")
+    
+    def _body_chunks(self, response):
+        """Decoded body of a streamed answer as it arrives, gzip and deflate are decompressed chunk by chunk"""
+        decoded = 0
+        try:
+            for chunk in response.iter_content(self._STREAM_CHUNK):
+                decoded += len(chunk)
+                yield chunk
+        finally:
+            # also when the reader stops early, stream_extract does once it found every path
+            self._record_transfer(response, decoded)
+    
+    def _attempt(self, method : str, url : str, breaker, **kwargs):
+        import requests
+        retries = self.retries if method in ("GET", "HEAD") else 0
+        attempt = 0
+        while True:
+            try:
+                response = self._send(method, url, **kwargs)
+            except requests.exceptions.SSLError:
+                # a certificate this client refuses is its own setting, not a failing device: no retry, no breaker count
+                raise
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if breaker is not None:
+                    breaker.record(False)
+                if attempt >= retries:
+                    raise
+            else:
+                failed = response.status_code in self._RETRY_STATUS
+                if breaker is not None:
+                    breaker.record(not failed)
+                if not failed or attempt >= retries:
+                    return response
+                # a streamed answer holds its pooled connection until closed
+                response.close()
+            time.sleep(self._backoff_delay(attempt))
+            attempt += 1
+            if breaker is not None:
+                breaker.check(self.address)
+    
+    def _send(self, method : str, url : str, **kwargs):
+        """Send a request over the pooled keep-alive session of this device, or over its transport"""
+        if self._transport is not None:
+            return self._transport.send(method, url, **kwargs)
+        now = time.monotonic()
+        if self.idle_timeout is not None and now - self._last_used > self.idle_timeout:
+            # the codec closes idle sockets on its side, reopen instead of failing on a stale one
+            self._adapter.close()
+        self._last_used = now
+        if self.auth_mode == "basic":
+            return self._session.request(method, url, **kwargs)
+        
+        cookie = self._session.cookies.get("SessionId")
+        if cookie is None:
+            self._begin_session()
+            cookie = self._session.cookies.get("SessionId")
+        response = self._session.request(method, url, **kwargs)
+        if response.status_code == 401:
+            # the codec expired the session, log in again and replay the request once
+            self._begin_session(expired_cookie=cookie)
+            response = self._session.request(method, url, **kwargs)
+        return response
+        
+    def get_device_status(self,return_type : str = "json"):
+        """Description: Get full device status
+        Usage: Run the function that returns data by default in json format, but can be requested in XML by specifying "xml" in argument.
+        "index" returns a StatusIndex of every leaf by path, inside snapshot() it is built once per fetch and shared."""
+        
+        url = f"{self.base_url}/status.xml"
+        
+        try:
+            if self._snapshot is not None:
+                document = self._snapshot_status(["Status"])
+                return self._device_status_result(document, return_type)
+            response = self._request("GET", url, stream=True)
+            try:
+                if return_type == "json":
+                    # parsed while it downloads, the decompressed document is never held as a whole
+                    self._result("document", response.status_code, None)
+                    return self._parse(self._body_chunks(response))
+                document = b"".join(self._body_chunks(response))
+                return self._device_status_result(self._result("document", response.status_code, document), return_type)
+            finally:
+                response.close()
+           
+        except Exception as e:
+            return self._failed(e)
+    
+    def _device_status_result(self, document : bytes, return_type : str):
+        if return_type == "json":
+            return self._parse(document)
+        elif return_type == "xml":
+            return document.decode("utf-8")
+        elif return_type == "index":
+            if self._snapshot is not None and self._snapshot.document is document:
+                return self._snapshot.index(self._parse)
+            return StatusIndex(self._parse(document))
+        raise Exception("Unidentified return type requested, please choose xml, json or index\n")
+        
+    
+    def get_device_backup(self):
+        """Description: Get device configuration backup
+        Usage: Call the function that returns the data in XML format file located in specified optional path with device name as file name"""
+        
+        url = f'{self.base_url}/configuration.xml'
+        try: 
+            if self._config_cache is not None:
+                return _BackupFile.save([self._config_document(["Configuration"])])
+            configuration = self._request("GET", url, stream=True)
+            try:
+                self._result("document", configuration.status_code, None)
+                _BackupFile.save(self._body_chunks(configuration))
+            finally:
+                configuration.close()
+        except Exception as e:
+            return self._failed(e)
+    
+    def stream_extract(self, paths : list, document : str = "status"):
+        """Description: Read only the given subtrees or leaves of status.xml, or of configuration.xml with document="configuration",
+        while the document downloads and stop reading as soon as they are all found, memory stays flat however large the document.
+        Usage: for path, value in codec.stream_extract(["Status/UserInterface/ContactInfo/Name", "Status/MediaChannels/Call[*]/Channel[*]/NetStat/Loss"]):
+        Paths are written as for StatusIndex.query, a path yields its first match and a path with [*] every instance.
+        Yields the path of each match with its item indices and the leaf text or subtree. Errors are raised"""
+        
+        if document not in ("status", "configuration"):
+            raise Exception("Unidentified document requested, please choose status or configuration\n")
+        extractor = _StreamExtractor(paths)
+        if self._snapshot is not None and document == "status":
+            yield from extractor.feed(self._snapshot_status(["Status"]), True)
+            return
+        if self._config_cache is not None and document == "configuration":
+            yield from extractor.feed(self._config_document(["Configuration"]), True)
+            return
+        response = self._request("GET", f"{self.base_url}/{document}.xml", stream=True)
+        try:
+            self._result("document", response.status_code, None)
+            for chunk in self._body_chunks(response):
+                yield from extractor.feed(chunk)
+                if extractor.done:
+                    return
+            yield from extractor.feed(b"", True)
+        finally:
+            response.close()
+        
+    def get_device_video_config(self,output_debug : bool =False):
+        """Description: get device video configuration
+        Usage: call the function that returns data in XML structure"""
+        
+        url = f'{self.base_url}/getxml?location=/Configuration/Video'
+        try:
+            if self._config_cache is not None:
+                text = self._config_document(self._config_cache.location(url))
+            else:
+                configuration = self._request("GET", url)
+                text = self._result("document", configuration.status_code, configuration.text)
+            if output_debug:
+                print(text)
+            return(text)
+        except Exception as e:
+            if output_debug:
+                print(e)
+            return self._failed(e)
+            
+    def get_audio_status(self,output_debug : bool = False):
+        """Description: Get audio status
+        Usage : call the function which returns data in XML structure"""
+
+        url = f'{self.base_url}/getxml?location=/Status/Audio'
+        try:
+            audio_status = self._request("GET", url)
+            text = self._result("document", audio_status.status_code, audio_status.text)
+            if output_debug:
+                print(text)
+            return(text)
+        except Exception as e:
+            if output_debug:
+                print(e)
+            return self._failed(e)
+    
+    def _failed(self, e : Exception):
+        """Boundary of the public functions: returns the error as they always did, raises it with raise_errors"""
+        if self.raise_errors:
+            raise e
+        return e
+    
+    def _result(self, kind : str, status_code : int, body, output_debug : bool = False):
+        """Response pipeline of every getter, setter and command, sync and async: classifies the answer with at most one parse
+        into the result or a typed error. kind is document (body returned as given, text or bytes), status, configuration,
+        command, call_history or dial (the CallId). The seconds it took are the pipeline entry of last_timing"""
+        started = time.perf_counter()
+        try:
+            return self._classify(kind, status_code, body, output_debug)
+        finally:
+            timing = getattr(getattr(self, "_timing", None), "last", None)
+            if timing is not None:
+                timing["pipeline"] = time.perf_counter() - started
+    
+    def _classify(self, kind : str, status_code : int, body, output_debug : bool):
+        if self.lazy_results and kind in ("status", "configuration", "command"):
+            result = LazyResult(kind, status_code, body, self._parse)
+            if self.raise_errors and result.exception is not None:
+                raise result.exception
+            return result
+        if status_code != 200:
+            raise _http_error(status_code)
+        if kind == "document":
+            return body
+        parsed = self._parse(body)
+        if kind == "configuration":
+            error = _configuration_error(parsed.get('Configuration'))
+            if error is not None:
+                raise ConfigurationError(f"Error: {error['Details']}", status_code, error)
+        elif kind == "command":
+            root = next(iter(parsed.values()), None)
+            result = next(iter(root.values()), None) if isinstance(root, dict) else None
+            if isinstance(result, list):
+                result = result[0]
+            status = getattr(result, "xml_attrs", {}).get("status")
+            if status == "OK":
+                return "OK\n"
+            elif status == "Error" or (isinstance(root, dict) and "Error" in root):
+                if self.raise_errors:
+                    reason = result.get("Reason", "Error") if isinstance(result, dict) else "Error"
+                    raise CommandError(f"Error: {reason}", status_code, parsed)
+                print(f"Something went wrong, Couldn't verify the Command.Please check and run again. Returned Error:\n{parsed}")
+                return(parsed)
+            return None
+        elif kind == "dial":
+            return parsed['Command']['DialResult']['CallId']
+        if output_debug:
+            print(parsed)
+        return parsed
+        
+    def get_status(self, path):
+        """Description: Read any status value of the device, every get_status_* function is a shortcut to this one
+        Usage: Supply the xAPI path below Status as a string or a tuple, item numbers included:
+               codec.get_status("Call/3/Duration") , codec.get_status(("Network", 1, "IPv4", "Address"))"""
+        parts = _path_parts(tuple(path) if isinstance(path, list) else path)
+        if parts[:1] != ("Status",):
+            parts = ("Status",) + parts
+        return self._get_status(self.base_url + _getxml_location(parts))
+    
+    def set_config(self, path, value, output_debug : bool = False):
+        """Description: Set any configuration of the device, every set_* function is a shortcut to this one
+        Usage: Supply the xAPI path below Configuration and the value: codec.set_config("Conference/DefaultCall/Rate", 6000)
+        A dict value sets several leaves below path in one write: codec.set_config("Conference/AutoAnswer", {"Mode": "On", "Delay": 2})
+        Values are XML escaped, output_debug prints the parsed answer"""
+        return self.__post_parser_return(_config_xml(path, value), output_debug)
+    
+    def command(self, path, **args):
+        """Description: Run any command of the device, every command_* function is a shortcut to this one
+        Usage: Supply the xAPI path below Command and the arguments as keywords: codec.command("Dial", Number="1234")
+        A list argument is sent once per entry, arguments that are None are left out, values are XML escaped"""
+        return self.__command_parser_return(_command_xml(path, args))
+    
+    @contextmanager
+    def snapshot(self, ttl : float = 5.0):
+        """Description: Answer every get_status_* call and get_device_status from one status.xml fetch instead of one getxml request each
+        Usage: with codec.snapshot(ttl=5):
+                   codec.get_status_call_duration(1)
+                   codec.get_status_sip_RegistrationStatus()
+        The document is fetched on the first call inside the block and again once it is older than ttl seconds.
+        The snapshot applies to every thread using this object"""
+        previous = self._snapshot
+        self._snapshot = _StatusSnapshot(ttl)
+        try:
+            yield self
+        finally:
+            self._snapshot = previous
+    
+    @contextmanager
+    def transaction(self, max_bytes : int = 64 * 1024):
+        """Description: Send the values of every set_* call made inside the block merged into one putxml request when the block ends,
+        instead of one request per value, or into a few requests of about max_bytes each for large changes
+        Usage: with codec.transaction() as transaction:
+                   codec.set_ipv4_address("10.0.0.5", "10.0.0.1", "255.255.255.0")
+                   rate = codec.set_default_call_rate(6000)
+               rate.ok, rate.error, transaction.failed
+        Inside the block set_* calls return a PendingWrite, settled with the outcome of its own values once the block ends.
+        Nothing is sent when the block raises, a nested transaction joins the outer one. With raise_errors the error of the first
+        failed write is raised once every request was sent. The transaction applies to every thread using this object"""
+        if self._transaction is not None:
+            yield self._transaction
+            return
+        transaction = ConfigTransaction(max_bytes)
+        self._transaction = transaction
+        try:
+            yield transaction
+        finally:
+            self._transaction = None
+        self._commit(transaction)
+    
+    def _commit(self, transaction : ConfigTransaction):
+        for payload, writes in transaction.chunks():
+            try:
+                response = self._request("POST", f"{self.base_url}/putxml", headers={'Content-Type': 'text/xml'}, data=payload)
+                transaction.settle(writes, self._parse(self._result("document", response.status_code, response.content)))
+            except Exception as e:
+                transaction.settle(writes, exception=e)
+            for write in writes:
+                self._write_through(write.leaves, write.ok)
+        if self.raise_errors and transaction.failed:
+            raise transaction.failed[0].exception
+    
+    def apply_desired_config(self, spec : dict, dry_run : bool = False):
+        """Description: Bring the configuration of the device to spec by writing only the values that differ: configuration.xml is read once,
+        the differing values are sent in one transaction and a ConfigReport tells what changed, what failed and what already matched
+        Usage: report = codec.apply_desired_config({"Conference/DefaultCall/Rate": 6000,
+                                                    "NetworkServices/NTP": {"Mode": "Manual", "Server/1/Address": "ntp.example.com"}})
+               report.changed, report.failed, report.unchanged
+        Paths are below Configuration, a dict value holds the paths below its key. Values compare as text with those of configuration.xml,
+        a value missing there is written too. dry_run reports the changes without writing them. It is refused inside an open
+        codec.transaction(), whose writes are only sent when the block ends, after the report would have been made"""
+        try:
+            if self._transaction is not None and not dry_run:
+                raise Exception(_IN_TRANSACTION)
+            desired = _desired_leaves(spec)
+            changes, unchanged = _desired_changes(desired, list(self.stream_extract([_index_key(parts) for parts in desired], "configuration")))
+            if dry_run or not changes:
+                return _config_report(changes, unchanged)
+            with self.transaction() as transaction:
+                writes = [self.set_config(change.path, change.desired) for change in changes]
+            return _config_report(changes, unchanged, writes, transaction.requests)
+        except Exception as e:
+            return self._failed(e)
+    
+    def _snapshot_status(self, path : list):
+        snapshot = self._snapshot
+        with snapshot.lock:
+            if snapshot.stale():
+                response = self._request("GET", f"{self.base_url}/status.xml")
+                snapshot.load(self._result("document", response.status_code, response.content))
+            return snapshot.render(path)
+    
+    def refresh_config(self):
+        """Description: Fetch configuration.xml into the configuration cache now, instead of once its ttl has passed
+        Usage: codec = Cisco_RoomOS(address, username, password, config_cache=300)
+               codec.refresh_config()   (after the configuration was changed outside this object)
+        The cache of skip_unchanged is the one refreshed when there is no config_cache"""
+        try:
+            cache = self._write_cache
+            if cache is None:
+                raise Exception(_NO_CONFIG_CACHE)
+            with cache.lock:
+                self._load_config(cache)
+        except Exception as e:
+            return self._failed(e)
+    
+    def _config_document(self, path : list):
+        cache = self._config_cache
+        with cache.lock:
+            if cache.stale():
+                self._load_config(cache)
+            return cache.render(path)
+    
+    def _load_config(self, cache : _ConfigCache):
+        response = self._request("GET", f"{self.base_url}/configuration.xml")
+        cache.load(self._result("document", response.status_code, response.content))
+    
+    def _unchanged(self, payloads : list):
+        """Whether the configuration cache holds every value the payloads write already, False when it cannot be read"""
+        cache = self._write_cache
+        try:
+            with cache.lock:
+                if cache.stale():
+                    self._load_config(cache)
+                return all(cache.value(path) == value for payload in payloads for path, value in _payload_leaves(payload))
+        except Exception:
+            return False
+    
+    def _skip_write(self, payloads : list, output_debug : bool):
+        """Answer of a write left out by skip_unchanged, a settled PendingWrite inside a transaction"""
+        with self._write_cache.lock:
+            self.skipped_writes += 1
+        if self._transaction is not None:
+            return self._transaction.add(payloads, output_debug, skipped=True)
+        return self._result("configuration", 200, self._UNCHANGED_ANSWER, output_debug)
+    
+    def _write_through(self, leaves : list, ok : bool):
+        """Keep the configuration cache in step with a write: the values written once it succeeded, a fetch on the next read otherwise"""
+        cache = self._write_cache
+        if cache is None:
+            return
+        with cache.lock:
+            if ok:
+                cache.update(leaves)
+            else:
+                cache.invalidate()
+    
+    def _get_status(self, url : str):
+        headers = {
+          'Content-Type': 'text/xml',
+        }
+        try:
+            path = self._snapshot.location(url) if self._snapshot is not None else None
+            if path is not None:
+                return self._result("status", 200, self._snapshot_status(path))
+            response_connect = self._request("GET", url, headers=headers)
+            return self._result("status", response_connect.status_code, response_connect.content)
+        except Exception as e:
+            return self._failed(e)
+    
+    def _records(self, url : str, record):
+        """Typed records of a getxml status url, answered from the snapshot when one is active"""
+        try:
+            path = self._snapshot.location(url) if self._snapshot is not None else None
+            if path is not None:
+                return record.parse(self._snapshot_status(path))
+            response = self._request("GET", url, headers={'Content-Type': 'text/xml'})
+            return record.parse(self._result("document", response.status_code, response.content))
+        except Exception as e:
+            return self._failed(e)
+    
+    def get_status_many(self, requests : list):
+        """Description: Read several status values with as few getxml requests as possible
+        Usage: Supply a list of status paths and/or get_status_* method names, with their arguments as a tuple:
+               codec.get_status_many(["/Status/Network/IPv4/Address", "get_status_Ipv4_gateway", ("get_status_call_duration", 3)])
+        Paths are grouped by their branch below /Status, each group is read with one request for its deepest common
+        ancestor and the requests run concurrently. Returns a dict keyed by the requests, each value being what the
+        matching get_status_* call returns"""
+        try:
+            paths, groups = self._status_many_plan(requests)
+        except Exception as e:
+            return self._failed(e)
+        if self._snapshot is not None:
+            return {key: self._get_status(self._getxml_url(path)) for key, path in paths.items()}
+        from concurrent.futures import ThreadPoolExecutor
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(len(groups), 8) or 1) as executor:
+            fetches = {location: executor.submit(self._get_subtree, location) for location in groups}
+            for location, keys in groups.items():
+                try:
+                    root = fetches[location].result()
+                    for key in keys:
+                        results[key] = self._status_many_extract(root, paths[key])
+                except Exception as e:
+                    for key in keys:
+                        results[key] = e
+        return {key: results[key] for key in paths}
+    
+    def _get_subtree(self, location : list):
+        response = self._request("GET", self._getxml_url(location), headers={'Content-Type': 'text/xml'})
+        return ET.fromstring(self._result("document", response.status_code, response.content))
+    
+    def _getxml_url(self, path : list):
+        return f"{self.base_url}/getxml?location=/" + "/".join(str(part) for part in path)
+    
+    @classmethod
+    def _status_many_plan(cls, requests : list):
+        """Path of every request, and the requests grouped by the location that answers them"""
+        paths = {}
+        for request in requests:
+            if isinstance(request, list):
+                request = tuple(request)
+            name, args = (request[0], request[1:]) if isinstance(request, tuple) else (request, ())
+            if name.startswith("get_status_"):
+                try:
+                    path = getattr(cls, name)(_PathOnly, *args)
+                except (AttributeError, TypeError):
+                    path = None
+                if not isinstance(path, list):
+                    raise Exception(f"Unidentified status function requested: {name}")
+                location = "/" + "/".join(str(part) for part in path)
+            else:
+                location = name
+                path = _xapi_path(location)
+            if not path or path[0] != "Status":
+                raise Exception(f"Unidentified status path requested: {location}, status paths start with /Status")
+            paths[request] = path
+        branches = {}
+        for key, path in paths.items():
+            branches.setdefault(tuple(path[:2]), []).append(key)
+        groups = {}
+        for keys in branches.values():
+            common = paths[keys[0]]
+            for key in keys[1:]:
+                depth = 0
+                for a, b in zip(common, paths[key]):
+                    if a != b:
+                        break
+                    depth += 1
+                common = common[:depth]
+            groups[tuple(common)] = keys
+        return paths, groups
+    
+    def _status_many_extract(self, root, path : list):
+        body = _render_location(root, path[1:]) if len(path) > 1 else "".join(ET.tostring(child, encoding="unicode") for child in root)
+        return self._result("status", 200, f'<?xml version="1.0"?>\n<Status>{body}</Status>')
+    
+    def get_status_call_records(self):
+        """Description: Every ongoing call as a CallStatus record, with the fields of the get_status_call_* functions in one request.
+        Usage: Requires user role: ADMIN, USER
+        Output: list of CallStatus, numeric fields as int. Returns an empty list if no calls found."""
+        
+        return self._records(f'{self.base_url}/getxml?location=/Status/Call', CallStatus)
+    
+    def get_status_netStat_records(self):
+        """Description: Every media channel of every call as a MediaChannelStat record, with the counters of the get_status_netStat_* functions in one request.
+        Usage: Requires user role: ADMIN, USER
+        Output: list of MediaChannelStat, numeric fields as int. Returns an empty list if no calls found."""
+        
+        return self._records(f'{self.base_url}/getxml?location=/Status/MediaChannels', MediaChannelStat)
+    
+    def get_status_connectedHardware_records(self):
+        """Description: Every connected peripheral as a ConnectedDevice record, with the fields of the get_status_connectedHardware_* functions in one request.
+        Usage: Requires user role: ADMIN, INTEGRATOR, ROOMCONTROL, USER
+        Output: list of ConnectedDevice. Returns an empty list if no device found."""
+        
+        return self._records(f'{self.base_url}/getxml?location=/Status/Peripherals/ConnectedDevice', ConnectedDevice)
+    
+    def test_call(self,extension : str ,duration : int = 30,output_debug : bool =False):
+        """Description: Test calls automatically for desired duration to termintae automatically.
+        Usage: provide the remote destination extension/uri: extension , call duration  to be tested is set at 30 seconds by default, can be changed. Note that the call either must be received or set to auto answer on remote device."""
+            
+        url = f"{self.base_url}/putxml"
+        headers = {
+          'Content-Type': 'text/xml',
+        }
+        try:
+            response_connect = self._request("POST", url, headers=headers, data=self._dial_payload(extension))
+            call_id = self._result("dial", response_connect.status_code, response_connect.content)
+            time.sleep(duration)
+            response_disconnect = self._request("POST", url, headers=headers, data=self._disconnect_payload(call_id))
+            call_data = self.get_call_history(output_debug=False)['Command']['CallHistoryGetResult']['Entry'][0]
+            if output_debug:
+                print(call_data)
+            return call_data
+        except Exception as e:
+            return self._failed(e)
+    
+    @staticmethod
+    def _dial_payload(extension : str):
+        return _command_xml(("Dial",), {"Number": extension})
+    
+    @staticmethod
+    def _disconnect_payload(call_id):
+        return _command_xml(("Call", "Disconnect"), {"CallId": call_id})
+    
+    def set_auto_answer(self,mode: str,mute: str,delay: int=0,output_debug: bool=False):
+        """Description: Set Auto Answer on or off along with associated functions like mute and delay in seconds
+        Usage Provide mode, mute mode and delay is by default 0, can be set as desired."""
+        
+        return self.set_config(("Conference", "AutoAnswer"), {"Mode": mode, "Delay": delay, "Mute": mute}, output_debug)
+        
+    _CALL_HISTORY_PAYLOAD = _command_xml(("CallHistory", "Get"), {"DetailLevel": "Full"})
+    
+    def get_call_history(self,output_debug : bool =False):
+        """Description: Get call history
+        Usage: Call the function , returns json structured output for all calls"""
+        
+        url = f"{self.base_url}/putxml"
+        headers = {
+          'Content-Type': 'text/xml',
+        }
+        try:
+            response_call_history = self._request("POST", url, headers=headers, data=self._CALL_HISTORY_PAYLOAD, stream=True)
+            try:
+                return self._result("call_history", response_call_history.status_code, self._body_chunks(response_call_history), output_debug)
+            finally:
+                response_call_history.close()
+        except Exception as e:
+            if output_debug:
+                print(e)
+            return self._failed(e)
+    
+    def get_call_history_records(self):
+        """Description: Get call history as CallHistoryEntry records
+        Usage: Call the function , returns a list of CallHistoryEntry with numeric fields as int, far smaller than the json output when kept in memory"""
+        
+        headers = {
+          'Content-Type': 'text/xml',
+        }
+        try:
+            response = self._request("POST", f"{self.base_url}/putxml", headers=headers, data=self._CALL_HISTORY_PAYLOAD)
+            return CallHistoryEntry.parse(self._result("document", response.status_code, response.content))
+        except Exception as e:
+            return self._failed(e)
+    
+    def set_h323_login_name_password(self,name:str,password:str,output_debug:bool=False):
+        """Description: The device sends the H323 Authentication Login Name and the H323 Authentication Password 
+        to an H.323 Gatekeeper for authentication. The authentication is a one way authentication from 
+        the device to the H.323 Gatekeeper, i.e. the device is authenticated to the gatekeeper. If the 
+        H.323 Gatekeeper indicates that no authentication is required, the device will still try to register. 
+        Requires the H.323 Authentication Mode to be enabled.
+        Usage : Provide Name and password , string """
+        
+        return self._post_sequence([_config_xml(("H323", "Authentication", "LoginName"), name), _config_xml(("H323", "Authentication", "Password"), password)], output_debug)
+        
+    def set_ambient_noise_estimation_interval(self,interval:int=10,output_debug:bool=False):
+        """Set the interval at which the ambient noise estimation is run, if enabled. The xConfiguration 
+        RoomAnalytics AmbientNoiseEstimation Mode can be used to enable or disable ambient noise 
+        estimations.
+        Usage:  (Default 10)-60 ,Requires user role: ADMIN, INTEGRATOR, USER"""
+        
+        return self.set_config(("RoomAnalytics", "AmbientNoiseEstimation", "Interval"), int(interval), output_debug)
     
+    def set_reverberation_time_interval(self,interval:int=1800,output_debug:bool=False):
+        """Description: Defines how often the RT60 will be measured and reported to the RoomAnalytics status. The 
+        interval is in seconds.
+        The RoomAnalytics ReverberationTime Mode configuration must be enabled to set the interval.
+        Usage: Supply interval value (60-3600), default = 1800, Requires user role: ADMIN, INTEGRATOR, USER"""
+        
+        return self.set_config(("RoomAnalytics", "ReverberationTime", "Interval"), int(interval), output_debug)
     
-    def __init__(self,address : str ,username : str ,password :str ,ssl_verify: str = False):
-        self.address:str = address
-        self.username:str = username
-        self.password:str = password
-        self.ssl_verify:bool = ssl_verify
+    def set_ntp_mode(self,mode:str,output_debug:bool=False):
+        """Description: The Network Time Protocol (NTP) is used to synchronize the device's time and date to a reference time server. The time server will be queried regularly for time updates.
+        Usage: Auto/Off , Requires user role: ADMIN"""
         
-    def get_device_status(self,return_type : str = "json"):
-        """Description: Get full device status
-        Usage: Run the function that returns data by default in json format, but can be requested in XML by specifying "xml" in argument."""
+        if mode == "Auto" or mode == "Off":
+            return self.set_config(("NetworkServices", "NTP", "Mode"), mode, output_debug)
+        else:
+            raise ConfigurationError("Illegal Value")
         
-        url = f"http://{self.address}/status.xml"
+    def set_ntp_manual_mode(self,address:str,order:int=1,output_debug:bool=False):
+        #TO BE CHECKED
+        return self._post_sequence([_config_xml(("NetworkServices", "NTP", "Mode"), address), _config_xml(("NetworkServices", "NTP"), {"Server": order, "Address": address})], output_debug)
+    
         
-        try:
-            response = requests.get(url, auth = HTTPBasicAuth(self.username,self.password), verify=self.ssl_verify)
+    def set_http_proxy_mode(self,mode:str,output_debug:bool=False):
+        
+        """Description: You can configure to use a proxy server for HTTP, HTTPS, and WebSocket traffic. The HTTP 
+        proxy can be set up manually, it can be auto-configured (PACUrl), fully automated (WPAD), or it 
+        can be turned off.
+        If NetworkServices HTTP Proxy Mode is not turned Off, you can further specify which 
+        services shall use the proxy in the HttpClient UseHttpProxy, HttpFeedback UseHttpProxy, and 
+        WebEngine UseHttpProxy settings.
+        Communication with the Cisco Webex cloud will always go via the proxy if NetworkServices 
+        HTTP Proxy Mode is not turned Off.
+        Regardless of the Proxy Mode, the device will never communicate with CUCM, MRA (CUCM via 
+        Expressway), or TMS via proxy.
+        Usage : Manual/Off/PACUrl/WPAD"""
+        
+        if mode == "Manual":
+             global __man_flag
+             __man_flag = 1
+        elif mode == "Off" or mode=="WPAD":
+             #__man_flag, PACUrl_flag
+             __man_flag = 0;PACUrl_flag=0;
+        elif mode == "PACUrl":
+            global __PACUrl_flag
+            __PACUrl_flag=1
+
+        return self.set_config(("NetworkServices", "HTTP", "Proxy", "Mode"), mode, output_debug)
+    
+    def set_http_proxy_url(self,url:str,output_debug:bool=False):
+        """Description: Requires user role: ADMIN, USER
+        Set the URL of the HTTP proxy server. Requires that the NetworkServices HTTP Proxy Mode is 
+        set to Manual.
+        Usage: Requires user role: ADMIN, USER
+        Set the URL of the HTTP proxy server. Requires that the NetworkServices HTTP Proxy Mode is 
+        set to Manual."""
+        global __man_flag
+        if __PACUrl_flag==0 and __man_flag==1:
             
-            if (response.status_code==401):
-                raise Exception("Authorisation Failed , Please check Credentials\n")
-            elif (response.status_code==400):
-                raise Exception("Connection Failed , Please check Connection\n")
-            elif (response.status_code==200):
-                #response_data = self.__return_type_parser(response,return_type = "json")
-                response_data = jxmlease.parse(response.text)
-                Name = response_data['Status']['UserInterface']['ContactInfo']['Name']
-                return response_data
-            else:
-                raise Exception("Unknown Exception\n") 
-           
-        except Exception as e:
-            return(e)
+            __man_flag = 0
+            return self.set_config(("NetworkServices", "HTTP", "Proxy", "Url"), url, output_debug)
+        else:
+            raise ConfigurationError("Please set proxy mode to manual with set_http_proxy_mode('Manual') and try again")
+    
+    def set_http_proxy_pacurl(self,url:str,output_debug:bool=False):
+        """Description: Set the URL of the PAC (Proxy Auto Configuration) script. Requires that the NetworkServices 
+        HTTP Proxy Mode is set to PACUrl
+        Usage: supply URL ,Requires user role: ADMIN, USER"""
+        global __PACUrl_flag
+        if __PACUrl_flag==1 and __man_flag==0:
+            
+            __PACUrl_flag = 0
+            return self.set_config(("NetworkServices", "HTTP", "Proxy", "PACUrl"), url, output_debug)
+        else:
+            raise ConfigurationError("Please set proxy mode to PACUrl with set_http_proxy_mode('PACUrl') and try again")
+    
+    def set_time_format(self, time_format:int,output_debug:bool=False):
+        """Description: Define the time format
+        Usage: 24/12, Requires user role: ADMIN, USER"""
         
+        return self.set_config(("Time", "TimeFormat"), f"{time_format}H", output_debug)
     
-    def get_device_backup(self):
-        """Description: Get device configuration backup
-        Usage: Call the function that returns the data in XML format file located in specified optional path with device name as file name"""
+    def set_standby_delay(self, delay:int=7, output_debug:bool=False):
+        """Descreiption: Define how long (in minutes) the device shall be in idle mode before it goes into standby mode. 
+        Requires the Standby Control to be enabled.
+        Usage: Integer (1..480), Requires user role: ADMIN, INTEGRATOR"""
         
-        url = f'http://{self.address}/configuration.xml'
-        try: 
-            configuration = requests.get(url, auth = HTTPBasicAuth(self.username,self.password), verify=self.ssl_verify)
-            if (configuration.status_code==401):
-                    raise Exception("Authorisation Failed , Please check Credentials\n")
-            elif (configuration.status_code==400):
-                    raise Exception("Connection Failed , Please check Connection\n")
-            elif (configuration.status_code==200):
-                device_name = jxmlease.parse(configuration.text)['Configuration']['SystemUnit']['Name']
-                with open(f"{device_name}.xml","w") as f:
-                    f.write(configuration.text)
-                f.close()
-            else:
-                raise Exception("Unknown Exception\n") 
-        except Exception as e:
-            return(e)
-            
+        return self.set_config(("Standby", "Delay"), int(delay), output_debug)
+    
+    
+    def set_standby_signage_refresh_interval(self, interval:int=0,output_debug:bool=False):
+        """Description: You can use this setting to force a web page to refresh at regular intervals. This is useful for 
+        web pages that are not able to refresh themselves. It is not recommended to set a refresh 
+        interval with the interactive mode.
+        Usage: Integer (0..1440), Requires user role: ADMIN, INTEGRATOR"""
         
-    def get_device_video_config(self,output_debug : bool =False):
-        """Description: get device video configuration
-        Usage: call the function that returns data in XML structure"""
+        return self.set_config(("Standby", "Signage", "RefreshInterval"), int(interval), output_debug)
+    
+    def set_ipv4_address(self, address:str,gateway:str,subnetmask:str,output_debug:bool=False):
+        """Requires user role: ADMIN, USER
+        Define the static IPv4 network address for the device. 
+        Define the IPv4 network subnet mask.
+        Define the IPv4 network gateway address. 
+        ****Applicable only when the Network IPv4 Assignment 
+        is set to Static
+        Usage: String (0, 64) a valid IPv4 address for IpV4 address and Gateway, and valid subnet mask for Subnet mask , Requires user role: ADMIN, USER"""
+        #DO NO TEST
+        return self._post_sequence([_config_xml(("Network", "IPv4", "Address"), address), _config_xml(("Network", "IPv4", "Gateway"), gateway), _config_xml(("Network", "IPv4", "SubnetMask"), subnetmask)], output_debug)
+    
+    def set_ipv6_address(self, address:str,gateway:str,output_debug:bool=False):
+        """Description: Define the static IPv6 network address for the device and its gateway.
+        ****Applicable only when the Network IPv6 
+        Assignment is set to Static.
+        Usage:String (0, 64) , A valid IPv6 address including a network mask. Example: 2001:DB8::/48 , 
+        Define the IPv6 network gateway address.  Requires user role: ADMIN, USER"""
+        
+        return self._post_sequence([_config_xml(("Network", "IPv6", "Address"), address), _config_xml(("Network", "IPv6", "Gateway"), gateway)], output_debug)
+        
+    def command_microphoneToggle_mute(self):
+        """Description: Toggle the microphone between muted and unmuted. Returns result along with Microphones Mute status.
+        Usage:Requires user role: ADMIN, INTEGRATOR, USER"""
+        print (self.__command_parser_return(self._TOGGLE_MUTE_PAYLOAD))
+        return self.get_status_audio_input_microphone_mute()
+    
+    _TOGGLE_MUTE_PAYLOAD = _command_xml(("Audio", "Microphones", "ToggleMute"))
+    
+    
+    def command_book_meeting(self,BookingId:str,Title:str,Duration:int=30,StartTime:str="Default"):
+        """Description: Book the meeting room for the specified period. If you don’t specify the start time and duration, 
+        the room will be booked from now on and for 30 minutes. Use get_booking_byID function to confirm if the meeting was scheduled.
+        Usage: Requires user role: ADMIN, USER.
+        Arguments:
+        BookingId:String (1, 128) , A unique identifier for the booking request.
+        Duration: Integer (0..1440), The duration of the meeting, in minutes. Default value: 30
+        StartTime:String (1, 128), The start time of the meeting in the following UTC format: YYYY-MM-DDThh:mm:ssZ. Example: 2022-07-20T01:29:00Z.
+        Title:String (1, 128), The title or subject field in the calendar booking. It will also be displayed on screen in the today’s bookings list."""
         
-        url = f'http://{self.address}/getxml?location=/Configuration/Video'
+        from datetime import datetime, timezone
+        __current_time = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        if StartTime == "Default":
+            StartTime = __current_time
+        return self.command(("Bookings", "Book"), BookingRequestUUID=BookingId, Duration=Duration, StartTime=StartTime, Title=Title)
+    
+    def __command_parser_return(self,payload):
         try:
-            configuration = requests.get(url, auth = HTTPBasicAuth(self.username,self.password), verify=self.ssl_verify)
-            if (configuration.status_code==401):
-                    raise Exception("Authorisation Failed , Please check Credentials\n")
-            elif (configuration.status_code==400):
-                    raise Exception("Connection Failed , Please check Connection\n")
-            elif (configuration.status_code==200):
-                if output_debug:
-                    print(configuration.text)
-                return(configuration.text)
-                #device_name = jxmlease.parse(configuration.text)['Configuration']['SystemUnit']['Name']
-                """with open(f"{device_name}_video_config.xml","w") as f:
-                    f.write(configuration.text)
-                f.close()"""
-            else:
-                raise Exception("Unknown Exception\n") 
+            url = f"{self.base_url}/putxml"
+            headers = {
+              'Content-Type': 'text/xml',
+            }
+            response = self._request("POST", url, headers=headers, data=payload)
+            return self._result("command", response.status_code, response.content)
         except Exception as e:
-            if output_debug:
-                print(e)
-            return(e)
-            
-    def get_audio_status(self,output_debug : bool = False):
-        """Description: Get audio status
-        Usage : call the function which returns data in XML structure"""
-
-        url = f'http://{self.address}/getxml?location=/Status/Audio'
+            return str(self._failed(e))
+    
+    def __post_parser_return(self,payload,output_debug):
+        if self.skip_unchanged and self._unchanged([payload]):
+            return self._skip_write([payload], output_debug)
+        if self._transaction is not None:
+            return self._transaction.add([payload], output_debug)
         try:
-            audio_status = requests.get(url, auth = HTTPBasicAuth(self.username,self.password), verify=self.ssl_verify)
-            if (audio_status.status_code==401):
-                    raise Exception("Authorisation Failed , Please check Credentials\n")
-            elif (audio_status.status_code==400):
-                    raise Exception("Connection Failed , Please check Connection\n")
-            elif (audio_status.status_code==200):
-                if output_debug:
-                    print(audio_status.text)
-                return(audio_status.text)
-        except Exception as e:
-            if output_debug:
-                print(e)
-            return(e)
-        
-    def _get_status_helper(func):
-        """Helper function to process requests and its response output for all status functions"""
-        @wraps(func)
-        def inner(self,*n):
-            url = func(self,*n)
+            url = f"{self.base_url}/putxml"
             headers = {
               'Content-Type': 'text/xml',
             }
-            try:
-                response_connect = requests.request("GET", url, headers=headers,auth=HTTPBasicAuth(username=self.username,password=self.password),verify=self.ssl_verify)
-                if (response_connect.status_code==401):
-                        raise Exception("Authorisation Failed , Please check Credentials\n")
-                elif (response_connect.status_code==400):
-                        raise Exception("Connection Failed , Please check Connection\n")
-                elif (response_connect.status_code==200):
-                    call = jxmlease.parse(response_connect.text)
-                    return(call)
-            except Exception as e:
-                return(e)
-        return inner
-            
-    @_get_status_helper
-    def get_status_audio_input_connectors(self):
-        """Description: Get the Audio input connectors Status 
-        Usage: Requires user role: ADMIN, USER"""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Audio/Input/Connectors'
-        return url
+            response = self._request("POST", url, headers=headers, data=payload)
+            result = self._result("configuration", response.status_code, response.content, output_debug)
+            if self._write_cache is not None:
+                self._write_through(_payload_leaves(payload), _config_written(result))
+            return result
+        except Exception as e:
+            self._write_through(None, False)
+            if output_debug:
+                print(e)
+            return self._failed(e)
+    
+    def _post_sequence(self, payloads : list, output_debug : bool):
+        """Post configuration payloads one after the other, stopping at the first one that does not succeed"""
+        if self._transaction is not None:
+            if self.skip_unchanged and self._unchanged(payloads):
+                return self._skip_write(payloads, output_debug)
+            return self._transaction.add(payloads, output_debug)
+        resp = None
+        for payload in payloads:
+            resp = self.__post_parser_return(payload,output_debug)
+            if not _config_written(resp):
+                break
+        return resp
     
-    @_get_status_helper
-    def get_status_audio_input_usbc_mute(self,n:int):
+    def __return_type_parser(response,return_type):
+        if return_type == "json":
+            return _parse_jxmlease(response.text)
+        elif return_type == "xml":
+            return response.text
+        else:
+            raise Exception("Unidentified return type requested, please choose xml or json")
+
+
+
+# The plain accessors of the xAPI are described by the tables below instead of being written out as methods.
+# Each one is compiled the first time it is looked up, on the class or an instance, and then replaces its _Accessor.
+_STATUS_ACCESSORS = {
+    # name: (path below Status, parameters, docstring), the method returns self.get_status(path)
+    "get_status_audio_input_connectors": ("Audio/Input/Connectors", "",
+        """Description: Get the Audio input connectors Status 
+        Usage: Requires user role: ADMIN, USER"""),
+    "get_status_audio_input_usbc_mute": ("Audio/Input/Connectors/USBC/{n}/Mute", "n: int",
         """Description: Shows whether the audio channel on a USB-C input connector is muted or not.
         Usage: Supply Channel number : n while calling the function, Requires user role: ADMIN, USER
-        Output: On/Off -> Mute"""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Audio/Input/Connectors/USBC/{n}/Mute'
-        return url
-    
-    @_get_status_helper
-    def get_status_audio_input_microphone_mute(self):
+        Output: On/Off -> Mute"""),
+    "get_status_audio_input_microphone_mute": ("Audio/Input/Connectors/Microphone/Mute", "",
         """Description: Shows whether the audio on a Microphone input connector is muted or not
         Usage: Requires user role: ADMIN, USER
-        output: On/Off -> Mute"""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Audio/Input/Connectors/Microphone/Mute'
-        return url
-    
-    @_get_status_helper
-    def get_status_audio_input_keyclick_attenuate(self):
+        output: On/Off -> Mute"""),
+    "get_status_audio_input_keyclick_attenuate": ("Audio/Input/KeyClick/Attenuate", "",
         """Description: Shows whether the device is automatically attenuating clicking noises, such as those detected 
         microphone signals caused by the typing of a keyboard.
         Usage: Requires user role: ADMIN, USER
         Output: False/True
         True: The attenuation of the microphone signal is turned on.
-        False: The attenuation of the microphone signal is turned off"""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Audio/Input/KeyClick/Attenuate'
-        return url
-    
-    @_get_status_helper
-    def get_status_audio_mic_music_mode(self):
+        False: The attenuation of the microphone signal is turned off"""),
+    "get_status_audio_mic_music_mode": ("Audio/Microphones/MusicMode", "",
         """Description: Shows whether MusicMode is on or off.
         Usage: Requires user role: ADMIN, USER
-        Output: On/Off -> MusicMode"""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Audio/Microphones/MusicMode'
-        return url
-    
-    @_get_status_helper
-    def get_status_audio_mic_muted(self):
+        Output: On/Off -> MusicMode"""),
+    "get_status_audio_mic_muted": ("Audio/Microphones/Mute", "",
         """Description: Shows whether the microphones are muted.
         Usage: Requires user role: ADMIN, USER
-        Output: On/Off -> Mute"""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Audio/Microphones/Mute'
-        return url
-    
-    @_get_status_helper
-    def get_status_audio_output_measured_hdmiarcDelay(self):
+        Output: On/Off -> Mute"""),
+    "get_status_audio_output_measured_hdmiarcDelay": ("Audio/Output/MeasuredHdmiArcDelay", "",
         """Description: Shows the measured audio delay of the device connected to the HDMI connector. This delay 
         is measured through the HDMI audio return channel, and will secure good lip-synchronization 
         between audio and video.
         Usage: Requires user role: ADMIN, USER
-        Output: Integer -> The measured audio delay in milliseconds"""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Audio/Output/MeasuredHdmiArcDelay'
-        return url
-    
-    @_get_status_helper
-    def get_status_audio_output_measured_hdmicecDelay(self):
+        Output: Integer -> The measured audio delay in milliseconds"""),
+    "get_status_audio_output_measured_hdmicecDelay": ("Audio/Output/MeasuredHdmiCecDelay", "",
         """Description: Shows the reported video delay of the device connected to the HDMI connector. This delay 
         is reported through the consumer electronics control (CEC) protocol, and will secure good 
         lip-synchronization between audio and video. 
         Usage: Requires user role: ADMIN, USER
-        Output: Integer -> The measured audio delay in milliseconds"""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Audio/Output/MeasuredHdmiCecDelay'
-        return url
-    
-    @_get_status_helper
-    def get_status_audio_volume_mute(self):
+        Output: Integer -> The measured audio delay in milliseconds"""),
+    "get_status_audio_volume_mute": ("Audio/VolumeMute", "",
         """Description: Shows whether the device volume is set to mute.
         Usage: Requires user role: ADMIN, USER
-        Output: On/Off -> MusicMode"""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Audio/VolumeMute'
-        return url
-    
-    @_get_status_helper
-    def get_status_bookings_currentId(self):
+        Output: On/Off -> MusicMode"""),
+    "get_status_bookings_currentId": ("Bookings/Current/Id", "",
         """Description: The ID of the on going booking event, if any. 
         Usage: Requires user role: ADMIN, USER
-        Output: String -> Booking ID"""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Bookings/Current/Id'
-        return url
-    
-    @_get_status_helper
-    def get_status_call_answered(self,n:int):
+        Output: String -> Booking ID"""),
+    "get_status_call_answered": ("Call/{n}/AnswerState", "n: int",
         """Description: Indicates if a call is answered, ignored or has been automatically answered by a device.
         Usage: Supply the nth call you want to check, Requires user role: ADMIN, USER
-        Output: Unanswered/Ignored/Autoanswered/Answered -> Answer State of nth call"""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Call/{n}/AnswerState'
-        return url
-    
-    @_get_status_helper
-    def get_status_call_answered_transferredFrom(self,n:int):
+        Output: Unanswered/Ignored/Autoanswered/Answered -> Answer State of nth call"""),
+    "get_status_call_answered_transferredFrom": ("Call/{n}/AttendedTransferFrom", "n: int",
         """Description: Shows the CallId for the call the current call was transferred from.
         Usage: Supply the nth call you want to check, Requires user role: ADMIN, USER
-        Output: Integer -> caller id of nth transferred call"""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Call/{n}/AttendedTransferFrom'
-        return url
-    
-    @_get_status_helper
-    def get_status_call_callbackNumber(self,n:int):
+        Output: Integer -> caller id of nth transferred call"""),
+    "get_status_call_callbackNumber": ("Call/{n}/CallbackNumber", "n: int",
         """Description: Shows the remote (far end) number or URI of an incoming or outgoing call, including the call 
         protocol, for call back.
         Usage: Supply the nth call you want to check, Requires user role: ADMIN, USER
-        Output: String -> Call back number/uri"""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Call/{n}/CallbackNumber'
-        return url
-    
-    @_get_status_helper
-    def get_status_call_callType(self,n:int):
+        Output: String -> Call back number/uri"""),
+    "get_status_call_callType": ("Call/{n}/CallType", "n: int",
         """Description: Shows the call type of the incoming or outgoing call.
         Usage: Supply the nth call you want to check, Requires user role: ADMIN, USER
         Output: Video/Audio/AudioCanEscalate/ForwardAllCall/Unknown
-        """
-        
-        url = f'http://{self.address}/getxml?location=/Status/Call/{n}/CallType'
-        return url
-    
-    @_get_status_helper
-    def get_status_call_deviceType(self,n:int):
+        """),
+    "get_status_call_deviceType": ("Call/{n}/DeviceType", "n: int",
         """Description: Shows where the call is connected to.
         Usage: Supply the nth call you want to check, Requires user role: ADMIN, USER
         Output: Endpoint/MCU 
         Endpoint: It is a point-to-point call to another device.
         MCU: The call is to a multipoint conferencing unit (MCU) in the network, or a MultiSite call hosted on a device.
-        """
-        
-        url = f'http://{self.address}/getxml?location=/Status/Call/{n}/DeviceType'
-        return url
-    
-    @_get_status_helper
-    def get_status_call_direction(self,n:int):
-       """Description: States the direction of the call initiation.
+        """),
+    "get_status_call_direction": ("Call/{n}/Direction", "n: int",
+        """Description: States the direction of the call initiation.
        Usage: Supply the nth call you want to check, Requires user role: ADMIN, USER
        Output: Incoming/Outgoing
-       """
-       url = f'http://{self.address}/getxml?location=/Status/Call/{n}/Direction'
-       return url
-   
-    @_get_status_helper
-    def get_status_call_displayName(self,n:int):
-       """Description: Shows the name of the remote (far end) participant in an incoming or outgoing call.
+       """),
+    "get_status_call_displayName": ("Call/{n}/DisplayName", "n: int",
+        """Description: Shows the name of the remote (far end) participant in an incoming or outgoing call.
        Usage: Supply the nth call you want to check, Requires user role: ADMIN, USER
        Output: String
-       """
-       url = f'http://{self.address}/getxml?location=/Status/Call/{n}/DisplayName'
-       return url   
-   
-    @_get_status_helper
-    def get_status_call_encryptionType(self,n:int):
-       """Description: Shows the encryption type of the call.
+       """),
+    "get_status_call_encryptionType": ("Call/{n}/Encryption/Type", "n: int",
+        """Description: Shows the encryption type of the call.
        Usage: Supply the nth call you want to check, Requires user role: ADMIN, USER
        Output: None/Aes-128
-       """
-       url = f'http://{self.address}/getxml?location=/Status/Call/{n}/Encryption/Type'
-       return url
-    
-    @_get_status_helper
-    def get_status_call_duration(self,n:int):
-       """Description:Shows the duration of a call (in seconds).
+       """),
+    "get_status_call_duration": ("Call/{n}/Duration", "n: int",
+        """Description:Shows the duration of a call (in seconds).
        Usage: Supply the nth call you want to check, Requires user role: ADMIN, USER
        Output: Integer
-       """
-       url = f'http://{self.address}/getxml?location=/Status/Call/{n}/Duration'
-       return url
-   
-    @_get_status_helper
-    def get_status_call_facilityServiceId(self,n:int):
-       """Description: When calling a facility service, the facility service id is shown. Otherwise the value 0 is returned.
+       """),
+    "get_status_call_facilityServiceId": ("Call/{n}/FacilityServiceId", "n: int",
+        """Description: When calling a facility service, the facility service id is shown. Otherwise the value 0 is returned.
        Usage: Supply the nth call you want to check, Requires user role: ADMIN, USER
        Output: Integer 0..5
-       """
-       url = f'http://{self.address}/getxml?location=/Status/Call/{n}/FacilityServiceId'
-       return url
-   
-    @_get_status_helper
-    def get_status_call_holdReason(self,n:int):
-       """Description: Shows the reason the current outgoing call was put on hold.
+       """),
+    "get_status_call_holdReason": ("Call/{n}/HoldReason", "n: int",
+        """Description: Shows the reason the current outgoing call was put on hold.
        Usage: Supply the nth call you want to check, Requires user role: ADMIN, USER
        Output:Conference/Transfer/None
        Conference: On hold while the call is being merged into a conference. 
        Transfer: On hold while the call is being transferred. 
        None: All other instances.
-       """
-       url = f'http://{self.address}/getxml?location=/Status/Call/{n}/HoldReason'
-       return url
-     
-    @_get_status_helper
-    def get_status_call_placedOnHold(self,n:int):
-       """Description: Shows the placed on hold status of the call.
+       """),
+    "get_status_call_placedOnHold": ("Call/{n}/PlacedOnHold", "n: int",
+        """Description: Shows the placed on hold status of the call.
        Usage: Supply the nth call you want to check, Requires user role: ADMIN, USER
        Output: True/False
-       """
-       url = f'http://{self.address}/getxml?location=/Status/Call/{n}/PlacedOnHold'
-       return url
-   
-    @_get_status_helper
-    def get_status_call_ice(self,n:int):
-       """Description: ICE is a feature that enables two sides of a call to send media (video and audio) directly 
+       """),
+    "get_status_call_ice": ("Call/{n}/Ice", "n: int",
+        """Description: ICE is a feature that enables two sides of a call to send media (video and audio) directly 
        between each other, if a direct network path has been found through ICE negotiation. This 
        status reflects the result of that negotiation.
        Usage: Supply the nth call you want to check, Requires user role: ADMIN, USER
@@ -372,150 +2697,85 @@ class Cisco_RoomOS:
        Passed: A direct network path was found and is being used.
        Failed: A direct network path was not found, and media will most likely flow through an 
        intermediary component
-       """
-       url = f'http://{self.address}/getxml?location=/Status/Call/{n}/Ice'
-       return url
-   
-    @_get_status_helper
-    def get_status_callProtocol(self,n:int):
-       """Description: Shows the call protocol of the incoming or outgoing call.
+       """),
+    "get_status_callProtocol": ("Call/{n}/Protocol", "n: int",
+        """Description: Shows the call protocol of the incoming or outgoing call.
        Usage: Supply the nth call you want to check, Requires user role: ADMIN, USER
        Output: H320/H323/SIP/Spark/Unknown/WebRTC
-       """
-       url = f'http://{self.address}/getxml?location=/Status/Call/{n}/Protocol'
-       return url
-   
-    @_get_status_helper
-    def get_status_call_receiveRate(self,n:int):
-       """Description: Shows the receive bandwidth in the call in kilobits per second (kbps).
+       """),
+    "get_status_call_receiveRate": ("Call/{n}/ReceiveCallRate", "n: int",
+        """Description: Shows the receive bandwidth in the call in kilobits per second (kbps).
        Usage: Supply the nth call you want to check, Requires user role: ADMIN, USER
        Output: Integer
-       """
-       url = f'http://{self.address}/getxml?location=/Status/Call/{n}/ReceiveCallRate'
-       return url
-   
-    @_get_status_helper
-    def get_status_call_remoteNumber(self,n:int):
-       """Description: Shows the remote (far end) number or URI of an incoming or outgoing call.
+       """),
+    "get_status_call_remoteNumber": ("Call/{n}/RemoteNumber", "n: int",
+        """Description: Shows the remote (far end) number or URI of an incoming or outgoing call.
        Usage: Supply the nth call you want to check, Requires user role: ADMIN, USER
        Output: String
-       """
-       url = f'http://{self.address}/getxml?location=/Status/Call/{n}/RemoteNumber'
-       return url
-   
-    @_get_status_helper
-    def get_status_call_transmitRate(self,n:int):
-       """Description: Shows the transmit bandwidth in the call in kilobits per second (kbps).
+       """),
+    "get_status_call_transmitRate": ("Call/{n}/TransmitCallRate", "n: int",
+        """Description: Shows the transmit bandwidth in the call in kilobits per second (kbps).
        Usage: Supply the nth call you want to check, Requires user role: ADMIN, USER
        Output: Integer
-       """
-       url = f'http://{self.address}/getxml?location=/Status/Call/{n}/TransmitCallRate'
-       return url
-   
-    @_get_status_helper
-    def get_status_call_status(self,n:int):
-       """Description: Shows the status of a call. 
+       """),
+    "get_status_call_status": ("Call/{n}/Status", "n: int",
+        """Description: Shows the status of a call. 
        Usage: Supply the nth call you want to check, Requires user role: ADMIN, USER
        Output: Idle/Dialling/Ringing/Connecting/Connected/Disconnecting/OnHold/EarlyMedia/Preserved/RemotePreserved
-       """
-       url = f'http://{self.address}/getxml?location=/Status/Call/{n}/Status'
-       return url
-   
-    @_get_status_helper
-    def get_status_camera_capabilities(self,n:int):
-       """Description: Shows the camera capabilities (ptzf = pan, tilt, zoom, focus).
+       """),
+    "get_status_camera_capabilities": ("Cameras/Camera/{n}/Capabilities/Options", "n: int",
+        """Description: Shows the camera capabilities (ptzf = pan, tilt, zoom, focus).
        Usage: Supply the nth camera you want to check, Requires user role: ADMIN, INTEGRATOR, USER, ROOMCONTROL
        Output: String
-       """
-       url = f'http://{self.address}/getxml?location=/Status/Cameras/Camera/{n}/Capabilities/Options'
-       return url
-    
-    @_get_status_helper
-    def get_status_camera_connected(self,n:int):
-       """Description: Shows if the camera is connected or not.
+       """),
+    "get_status_camera_connected": ("Cameras/Camera/{n}/Connected", "n: int",
+        """Description: Shows if the camera is connected or not.
        Usage: Supply the nth camera you want to check, Requires user role: ADMIN, INTEGRATOR, USER, ROOMCONTROL
        Output: True/False
-       """
-       url = f'http://{self.address}/getxml?location=/Status/Cameras/Camera/{n}/Connected'
-       return url
-   
-    @_get_status_helper
-    def get_status_camera_lightingConditions(self,n:int):
-       """Description: Shows if the camera is connected or not.
+       """),
+    "get_status_camera_lightingConditions": ("Cameras/Camera/{n}/LightingConditions", "n: int",
+        """Description: Shows if the camera is connected or not.
        Usage: Supply the nth camera you want to check, Requires user role: ADMIN, INTEGRATOR, USER, ROOMCONTROL
        Output: Unknown/Good/Dark/Backlight
        Unknown: The camera is turned off or does not support this functionality.
        Good: The lighting is at a good level.
        Dark: The lighting is too low. 
        Backlight: There is a high level of backlight in the image.
-       """
-       url = f'http://{self.address}/getxml?location=/Status/Cameras/Camera/{n}/LightingConditions'
-       return url
-   
-    @_get_status_helper
-    def get_status_camera_manufacturer(self,n:int):
-       """Description: Shows the manufacturer of the camera.
+       """),
+    "get_status_camera_manufacturer": ("Cameras/Camera/{n}/Manufacturer", "n: int",
+        """Description: Shows the manufacturer of the camera.
        Usage: Supply the nth camera you want to check, Requires user role: ADMIN, INTEGRATOR, USER, ROOMCONTROL
        Output: String
-       """
-       url = f'http://{self.address}/getxml?location=/Status/Cameras/Camera/{n}/Manufacturer'
-       return url
-   
-    @_get_status_helper
-    def get_status_camera_model(self,n:int):
-       """Description: Shows the camera model.
+       """),
+    "get_status_camera_model": ("Cameras/Camera/{n}/Model", "n: int",
+        """Description: Shows the camera model.
        Usage: Supply the nth camera you want to check, Requires user role: ADMIN, INTEGRATOR, USER, ROOMCONTROL
        Output: String
-       """
-       url = f'http://{self.address}/getxml?location=/Status/Cameras/Camera/{n}/Model'
-       return url
-   
-    
-    @_get_status_helper
-    def get_status_camera_positionPan(self,n:int):
-       """Description: Shows the current pan (move left and right) position of the camera. The value range depends on camera type.
+       """),
+    "get_status_camera_positionPan": ("Cameras/Camera/{n}/Position/Pan", "n: int",
+        """Description: Shows the current pan (move left and right) position of the camera. The value range depends on camera type.
        Usage: Supply the nth camera you want to check, Requires user role: ADMIN, INTEGRATOR, USER, ROOMCONTROL
        Output: -10000..10000
-       """
-       url = f'http://{self.address}/getxml?location=/Status/Cameras/Camera/{n}/Position/Pan'
-       return url
-   
-    @_get_status_helper
-    def get_status_camera_positionTilt(self,n:int):
-       """Description: Shows the current tilt (move up and down) position of the camera. The value range depends on camera type.
+       """),
+    "get_status_camera_positionTilt": ("Cameras/Camera/{n}/Position/Tilts", "n: int",
+        """Description: Shows the current tilt (move up and down) position of the camera. The value range depends on camera type.
        Usage: Supply the nth camera you want to check, Requires user role: ADMIN, INTEGRATOR, USER, ROOMCONTROL
        Output: -2500..2500
-       """
-       
-       url = f'http://{self.address}/getxml?location=/Status/Cameras/Camera/{n}/Position/Tilts'
-       return url
-     
-        
-    @_get_status_helper
-    def get_status_camera_positionZoom(self,n:int):
-       """Description: Shows the current zoom (zoom in and out) position of the camera. The value range depends on camera type.
+       """),
+    "get_status_camera_positionZoom": ("Cameras/Camera/{n}/Position/Zoom", "n: int",
+        """Description: Shows the current zoom (zoom in and out) position of the camera. The value range depends on camera type.
        Usage: Supply the nth camera you want to check, Requires user role: ADMIN, INTEGRATOR, USER, ROOMCONTROL
        Output: 0..11800
-       """
-       
-       url = f'http://{self.address}/getxml?location=/Status/Cameras/Camera/{n}/Position/Zoom'
-       return url
-   
-    @_get_status_helper
-    def get_status_speakerTrack_activeConnector(self):
-       """Description: Shows the number of the connector that a camera with speaker tracking support is connected 
+       """),
+    "get_status_speakerTrack_activeConnector": ("Cameras/SpeakerTrack/ActiveConnector", "",
+        """Description: Shows the number of the connector that a camera with speaker tracking support is connected 
        to. If it is a SpeakerTrack 60 camera, it is the connector number for the camera that is currently 
        chosen by the SpeakerTrack algorithm.
        This status is not applicable for Room Kit Mini, Desk Pro, Desk Limited Edition, or Boards.
        Usage: Requires user role: ADMIN, INTEGRATOR, USER, ROOMCONTROL
        Output: Integer
-       """
-       
-       url = f'http://{self.address}/getxml?location=/Status/Cameras/SpeakerTrack/ActiveConnector'
-       return url
-   
-    @_get_status_helper
-    def get_status_speakerTrack_availability(self):
+       """),
+    "get_status_speakerTrack_availability": ("Cameras/SpeakerTrack/Availability", "",
         """Description: The product may support speaker tracking (which also includes best overview), or only the best 
         overview feature. This status shows whether or not that feature is available.
         Usage:Requires user role: ADMIN, INTEGRATOR, USER, ROOMCONTROL 
@@ -524,76 +2784,40 @@ class Cisco_RoomOS:
         Cameras SpeakerTrack Mode: Off
         Unavailable: Hardware for speaker tracking / best overview is not found. 
         Available: Hardware for speaker tracking / best overview is found, and it is possible to 
-        turn the feature on or off from the user interface"""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Cameras/SpeakerTrack/Availability'
-        return url
-    
-    @_get_status_helper
-    def get_status_speakerTrack_status(self):
+        turn the feature on or off from the user interface"""),
+    "get_status_speakerTrack_status": ("Cameras/SpeakerTrack/Status", "",
         """Description: The product may support speaker tracking (which also includes best overview), or only the best 
         overview feature. This status shows whether or not that feature is active
         Usage:Requires user role: ADMIN, INTEGRATOR, USER, ROOMCONTROL 
         Output: Active/Inactive
         Active: Speaker tracking / best overview is active.
-        Inactive: Speaker tracking / best overview is inactive."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Cameras/SpeakerTrack/Status'
-        return url
-
-    
-    @_get_status_helper
-    def get_status_capabilities_maxActiveCalls(self):
+        Inactive: Speaker tracking / best overview is inactive."""),
+    "get_status_capabilities_maxActiveCalls": ("Capabilities/Conference/MaxActiveCalls", "",
         """Description:Shows the maximum number of simultaneous active calls. Calls that are set on hold/transfer are not counted as active.
         Usage:Requires user role: ADMIN, USER. 
         Output:0..5
-        """
-        
-        url = f'http://{self.address}/getxml?location=/Status/Capabilities/Conference/MaxActiveCalls'
-        return url
-    
-    @_get_status_helper
-    def get_status_capabilities_maxAudioCalls(self):
+        """),
+    "get_status_capabilities_maxAudioCalls": ("Capabilities/Conference/MaxAudioCalls", "",
         """Description:Shows the maximum number of simultaneous audio calls that is supported.
         Usage:Requires user role: ADMIN, USER.
         Output:Integer
-        """
-        
-        url = f'http://{self.address}/getxml?location=/Status/Capabilities/Conference/MaxAudioCalls'
-        return url
-    
-    @_get_status_helper
-    def get_status_capabilities_maxVideoCalls(self):
+        """),
+    "get_status_capabilities_maxVideoCalls": ("Capabilities/Conference/MaxVideoCalls", "",
         """Description:Shows the maximum number of simultaneous video calls that is supported.
         Usage:Requires user role: ADMIN, USER.
         Output:Integer
-        """
-        
-        url = f'http://{self.address}/getxml?location=/Status/Capabilities/Conference/MaxVideoCalls'
-        return url
-    
-    @_get_status_helper
-    def get_status_capabilities_maxCalls(self):
+        """),
+    "get_status_capabilities_maxCalls": ("Capabilities/Conference/MaxCalls", "",
         """Description:Shows the maximum number of simultaneous calls.
         Usage: Requires user role: ADMIN, USER.
         Output:0..5
-        """
-        
-        url = f'http://{self.address}/getxml?location=/Status/Capabilities/Conference/MaxCalls'
-        return url
-    
-    @_get_status_helper
-    def get_status_conference_activeSpeaker_callId(self):
+        """),
+    "get_status_conference_activeSpeaker_callId": ("Conference/ActiveSpeaker/CallId", "",
         """Description:Shows the CallId of the current active speaker.
         Usage:Requires user role: ADMIN, USER
         Output: Integer
-        """
-        
-        url = f'http://{self.address}/getxml?location=/Status/Conference/ActiveSpeaker/CallId'
-        return url
-    
-    @_get_status_helper
-    def get_status_conferenece_authRequest(self,n:int):
+        """),
+    "get_status_conferenece_authRequest": ("Conference/Call/{n}/AuthenticationRequest", "n: int",
         """Description:This status is only relevant for Cisco Webex registered devices. When this status has another 
         value than "None" the device is waiting for an authentication response. Use the Conference 
         Call AuthenticationResponse command to give the response.
@@ -604,221 +2828,109 @@ class Cisco_RoomOS:
         HostPinOrGuest: You must either provide a host PIN, or join as a Guest without PIN.
         HostPinOrGuestPin: You must either provide a host PIN or a guest PIN.
         PanelistPin: You must provide a Panelist PIN for joining an Event Center event as panelist.
-        """
-        
-        url = f'http://{self.address}/getxml?location=/Status/Conference/Call/{n}/AuthenticationRequest'
-        return url
-    
-    @_get_status_helper
-    def get_status_conferenece_bookingId(self,n:int):
+        """),
+    "get_status_conferenece_bookingId": ("Conference/Call/{n}/BookingId", "n: int",
         """Description:Shows the booking ID of a conference (if assigned). The booking ID can be used for easy 
         identification of a call or conference.
         Usage: Supply nth call where n is an integer,Requires user role: ADMIN, USER
         Output: String : Booking ID
-        """
-        
-        url = f'http://{self.address}/getxml?location=/Status/Conference/Call/{n}/BookingId'
-        return url
-    
-    
-    @_get_status_helper
-    def get_status_fecc_presetsNumber(self,n:int):
+        """),
+    "get_status_fecc_presetsNumber": ("Conference/Call/{n}/Capabilities/FECC/NumberOfPresets", "n: int",
         """Description: Shows the number of presets available for the input sources at a far end site.
         Usage: Supply nth call where n is an integer,Requires user role: ADMIN, USER
         Output: 1..15 : Denoting the number of presets.
-        """
-        
-        url = f'http://{self.address}/getxml?location=/Status/Conference/Call/{n}/Capabilities/FECC/NumberOfPresets'
-        return url
-    
-    @_get_status_helper
-    def get_status_fecc_mode(self,n:int):
+        """),
+    "get_status_fecc_mode": ("Conference/Call/{n}/Capabilities/FECC/Mode", "n: int",
         """Description: Shows whether or not you have permission to control the input sources at a far end site.
         Usage: Supply nth call where n is an integer,Requires user role: ADMIN, USER
         Output: On/Off
         On: Far end input source control is permitted.
         Off: Far end input source control is not permitted
-        """
-        
-        url = f'http://{self.address}/getxml?location=/Status/Conference/Call/{n}/Capabilities/FECC/Mode'
-        return url
-    
-    @_get_status_helper
-    def get_status_fecc_inputSource_name(self,n:int,i:int):
+        """),
+    "get_status_fecc_inputSource_name": ("Conference/Call/{n}/Capabilities/FECC/Source/{i}/Name", "n: int, i: int",
         """Description: Shows the name of an input source that can be connected at a far end site.
         Usage: Supply nth call and ith source where n and i are integers, Requires user role: ADMIN, USER
         Output: String : Denoting the name of the selected input source.
-        """
-        
-        url = f'http://{self.address}/getxml?location=/Status/Conference/Call/{n}/Capabilities/FECC/Source/{i}/Name'
-        return url
-    
-    
-    @_get_status_helper
-    def get_status_fecc_inputSource_ID(self,n:int,i:int):
+        """),
+    "get_status_fecc_inputSource_ID": ("Conference/Call/{n}/Capabilities/FECC/Source/{i}/SourceId", "n: int, i: int",
         """Description: Shows the ID of an input source that can be connected at a far end site.
         Usage: Supply nth call and ith source where n and i are integers, Requires user role: ADMIN, USER
         Output: Integer:Denoting the Source ID.
-        """
-        
-        url = f'http://{self.address}/getxml?location=/Status/Conference/Call/{n}/Capabilities/FECC/Source/{i}/SourceId'
-        return url
-    
-    @_get_status_helper
-    def get_status_conference_capabilities_hold(self,n:int):
+        """),
+    "get_status_conference_capabilities_hold": ("Conference/Call/{n}/Capabilities/Hold", "n: int",
         """Description: Indicates whether the far-end site can be placed on hold or not.
         Usage: Supply nth call where n is an integers, Requires user role: ADMIN, USER
         Output: True/False
-        """
-        
-        url = f'http://{self.address}/getxml?location=/Status/Conference/Call/{n}/Capabilities/Hold/'
-        return url
-    
-    
-    @_get_status_helper
-    def get_status_conference_DND(self):
+        """),
+    # Did not return, needs to be checked later
+    "get_status_conference_DND": ("Conference/DoNotDisturb", "",
         """Description: Shows whether DoNotDisturb mode is switched on or not.
         Usage: Requires user role:  ADMIN, INTEGRATOR, USER
-        Output: Active/Inactive."""
-        # Did not return, needs to be checked later
-        url = f'http://{self.address}/getxml?location=/Status/Conference/DoNotDisturb'
-        return url
-    
-    @_get_status_helper
-    def get_status_conference_sipSessionId(self,n:int):
+        Output: Active/Inactive."""),
+    # Did not return, needs to be checked later
+    "get_status_conference_sipSessionId": ("Conference/Call/{n}/Sip/SessionId", "n: int",
         """Description: Show the SIP SessionId, which is a CUCM identifier used to identify a specific call leg in a meeting.
         Usage:Supply nth call where n is an integers Requires user role:  ADMIN, USER
-        Output: String denoting the Session of ID for the supplied nth call."""
-        # Did not return, needs to be checked later
-        url = f'http://{self.address}/getxml?location=/Status/Conference/Call/{n}/Sip/SessionId'
-        return url
-    
-    @_get_status_helper
-    def get_status_fecc_inputSource_Id(self,n:int,i:int):
+        Output: String denoting the Session of ID for the supplied nth call."""),
+    "get_status_fecc_inputSource_Id": ("Conference/Call/{n}/Capabilities/FECC/Source/{i}/SourceId", "n: int, i: int",
         """Description: Shows the ID of an input source that can be connected at a far end site.
         Usage: Supply nth call and ith source where n and i are an integers, Requires user role: ADMIN, USER
         Output: Integer:Denoting the Source ID.
-        """
-        
-        url = f'http://{self.address}/getxml?location=/Status/Conference/Call/{n}/Capabilities/FECC/Source/{i}/SourceId'
-        return url
-    
-    @_get_status_helper
-    def get_status_fecc_inputSource_Options(self,n:int,i:int):
+        """),
+    "get_status_fecc_inputSource_Options": ("Conference/Call/{n}/Capabilities/FECC/Source/{i}/Options", "n: int, i: int",
         """Description: Shows available options for an input source that can be connected at a far end site (for a camera: p=pan; t=tilt; z=zoom; f=focus).
         Usage: Supply nth call and ith source where n and i are integers, Requires user role: ADMIN, USER
         Output: String Denoting options.
-        """
-        
-        url = f'http://{self.address}/getxml?location=/Status/Conference/Call/{n}/Capabilities/FECC/Source/{i}/Options'
-        return url
-    
-    @_get_status_helper
-    def get_status_h320_gatewayAddress(self):
+        """),
+    "get_status_h320_gatewayAddress": ("H320/Gateway/Id", "",
         """Description: Returns the IPv4 address of the ISDN Gateway, if the video conferencing device is paired to one.
         Usage: Requires user role: ADMIN, USER
-        Output: String denoting the gateway address"""
-        
-        url = f'http://{self.address}/getxml?location=/Status/H320/Gateway/Id'
-        return url
-    
-    @_get_status_helper
-    def get_status_h320_gatewayMode(self):
+        Output: String denoting the gateway address"""),
+    "get_status_h320_gatewayMode": ("H320/Gateway/Mode", "",
         """Description: Returns information on the type of calls the ISDN Gateway is configured for, if the video conferencing device is paired with an ISDN Link.
         Usage: Requires user role: ADMIN, USER
-        Output: BRI/External/G703/PRI/Unknown"""
-        
-        url = f'http://{self.address}/getxml?location=/Status/H320/Gateway/Mode'
-        return url
-    
-    @_get_status_helper
-    def get_status_h320_gatewayNumber(self):
+        Output: BRI/External/G703/PRI/Unknown"""),
+    "get_status_h320_gatewayNumber": ("H320/Gateway/Number", "",
         """Description: Returns the IPv6 address of the ISDN Gateway if the video conferencing device is paired to one.
         Usage: Requires user role: ADMIN, USER
-        Output: String denoting the IPv6 address"""
-        
-        url = f'http://{self.address}/getxml?location=/Status/H320/Gateway/Number'
-        return url
-    
-    @_get_status_helper
-    def get_status_h320_gatewayReason(self):
+        Output: String denoting the IPv6 address"""),
+    "get_status_h320_gatewayReason": ("H320/Gateway/Reason", "",
         """Description: Shows the reason for rejected Gateway registration. Only available if the video conferencing device is connected to an ISDN Link.
         Usage: Requires user role: ADMIN, USER
-        Output: String denoting the reason for rejection"""
-        
-        url = f'http://{self.address}/getxml?location=/Status/H320/Gateway/Reason'
-        return url
-    
-    @_get_status_helper
-    def get_status_h320_gatewayStatus(self):
+        Output: String denoting the reason for rejection"""),
+    "get_status_h320_gatewayStatus": ("H320/Gateway/Status", "",
         """Description: Returns the state of the H320 Gateway, if the video conferencing device is paired with an ISDN Link.
         Usage: Requires user role: ADMIN, USER
-        Output: Error/Inactive/OK/OKWithWarning/Warning/NoConnection"""
-        
-        url = f'http://{self.address}/getxml?location=/Status/H320/Gateway/Status'
-        return url
-    
-    @_get_status_helper
-    def get_status_h320_gatewayId(self):
+        Output: Error/Inactive/OK/OKWithWarning/Warning/NoConnection"""),
+    "get_status_h320_gatewayId": ("H320/Gateway/Id", "",
         """Description:Returns the unique identification of the H320 Gateway, if the video conferencing device is paired with an ISDN Link
         Usage: Requires user role: ADMIN, USER
-        Output: String denoting the Gateway ID"""
-        
-        url = f'http://{self.address}/getxml?location=/Status/H320/Gateway/Id'
-        return url
-    
-    @_get_status_helper
-    def get_status_h323_gatekeeperAddress(self):
+        Output: String denoting the Gateway ID"""),
+    "get_status_h323_gatekeeperAddress": ("H323/Gatekeeper/Address", "",
         """Description: Displays the IP address of the gatekeeper where the device is registered.
         Usage: Requires user role: ADMIN, USER
-        Output: String denoting the Gatekeeper IP address"""
-        
-        url = f'http://{self.address}/getxml?location=/Status/H323/Gatekeeper/Address'
-        return url
-    
-    @_get_status_helper
-    def get_status_h323_gatekeeperPort(self):
+        Output: String denoting the Gatekeeper IP address"""),
+    "get_status_h323_gatekeeperPort": ("H323/Gatekeeper/Port", "",
         """Description: Shows the port which is used when connecting to on the gatekeeper.
         Usage: Requires user role: ADMIN, USER
-        Output: Integer denoting the Gatekeeper Port"""
-        
-        url = f'http://{self.address}/getxml?location=/Status/H323/Gatekeeper/Port'
-        return url
-    
-    @_get_status_helper
-    def get_status_h323_gatekeeperRejection(self):
+        Output: Integer denoting the Gatekeeper Port"""),
+    "get_status_h323_gatekeeperRejection": ("H323/Gatekeeper/Reason", "",
         """Description: Shows the reason for rejected registration.
         Usage: Requires user role: ADMIN, USER
-        Output: String denoting the Gatekeeper Port"""
-        
-        url = f'http://{self.address}/getxml?location=/Status/H323/Gatekeeper/Reason'
-        return url
-    
-    @_get_status_helper
-    def get_status_h323_gatekeeperRegistration(self):
+        Output: String denoting the Gatekeeper Port"""),
+    "get_status_h323_gatekeeperRegistration": ("H323/Gatekeeper/Status", "",
         """Description: Shows the status for H.323 registration.
         Usage: Requires user role: ADMIN, USER
         Output:Enabled/Disabled
         Enabled: Registration is enabled.
-        Disabled: Registration is disable, because SIP is enabled."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/H323/Gatekeeper/Status'
-        return url
-    
-    
-    @_get_status_helper
-    def get_status_h323_gatewayMode(self):
+        Disabled: Registration is disable, because SIP is enabled."""),
+    "get_status_h323_gatewayMode": ("H323/Mode/Status", "",
         """Description: Shows the status for H.323 registration.
         Usage: Requires user role: ADMIN, USER
         Output:Enabled/Disabled
         Enabled: Registration is enabled.
-        Disabled: Registration is disable, because SIP is enabled."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/H323/Mode/Status'
-        return url
-    
-    @_get_status_helper
-    def get_status_h323_gatewayMode_reason(self):
+        Disabled: Registration is disable, because SIP is enabled."""),
+    "get_status_h323_gatewayMode_reason": ("H323/Mode/Reason", "",
         """Description: Shows whether there is a conflict between H.323 settings and xStatus H323 Mode Status.
         Usage: Requires user role: ADMIN, USER
         Output:String
@@ -826,328 +2938,150 @@ class Cisco_RoomOS:
         and the rest of the device settings.
         "SIP is enabled": When H.323 Mode is set to On and SIP is enabled on a device that does 
         not support the two simultaneously.
-        "Not available": When a device does not support H.323."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/H323/Mode/Reason'
-        return url
-    
-    @_get_status_helper
-    def get_status_cdpAddress(self):
+        "Not available": When a device does not support H.323."""),
+    "get_status_cdpAddress": ("Network/CDP/Address", "",
         """Description: Describes the functional capability for the switch in form of a device type. See documentation for CDP protocol for more information.
         Usage: Requires user role: ADMIN, USER
-        Output:String denoting Hex Value for CDP capabilities. Empty String will be returned if set to nothing."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Network/CDP/Address'
-        return url
-    
-    @_get_status_helper
-    def get_status_cdpCapabilities(self):
+        Output:String denoting Hex Value for CDP capabilities. Empty String will be returned if set to nothing."""),
+    "get_status_cdpCapabilities": ("Network/CDP/Capabilities", "",
         """Description: Returns the first network address of both receiving and sending devices.
         Usage: Requires user role: ADMIN, USER
-        Output:String denoting cdp IP address. Empty String will be returned if set to nothing."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Network/CDP/Capabilities'
-        return url
-    
-    @_get_status_helper
-    def get_status_cdpDeviceId(self):
+        Output:String denoting cdp IP address. Empty String will be returned if set to nothing."""),
+    "get_status_cdpDeviceId": ("Network/CDP/DeviceId", "",
         """Description: Identifies the name of the switch in form of a character string.
         Usage: Requires user role: ADMIN, USER
-        Output:String denoting cdp device ID. Empty String will be returned if set to nothing."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Network/CDP/DeviceId'
-        return url
-    
-    @_get_status_helper
-    def get_status_cdpDuplex(self):
+        Output:String denoting cdp device ID. Empty String will be returned if set to nothing."""),
+    "get_status_cdpDuplex": ("Network/CDP/Duplex", "",
         """Description: Indicates the status (duplex configuration) of the CDP broadcast interface. Used by network 
         operators to diagnose connectivity problems between adjacent network elements.
         Usage: Requires user role: ADMIN, USER
-        Output:String denoting Duplex Mode. Empty String will be returned if set to nothing."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Network/CDP/Duplex'
-        return url
-    
-    
-    @_get_status_helper
-    def get_status_cdpPlatform(self):
+        Output:String denoting Duplex Mode. Empty String will be returned if set to nothing."""),
+    "get_status_cdpPlatform": ("Network/CDP/Platform", "",
         """Description: Returns the hardware platform name of the switch connected to the device.
         Usage: Requires user role: ADMIN, USER
-        Output:String denoting Connected device Platform (applicable only for Cisco). Empty String will be returned if set to nothing."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Network/CDP/Platform'
-        return url
-    
-    @_get_status_helper
-    def get_status_cdpManagementIP(self):
+        Output:String denoting Connected device Platform (applicable only for Cisco). Empty String will be returned if set to nothing."""),
+    "get_status_cdpManagementIP": ("Network/CDP/PrimaryMgmtAddress", "",
         """Description: Returns the management address used to configure and monitor the switch the device is connected to.
         Usage: Requires user role: ADMIN, USER
-        Output:String denoting Primary management IP address. Empty String will be returned if set to nothing."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Network/CDP/PrimaryMgmtAddress'
-        return url
-    
-    @_get_status_helper
-    def get_status_cdpSysName(self):
+        Output:String denoting Primary management IP address. Empty String will be returned if set to nothing."""),
+    "get_status_cdpSysName": ("Network/CDP/SysName", "",
         """Description: Returns the SysName as configured in the switch the device is connected to.
         Usage: Requires user role: ADMIN, USER
-        Output:String denoting Connected device's sysname. Empty String will be returned if set to nothing."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Network/CDP/SysName'
-        return url
-    
-    @_get_status_helper
-    def get_status_cdpPortId(self):
+        Output:String denoting Connected device's sysname. Empty String will be returned if set to nothing."""),
+    "get_status_cdpPortId": ("Network/CDP/PortID", "",
         """Description: Returns the identification the switch uses of the port the device is connected to.
         Usage: Requires user role: ADMIN, USER
-        Output:String denoting Connected device's Interface or Port ID. Empty String will be returned if set to nothing."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Network/CDP/PortID'
-        return url
-    
-    @_get_status_helper
-    def get_status_cdpVoIPAppliancevlanId(self):
+        Output:String denoting Connected device's Interface or Port ID. Empty String will be returned if set to nothing."""),
+    "get_status_cdpVoIPAppliancevlanId": ("Network/CDP/VoIPApplianceVlanID", "",
         """Description: Identifies the VLAN used for VoIP traffic from the device to the switch. For more information see documentation of the IEEE 802.1Q protocol.
         Usage: Requires user role: ADMIN, USER
-        Output:String denoting VOIP appliance VLAN ID. Empty String will be returned if set to nothing."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Network/CDP/VoIPApplianceVlanID'
-        return url
-    
-    @_get_status_helper
-    def get_status_cdpVersion(self):
+        Output:String denoting VOIP appliance VLAN ID. Empty String will be returned if set to nothing."""),
+    "get_status_cdpVersion": ("Network/CDP/Version", "",
         """Description: Returns information about the software release version the switch is running.
         Usage: Requires user role: ADMIN, USER
-        Output:String denoting CDP version. Empty String will be returned if set to nothing."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Network/CDP/Version'
-        return url
-    
-    @_get_status_helper
-    def get_status_cdpVTPmanagement(self):
+        Output:String denoting CDP version. Empty String will be returned if set to nothing."""),
+    "get_status_cdpVTPmanagement": ("Network/CDP/VTPMgmtDomain", "",
         """Description: Returns the switch's configured VTP management domain name-string.
         Usage: Requires user role: ADMIN, USER
-        Output:String denoting VTP Management Domain. Empty String will be returned if set to nothing."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Network/CDP/VTPMgmtDomain'
-        return url
-    
-    @_get_status_helper
-    def get_status_dnsDomainName(self):
+        Output:String denoting VTP Management Domain. Empty String will be returned if set to nothing."""),
+    "get_status_dnsDomainName": ("Network/DNS/Domain/Name", "",
         """Description: Shows the domain name.
         Usage: Requires user role: ADMIN, USER
-        Output:String denoting Domain Name. Empty String will be returned if set to nothing."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Network/DNS/Domain/Name'
-        return url
-    
-    @_get_status_helper
-    def get_status_dnsServerAddress(self):
+        Output:String denoting Domain Name. Empty String will be returned if set to nothing."""),
+    "get_status_dnsServerAddress": ("Network/DNS/Server/Address", "",
         """Description: Shows the Ethernet speed in Mbps. The speed can be in full-duplex or half-duplex.
         Usage: Requires user role: ADMIN, USER
-        Output:String denoting DNS server Address"""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Network/DNS/Server/Address'
-        return url
-    
-    @_get_status_helper
-    def get_status_EthernetMACaddress(self):
+        Output:String denoting DNS server Address"""),
+    "get_status_EthernetMACaddress": ("Network/Ethernet/MacAddress", "",
         """Description: Shows the MAC (Media Access Control) address for the Ethernet interface.
         Usage: Requires user role: ADMIN, USER
-        Output:String denoting MAC address. Empty String will be returned if set to nothing."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Network/Ethernet/MacAddress'
-        return url
-    
-    @_get_status_helper
-    def get_status_EthernetSpeed(self):
+        Output:String denoting MAC address. Empty String will be returned if set to nothing."""),
+    "get_status_EthernetSpeed": ("Network/Ethernet/Speed", "",
         """Description: Shows the Ethernet speed in Mbps. The speed can be in full-duplex or half-duplex.
         Usage: Requires user role: ADMIN, USER
-        Output:10half/10full/100half/100full/1000full."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Network/Ethernet/Speed'
-        return url
-    
-
-    
-    @_get_status_helper
-    def get_status_Ipv4_address(self):
+        Output:10half/10full/100half/100full/1000full."""),
+    "get_status_Ipv4_address": ("Network/IPv4/Address", "",
         """Description: Shows the IPv4 address that uniquely identifies this device.
         Usage: Requires user role: ADMIN, USER
-        Output:String denoting IPv4 Address assigned."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Network/IPv4/Address'
-        return url
-    
-    @_get_status_helper
-    def get_status_Ipv4_gateway(self):
+        Output:String denoting IPv4 Address assigned."""),
+    "get_status_Ipv4_gateway": ("Network/IPv4/Gateway", "",
         """Description: Shows the address of the IPv4 gateway.
         Usage: Requires user role: ADMIN, USER
-        Output:String denoting the address of the IPv4 gateway."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Network/IPv4/Gateway'
-        return url
-    
-    @_get_status_helper
-    def get_status_Ipv4_subnetMask(self):
+        Output:String denoting the address of the IPv4 gateway."""),
+    "get_status_Ipv4_subnetMask": ("Network/IPv4/SubnetMask", "",
         """Description: Shows the subnet mask which determines which subnet an IPv4 address belongs to.
         Usage: Requires user role: ADMIN, USER
-        Output:String denoting the subnet mask of the unit."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Network/IPv4/SubnetMask'
-        return url
-    
-    @_get_status_helper
-    def get_status_Ipv6_address(self):
+        Output:String denoting the subnet mask of the unit."""),
+    "get_status_Ipv6_address": ("Network/IPv6/Address", "",
         """Description: Shows the IPv6 address that uniquely identifies this device..
         Usage: Requires user role: ADMIN, USER
-        Output:String denoting IPv6 Address assigned."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Network/IPv6/Address'
-        return url
-    
-    @_get_status_helper
-    def get_status_Ipv6_gateway(self):
+        Output:String denoting IPv6 Address assigned."""),
+    "get_status_Ipv6_gateway": ("Network/IPv6/Gateway", "",
         """Description: Shows the address of the IPv6 gateway.
         Usage: Requires user role: ADMIN, USER
-        Output:String denoting the address of the IPv6 gateway."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Network/IPv6/Gateway'
-        return url
-    
-    @_get_status_helper
-    def get_status_voice_VLANID(self):
+        Output:String denoting the address of the IPv6 gateway."""),
+    "get_status_voice_VLANID": ("Network/VLAN/Voice/VlanId", "",
         """Description: The feedback shows the VLAN Voice ID.
         Usage: Requires user role: ADMIN, USER
         Output:Off/1..4094
         Off: The VLAN Voice Mode is not enabled.
-        1..4094: VLAN Voice ID"""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Network/VLAN/Voice/VlanId'
-        return url
-    
-    @_get_status_helper
-    def get_status_Ipv6_linkLocalAddress(self):
+        1..4094: VLAN Voice ID"""),
+    "get_status_Ipv6_linkLocalAddress": ("Network/IPv6/LinkLocalAddress", "",
         """Description: Shows the IPv6 link local address that is displayed on the primary user interface.
         Usage: Requires user role: ADMIN, USER
-        Output:String denoting the address of the IPv6 Link Local Address."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Network/IPv6/LinkLocalAddress'
-        return url
-    
-    @_get_status_helper
-    def get_status_wifi_BSSID(self):
+        Output:String denoting the address of the IPv6 Link Local Address."""),
+    "get_status_wifi_BSSID": ("Network/Wifi/BSSID", "",
         """Description: Shows the Basic Service Set Identifiers (BSSID) used for the Wi-Fi connection.
         Usage: Requires user role: ADMIN, USER
-        Output:String denoting the BSSID of Wifi network. Empty string is returned if not appliable."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Network/Wifi/BSSID'
-        return url
-    
-    @_get_status_helper
-    def get_status_wifi_channel(self):
+        Output:String denoting the BSSID of Wifi network. Empty string is returned if not appliable."""),
+    "get_status_wifi_channel": ("Network/Wifi/Channel", "",
         """Description: Shows the channel used for the Wi-Fi connection.
         Usage: Requires user role: ADMIN, USER
-        Output:Integer denoting the wifi Channel. -1 if not applicable."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Network/Wifi/Channel'
-        return url
-    
-    @_get_status_helper
-    def get_status_wifi_InterfaceEnabled(self):
+        Output:Integer denoting the wifi Channel. -1 if not applicable."""),
+    "get_status_wifi_InterfaceEnabled": ("Network/Wifi/InterfaceEnabled", "",
         """Description: Indicates whether the Wi-Fi is enabled (on) or not (off).
         Usage: Requires user role: ADMIN, USER
-        Output:On/Off"""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Network/Wifi/InterfaceEnabled'
-        return url
-    
-    @_get_status_helper
-    def get_status_wifi_frequency(self):
+        Output:On/Off"""),
+    "get_status_wifi_frequency": ("Network/Wifi/Frequency", "",
         """Description: Shows the frequency corresponding to the Wi-Fi channel.
         Usage: Requires user role: ADMIN, USER
-        Output:Integer denoting the wifi Frequency. 0 if the wifi is not enabled."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Network/Wifi/Frequency'
-        return url
-    
-    @_get_status_helper
-    def get_status_wifi_InterfaceReason(self):
+        Output:Integer denoting the wifi Frequency. 0 if the wifi is not enabled."""),
+    "get_status_wifi_InterfaceReason": ("Network/Wifi/InterfaceReason", "",
         """Description: Provides a description of why the Wi-Fi interface is enabled or not.
         Usage: Requires user role: ADMIN, USER
-        Output: String denoting the reason for interface status and config value."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Network/Wifi/InterfaceReason'
-        return url
-    
-    @_get_status_helper
-    def get_status_wifi_MacAddress(self):
+        Output: String denoting the reason for interface status and config value."""),
+    "get_status_wifi_MacAddress": ("Network/Wifi/MacAddress", "",
         """Description: Shows the MacAddress used for the Wi-Fi connection.
         Usage: Requires user role: ADMIN, USER
-        Output:String denoting the MAC address of Wifi adapter."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Network/Wifi/MacAddress'
-        return url
-    
-    @_get_status_helper
-    def get_status_wifi_RawSSID(self):
+        Output:String denoting the MAC address of Wifi adapter."""),
+    "get_status_wifi_RawSSID": ("Network/Wifi/RawSSID", "",
         """Description: Shows the Raw SSID of the Wi-Fi connection.
         Usage: Requires user role: ADMIN, USER
-        Output:String denoting the Raw SSID of Wifi Connection. Empty string is returned if not appliable."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Network/Wifi/RawSSID'
-        return url
-    
-    @_get_status_helper
-    def get_status_wifi_Reason(self):
+        Output:String denoting the Raw SSID of Wifi Connection. Empty string is returned if not appliable."""),
+    "get_status_wifi_Reason": ("Network/Wifi/Reason", "",
         """Description: Shows the reason defined for the Wi-Fi connection, if applicable.
         Usage: Requires user role: ADMIN, USER
-        Output:String denoting the Reason for the Wifi connection. Empty string is returned if not appliable."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Network/Wifi/Reason'
-        return url
-   
-    @_get_status_helper
-    def get_status_wifi_Phase2Method(self):
+        Output:String denoting the Reason for the Wifi connection. Empty string is returned if not appliable."""),
+    "get_status_wifi_Phase2Method": ("Network/Wifi/Phase2Method", "",
         """Description: Shows the Phase2Method used for the Wi-Fi connection, if applicable.
         Usage: Requires user role: ADMIN, USER
-        Output:String denoting the Method used for the Wifi connection. Empty string is returned if not appliable."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Network/Wifi/Phase2Method'
-        return url
-    
-    @_get_status_helper
-    def get_status_wifi_Region(self):
+        Output:String denoting the Method used for the Wifi connection. Empty string is returned if not appliable."""),
+    "get_status_wifi_Region": ("Network/Wifi/Region", "",
         """Description: Shows the region of the Wi-Fi connection.
         Usage: Requires user role: ADMIN, USER
-        Output:The region code. If the device doesn't receive a region code from the access point, the value will be '00'. If there is no wifi at all, Empty string will be returned."""
-        
-        url = f'http://{self.address}/getxml?location=/Status/Network/Wifi/Region'
-        return url
-    
-    
-    @_get_status_helper
-    def get_status_wifi_RSSI(self):
+        Output:The region code. If the device doesn't receive a region code from the access point, the value will be '00'. If there is no wifi at all, Empty string will be returned."""),
+    # Did not return, needs to be checked later
+    "get_status_wifi_RSSI": ("Network/Wifi/RSSI", "",
         """Description: Shows the Received Signal Strength Indicator (RSSI) used by the Wi-Fi connection.
         Usage: Requires user role: ADMIN, USER
-        Output: Integer denoting the strength of the wifi signal."""
-        # Did not return, needs to be checked later
-        url = f'http://{self.address}/getxml?location=/Status/Network/Wifi/RSSI'
-        return url
-    
-    @_get_status_helper
-    def get_status_wifi_ScanResult_flag(self):
+        Output: Integer denoting the strength of the wifi signal."""),
+    # Did not return, needs to be checked later
+    "get_status_wifi_ScanResult_flag": ("Network/Wifi/ScanResult/Flags", "",
         """Description: Returns all the flags found in a scan result.
         Note that you must run a scan before this will yield results.
         Usage: Requires user role: ADMIN, USER
-        Output: String denoting the flag."""
-        # Did not return, needs to be checked later
-        url = f'http://{self.address}/getxml?location=/Status/Network/Wifi/ScanResult/Flags'
-        return url
-    
-     
-    @_get_status_helper
-    def get_status_wifi_Status(self):
+        Output: String denoting the flag."""),
+    "get_status_wifi_Status": ("Network/Wifi/Status", "",
         """Description: Shows the status of the Wi-Fi network connection.
         Usage: Requires user role: ADMIN, USER
         Output: Associating/Connected/Disconnected/AuthFailed/Failed/Other
@@ -1156,70 +3090,35 @@ class Cisco_RoomOS:
         Disconnected-The device is not connected to a WI-FI network.
         AuthFailed- Authentication failed when trying to connect to a WI-FI network.
         Failed- The device could not connect to the WI-FI network for reasons other than authentication failure.
-        Other-Any other scenario"""
-
-        url = f'http://{self.address}/getxml?location=/Status/Network/Wifi/Status'
-        return url
-    
-    @_get_status_helper
-    def get_status_wifi_type(self):
+        Other-Any other scenario"""),
+    "get_status_wifi_type": ("Network/Wifi/Type", "",
         """Description: Shows the encryption type of the Wi-Fi network connection.
         Usage: Requires user role: ADMIN, USER
-        Output: String denoting the type of Wifi Security. Empty string will be returned if not appliable."""
-
-        url = f'http://{self.address}/getxml?location=/Status/Network/Wifi/Type'
-        return url
-    
-    @_get_status_helper
-    def get_status_diagnosticMessage_description(self):
+        Output: String denoting the type of Wifi Security. Empty string will be returned if not appliable."""),
+    "get_status_diagnosticMessage_description": ("Diagnostics/Message/Description", "",
         """Description: Shows a description of the current diagnostics alerts.
         Usage: Requires user role: ADMIN, USER
-        Output: String denoting the message description"""
-
-        url = f'http://{self.address}/getxml?location=/Status/Diagnostics/Message/Description'
-        return url
-    
-    @_get_status_helper
-    def get_status_diagnosticMessage_level(self):
+        Output: String denoting the message description"""),
+    "get_status_diagnosticMessage_level": ("Diagnostics/Message/Level", "",
         """Description: Shows the level of importance of the diagnostics message. Use it along with get_status_diagnosticMessage_description for better correspondance.
         Usage: Requires user role: ADMIN, USER
         Output: Returns anyone of Error/Warning/Critical
         Error: There is an error in the device. The device can still be used, but there can be some restrictions. 
         Warning: A problem is detected and a more specific report follows indicating the exact problem.
-        Critical: The warning level is critical. The device cannot be used."""
-
-        url = f'http://{self.address}/getxml?location=/Status/Diagnostics/Message/Level'
-        return url
-    
-    @_get_status_helper
-    def get_status_diagnosticMessage_level(self):
+        Critical: The warning level is critical. The device cannot be used."""),
+    "get_status_diagnosticMessage_references": ("Diagnostics/Message/References", "",
         """Description: Additional information on the diagnostics alert, if available. Use it along with get_status_diagnosticMessage_description for better correspondance.
         Usage: Requires user role: ADMIN, USER
-        Output: String denoting an additional information. An empty string is returned if no information is available."""
-
-        url = f'http://{self.address}/getxml?location=/Status/Diagnostics/Message/References'
-        return url
-    
-    @_get_status_helper
-    def get_status_diagnosticMessage_type(self):
+        Output: String denoting an additional information. An empty string is returned if no information is available."""),
+    "get_status_diagnosticMessage_type": ("Diagnostics/Message/Type", "",
         """Description: Shows information on the results of the latest diagnostics on the device. Use it along with get_status_diagnosticMessage_description for better correspondance.
         Usage: Requires user role: ADMIN, USER
-        Output: String denoting a diagnostic message class"""
-
-        url = f'http://{self.address}/getxml?location=/Status/Diagnostics/Message/Type'
-        return url
-    
-    @_get_status_helper
-    def get_status_mediaChannel_count(self):
+        Output: String denoting a diagnostic message class"""),
+    "get_status_mediaChannel_count": ("MediaChannels/Call/Channel/Audio/Channels", "",
         """Description: Shows the number of incoming or outgoing audio channels.
         Usage: Requires user role: ADMIN, USER
-        Output: Integer denoting the number of incoming or outgoing audio channels. Returns an empty result if no calls found."""
-
-        url = f'http://{self.address}/getxml?location=/Status/MediaChannels/Call/Channel/Audio/Channels'
-        return url
-    
-    @_get_status_helper
-    def get_status_mediaChannel_audioProtocol(self):
+        Output: Integer denoting the number of incoming or outgoing audio channels. Returns an empty result if no calls found."""),
+    "get_status_mediaChannel_audioProtocol": ("MediaChannels/Call/Channel/Audio/Protocol", "",
         """Description: Shows the audio algorithm of the incoming or outgoing audio.
         Usage: Requires user role: ADMIN, USER
         Output: AACLD/G711A/G711Mu/G722/G7221/G7221C/G723_1/G728/G729/G729A/G729AB/Off/Opus , Returns an empty result if no call.
@@ -1235,148 +3134,71 @@ class Cisco_RoomOS:
         G729A: The G.729 annex A algorithm is an ITU-T standard for audio compression.
         G729AB: The G.729 annex A and B algorithm is an ITU-T standard for audio compression.
         Off: No audio.
-        Opus: Opus is a royalty-free IETF standard for audio compression"""
-
-        url = f'http://{self.address}/getxml?location=/Status/MediaChannels/Call/Channel/Audio/Protocol'
-        return url
-    
-    
-    @_get_status_helper
-    def get_status_netStat_Bytes(self):
+        Opus: Opus is a royalty-free IETF standard for audio compression"""),
+    "get_status_netStat_Bytes": ("MediaChannels/Call/Channel/NetStat/Bytes", "",
         """Description: Shows the encryption status for audio or video on the incoming or outgoing call.
         Usage: Requires user role: ADMIN, USER
-        Output:Integer denoting the value bytes for audio, video. Returns an empty result if no calls found."""
-
-        url = f'http://{self.address}/getxml?location=/Status/MediaChannels/Call/Channel/NetStat/Bytes'
-        return url
-    
-    @_get_status_helper
-    def get_status_mediaChannel_encryption(self):
+        Output:Integer denoting the value bytes for audio, video. Returns an empty result if no calls found."""),
+    "get_status_mediaChannel_encryption": ("MediaChannels/Call/Channel/Encryption", "",
         """Description: Shows the encryption status for audio or video on the incoming or outgoing call.
         Usage: Requires user role: ADMIN, USER
-        Output: On/Off. Returns an empty result if no calls found."""
-
-        url = f'http://{self.address}/getxml?location=/Status/MediaChannels/Call/Channel/Encryption'
-        return url
-    
-    @_get_status_helper
-    def get_status_netStat_ChannelRate(self):
+        Output: On/Off. Returns an empty result if no calls found."""),
+    "get_status_netStat_ChannelRate": ("MediaChannels/Call/Channel/NetStat/ChannelRate", "",
         """Description: Shows the bandwidth for audio, video or data on the incoming or outgoing channel.
         Usage: Requires user role: ADMIN, USER
-        Output:Integer denoting the value of channel rate. Returns an empty result if no calls found."""
-
-        url = f'http://{self.address}/getxml?location=/Status/MediaChannels/Call/Channel/NetStat/ChannelRate'
-        return url
-    
-    @_get_status_helper
-    def get_status_netStat_Jitter(self):
+        Output:Integer denoting the value of channel rate. Returns an empty result if no calls found."""),
+    "get_status_netStat_Jitter": ("MediaChannels/Call/Channel/NetStat/LastIntervalLost", "",
         """Description: Shows the jitter for audio, video or data at the present moment on the incoming or outgoing channel, as specified by RFC 3550.
         Usage: Requires user role: ADMIN, USER
-        Output:Integer denoting the value of jitter. Returns an empty result if no calls found."""
-
-        url = f'http://{self.address}/getxml?location=/Status/MediaChannels/Call/Channel/NetStat/LastIntervalLost'
-        return url
-    
-    @_get_status_helper
-    def get_status_netStat_LastIntervalLost(self):
+        Output:Integer denoting the value of jitter. Returns an empty result if no calls found."""),
+    "get_status_netStat_LastIntervalLost": ("MediaChannels/Call/Channel/NetStat/LastIntervalLost", "",
         """Description: Shows the number of packets lost for audio, video or data during the last interval on the incoming or outgoing channels.
         Usage: Requires user role: ADMIN, USER
-        Output:Integer denoting the value of packets lost. Returns an empty result if no calls found."""
-
-        url = f'http://{self.address}/getxml?location=/Status/MediaChannels/Call/Channel/NetStat/LastIntervalLost'
-        return url
-    
-    @_get_status_helper
-    def get_status_netStat_LastIntervalReceived(self):
+        Output:Integer denoting the value of packets lost. Returns an empty result if no calls found."""),
+    "get_status_netStat_LastIntervalReceived": ("MediaChannels/Call/Channel/NetStat/LastIntervalReceived", "",
         """Description: Shows the number of packets received for audio, video or data during the last interval on the incoming or outgoing channels.
         Usage: Requires user role: ADMIN, USER
-        Output:Integer denoting the value of packets received for audio, video in last interval. Returns an empty result if no calls found."""
-
-        url = f'http://{self.address}/getxml?location=/Status/MediaChannels/Call/Channel/NetStat/LastIntervalReceived'
-        return url
-    
-    @_get_status_helper
-    def get_status_netStat_Loss(self):
+        Output:Integer denoting the value of packets received for audio, video in last interval. Returns an empty result if no calls found."""),
+    "get_status_netStat_Loss": ("MediaChannels/Call/Channel/NetStat/Loss", "",
         """Description: Shows the number of packets lost for audio, video or data during the last interval on the incoming or outgoing channels.
         Usage: Requires user role: ADMIN, USER
-        Output:Integer denoting the value of packets lost for audio, video. Returns an empty result if no calls found."""
-
-        url = f'http://{self.address}/getxml?location=/Status/MediaChannels/Call/Channel/NetStat/Loss'
-        return url
-    
-    @_get_status_helper
-    def get_status_netStat_Packets(self):
+        Output:Integer denoting the value of packets lost for audio, video. Returns an empty result if no calls found."""),
+    "get_status_netStat_Packets": ("MediaChannels/Call/Channel/NetStat/Packtes", "",
         """Description: Shows the number of packets that was received or sent for audio, video or data on the incoming or outgoing channels.
         Usage: Requires user role: ADMIN, USER
-        Output:Integer denoting the value of packets received for audio, video. Returns an empty result if no calls found."""
-
-        url = f'http://{self.address}/getxml?location=/Status/MediaChannels/Call/Channel/NetStat/Packtes'
-        return url
-    
-    @_get_status_helper
-    def get_status_netStat_MaxJitter(self):
+        Output:Integer denoting the value of packets received for audio, video. Returns an empty result if no calls found."""),
+    "get_status_netStat_MaxJitter": ("MediaChannels/Call/Channel/NetStat/MaxJitter", "",
         """Description: Shows the maximum jitter for audio, video or data that has been measured during last interval (about 5 seconds).
         Usage: Requires user role: ADMIN, USER
-        Output:Integer denoting the value of Jitter for audio, video. Returns an empty result if no calls found."""
-
-        url = f'http://{self.address}/getxml?location=/Status/MediaChannels/Call/Channel/NetStat/MaxJitter'
-        return url
-    
-    @_get_status_helper
-    def get_status_netStat_ParticipantId(self):
+        Output:Integer denoting the value of Jitter for audio, video. Returns an empty result if no calls found."""),
+    "get_status_netStat_ParticipantId": ("MediaChannels/Call/Channel/ParticipantId", "",
         """Description: Shows the ID of the Active Control participant on the incoming audio or video channel.
         Usage: Requires user role: ADMIN, USER
-        Output:String denoting the participant id for the corresponding call. Returns an empty result if no calls found."""
-
-        url = f'http://{self.address}/getxml?location=/Status/MediaChannels/Call/Channel/ParticipantId'
-        return url
-    
-    @_get_status_helper
-    def get_status_netStat_Type(self):
+        Output:String denoting the participant id for the corresponding call. Returns an empty result if no calls found."""),
+    "get_status_netStat_Type": ("MediaChannels/Call/Channel/Type", "",
         """Description: Shows the media type on the incoming or outgoing channel.
         Usage: Requires user role: ADMIN, USER
         Output:Audio/Video/Data
         Audio: The media type on the incoming or outgoing channel is audio. 
         Video: The media type on the incoming or outgoing channel is video. 
         Data: The media type on the incoming or outgoing channel is data
-        Returns an empty result if no calls found."""
-
-        url = f'http://{self.address}/getxml?location=/Status/MediaChannels/Call/Channel/Type'
-        return url
-    
-    
-    @_get_status_helper
-    def get_status_connectedHardware_info(self):
+        Returns an empty result if no calls found."""),
+    "get_status_connectedHardware_info": ("Peripherals/ConnectedDevice/HardwareInfo", "",
         """Description: Shows hardware information about connected device.
         Usage: Requires user role: ADMIN, INTEGRATOR, ROOMCONTROL, USER
         Output:String denoting the Hardware information of the connected device.
-        Returns an empty result if no device found."""
-
-        url = f'http://{self.address}/getxml?location=/Status/Peripherals/ConnectedDevice/HardwareInfo'
-        return url
-    
-    @_get_status_helper
-    def get_status_connectedHardware_ID(self):
+        Returns an empty result if no device found."""),
+    "get_status_connectedHardware_ID": ("Peripherals/ConnectedDevice/ID", "",
         """Description: Shows the MAC-address of the connected device.
         Usage: Requires user role: ADMIN, INTEGRATOR, ROOMCONTROL, USER
         Output:String denoting the MAC address of the connected device.
-        Returns an empty result if no device found."""
-
-        url = f'http://{self.address}/getxml?location=/Status/Peripherals/ConnectedDevice/ID'
-        return url
-    
-    @_get_status_helper
-    def get_status_connectedHardware_Name(self):
+        Returns an empty result if no device found."""),
+    "get_status_connectedHardware_Name": ("Peripherals/ConnectedDevice/Name", "",
         """Description: Shows the product name of connected device.
         Usage: Requires user role: ADMIN, INTEGRATOR, ROOMCONTROL, USER
         Output:String denoting the Name of the connected device.
-        Returns an empty result if no device found."""
-
-        url = f'http://{self.address}/getxml?location=/Status/Peripherals/ConnectedDevice/Name'
-        return url
-    
-    @_get_status_helper
-    def get_status_room_airQualityIndex(self):
+        Returns an empty result if no device found."""),
+    "get_status_room_airQualityIndex": ("Peripherals/ConnectedDevice/RoomAnalytics/AirQuality/Index", "",
         """Description: Shows the air quality index as reported by the Room Navigator with the specific device id. The values are as defined by the German Federal Environmental Agency (UBA).
         Usage: Requires user role: ADMIN, INTEGRATOR, ROOMCONTROL, USER . Room Navigator(s) is necessary to be connected to the device.
         Output:String denoting the air quality as per UBA and as reported by the Room Navigator(s). Returns an empty result if Room Navigator(s) is not conncted or communicative. 
@@ -1387,62 +3209,32 @@ class Cisco_RoomOS:
         4.0-4.9: Significant Comfort Issues. Not recommended for exposure longer than 1 month. 
         Refresh air when possible. Increase ventilation.
         5.0 and above: Unacceptable Conditions.
-        Returns an empty result if no device found."""
-
-        url = f'http://{self.address}/getxml?location=/Status/Peripherals/ConnectedDevice/RoomAnalytics/AirQuality/Index'
-        return url
-    
-    @_get_status_helper
-    def get_status_room_ambientTemperature(self):
+        Returns an empty result if no device found."""),
+    "get_status_room_ambientTemperature": ("Peripherals/ConnectedDevice/RoomAnalytics/AmbientTemperature", "",
         """Description: Shows the ambient temperature as reported by the Room Navigator with the specific device id.
         Usage: Requires user role: ADMIN, INTEGRATOR, ROOMCONTROL, USER . Room Navigator is necessary to be connected to the device.
         Output:String denoting the value of ambient temperature. Returns an empty result if Room Navigator is not conncted or communicative.
-        Returns an empty result if no device found."""
-
-        url = f'http://{self.address}/getxml?location=/Status/Peripherals/ConnectedDevice/RoomAnalytics/AmbientTemperature'
-        return url
-    
-    @_get_status_helper
-    def get_status_connectedHardware_serial(self):
+        Returns an empty result if no device found."""),
+    "get_status_connectedHardware_serial": ("Peripherals/ConnectedDevice/SerialNumber", "",
         """Description: Shows the serial number of a connected peripheral device, for example a touch controller.
         Usage: Requires user role: ADMIN, INTEGRATOR, ROOMCONTROL, USER . Room Navigator is necessary to be connected to the device.
         Output:String denoting the value of Serial Number of connected device(s).
-        Returns an empty result if no device found."""
-
-        url = f'http://{self.address}/getxml?location=/Status/Peripherals/ConnectedDevice/SerialNumber'
-        return url
-    
-    @_get_status_helper
-    def get_status_connectedHardware_SoftwareInfo(self):
+        Returns an empty result if no device found."""),
+    "get_status_connectedHardware_SoftwareInfo": ("Peripherals/ConnectedDevice/SoftwareInfo", "",
         """Description: Shows information of the software version running on the connected device.
         Usage: Requires user role: ADMIN, INTEGRATOR, ROOMCONTROL, USER . Room Navigator is necessary to be connected to the device.
         Output:String denoting the value of running software information of connected device(s).
-        Returns an empty result if no device found."""
-
-        url = f'http://{self.address}/getxml?location=/Status/Peripherals/ConnectedDevice/SoftwareInfo'
-        return url
-    
-    @_get_status_helper
-    def get_status_connectedHardware_status(self):
+        Returns an empty result if no device found."""),
+    "get_status_connectedHardware_status": ("Peripherals/ConnectedDevice/Status", "",
         """Description: Shows peripheral devices that are currently connected to the video conferencing device.
         Usage: Requires user role: ADMIN, INTEGRATOR, ROOMCONTROL, USER . Room Navigator is necessary to be connected to the device.
         Output: Connected/ResponseTimedOut for the device ID. To get more information about the device , use get_status_connectedHardware_info.
-        Returns an empty result if no device found."""
-
-        url = f'http://{self.address}/getxml?location=/Status/Peripherals/ConnectedDevice/Status'
-        return url
-    
-    @_get_status_helper
-    def get_status_provisioning_SWcurrent_versionID(self):
+        Returns an empty result if no device found."""),
+    "get_status_provisioning_SWcurrent_versionID": ("Provisioning/Software/Current/VersionId", "",
         """Description: Shows the version ID of the current software.
         Usage: Requires user role: ADMIN, USER .
-        Output: String denoting the current software version ID."""
-    
-        url = f'http://{self.address}/getxml?location=/Status/Provisioning/Software/Current/VersionId'
-        return url
-    
-    @_get_status_helper
-    def get_status_provisioning_status(self):
+        Output: String denoting the current software version ID."""),
+    "get_status_provisioning_status": ("Provisioning/Status", "",
         """Description: Shows the status of the provisioning.
         Usage: Requires user role: ADMIN, USER .
         Output: Failed/AuthenticationFailed/Provisioned/Idle/NeedConfig/ConfigError.
@@ -1451,13 +3243,8 @@ class Cisco_RoomOS:
         Provisioned: The device is provisioned.
         Idle: The provisioning is not active.
         NeedConfig: The device needs to be configured.
-        ConfigError: An error occurred during configuration."""
-    
-        url = f'http://{self.address}/getxml?location=/Status/Provisioning/Status'
-        return url
-    
-    @_get_status_helper
-    def get_status_proximityStatus(self):
+        ConfigError: An error occurred during configuration."""),
+    "get_status_proximityStatus": ("Proximity/Services/Availability", "",
         """Description: Shows whether proximity services are available on the device.
         Usage: Requires user role: ADMIN, USER .
         Output: Available, Deactivated, Disabled
@@ -1467,125 +3254,71 @@ class Cisco_RoomOS:
         Deactivated: Proximity services have been deactivated with the command xCommand 
         Proximity Services Deactivate.
         Disabled: Proximity mode has been disabled with xConfiguration Proximity Mode, or none 
-        of the services have been enabled with the xConfiguration Proximity Services commands."""
-    
-        url = f'http://{self.address}/getxml?location=/Status/Proximity/Services/Availability'
-        return url
-    
-    @_get_status_helper
-    def get_status_peoplePresence(self):
+        of the services have been enabled with the xConfiguration Proximity Services commands."""),
+    "get_status_peoplePresence": ("RoomAnalytics/PeoplePresence", "",
         """Description: Shows if there are people present in the room or not. The feature is based on ultrasound. 
         The device will not keep record of who was in the room, only whether or not there are people 
         present in the room.
         When someone enters the room, the status is updated immediately. After the room gets vacant, 
         it may take up to two minutes for the status to change.
         Usage: Requires user role: ADMIN, INTEGRATOR, USER
-        Output: Yes/No/Unknown."""
-    
-        url = f'http://{self.address}/getxml?location=/Status/RoomAnalytics/PeoplePresence'
-        return url
-        
-    @_get_status_helper
-    def get_status_roomPreset_defined(self,n:int):
+        Output: Yes/No/Unknown."""),
+    #To be checked later
+    "get_status_roomPreset_defined": ("RoomPreset/{n}/Defined", "n: int",
         """Description: Shows if a camera preset is stored at this position.
         Usage: Requires user role: ADMIN, INTEGRATOR, USER
-        Output: True/False.An empty string will be returned if the specified preset is not available on the device."""
-        #To be checked later
-        url = f'http://{self.address}/getxml?location=/Status/RoomPreset/{n}/Defined'
-        return url
-    
-    @_get_status_helper
-    def get_status_roomPreset_description(self,n:int):
+        Output: True/False.An empty string will be returned if the specified preset is not available on the device."""),
+    #To be checked later
+    "get_status_roomPreset_description": ("RoomPreset/{n}/Description", "n: int",
         """Description: Lists the configured name for the specific preset.
         Usage: Requires user role: ADMIN, USER
-        Output: String denoting configuration name for the presets. An empty string will be returned if the specified preset is not available on the device."""
-        #To be checked later
-        url = f'http://{self.address}/getxml?location=/Status/RoomPreset/{n}/Description'
-        return url
-    
-    @_get_status_helper
-    def get_status_roomPreset_type(self,n:int):
+        Output: String denoting configuration name for the presets. An empty string will be returned if the specified preset is not available on the device."""),
+    #To be checked later
+    "get_status_roomPreset_type": ("RoomPreset/{n}/Type", "n: int",
         """Description: Shows the camera preset type.
         Usage: Requires user role: ADMIN, USER
-        Output: All/Camera . An empty string will be returned if the specified preset is not available on the device."""
-        #To be checked later
-        url = f'http://{self.address}/getxml?location=/Status/RoomPreset/{n}/Type'
-        return url
-    
-    @_get_status_helper
-    def get_status_sip_alternateURI(self):
+        Output: All/Camera . An empty string will be returned if the specified preset is not available on the device."""),
+    #To be checked later
+    "get_status_sip_alternateURI": ("SIP/AlternateURI/Alias", "",
         """Description: Shows an alternate SIP URI defined in its configuration.
         Usage: Requires user role: ADMIN, USER
-        Output: Shows an alternate SIP URI defined in its configuration . An empty string will be returned if the configuration is not available on the device."""
-        #To be checked later
-        url = f'http://{self.address}/getxml?location=/Status/SIP/AlternateURI/Alias'
-        return url
-    
-    @_get_status_helper
-    def get_status_sip_authentication(self):
+        Output: Shows an alternate SIP URI defined in its configuration . An empty string will be returned if the configuration is not available on the device."""),
+    #To be checked later
+    "get_status_sip_authentication": ("SIP/Authentication", "",
         """Description: Shows if Authentication for SIP is configured.
         Usage: Requires user role: ADMIN, USER
-        Output: Shows which authentication mechanism is used when registering to the SIP Proxy Server . An empty string will be returned if the configuration is not available on the device."""
-        #To be checked later
-        url = f'http://{self.address}/getxml?location=/Status/SIP/Authentication'
-        return url
-    
-    @_get_status_helper
-    def get_status_sip_callForward_displayName(self):
+        Output: Shows which authentication mechanism is used when registering to the SIP Proxy Server . An empty string will be returned if the configuration is not available on the device."""),
+    #To be checked later
+    "get_status_sip_callForward_displayName": ("SIP/CallForward/DisplayName", "",
         """Description: Returns the URI that is displayed on the user interface for the forwarded call.
         Usage: Requires user role: ADMIN, USER
-        Output: String denoting the display name of call forward."""
-        #To be checked later
-        url = f'http://{self.address}/getxml?location=/Status/SIP/CallForward/DisplayName'
-        return url
-    
-    @_get_status_helper
-    def get_status_sip_callForward_Mode(self):
+        Output: String denoting the display name of call forward."""),
+    #To be checked later
+    "get_status_sip_callForward_Mode": ("SIP/CallForward/Mode", "",
         """Description: Indicates whether the call forward mode for SIP is set to on or off.
         Usage: Requires user role: ADMIN, USER
-        Output: On/Off"""
-        #To be checked later
-        url = f'http://{self.address}/getxml?location=/Status/SIP/CallForward/Mode'
-        return url
-    
-    @_get_status_helper
-    def get_status_sip_callForward_URI(self):
+        Output: On/Off"""),
+    #To be checked later
+    "get_status_sip_callForward_URI": ("SIP/CallForward/URI", "",
         """Description: Indicates the address the incoming calls are directed to when call forward mode is set on.
         Usage: Requires user role: ADMIN, USER
-        Output: String denoting the value of uri"""
-        #To be checked later
-        url = f'http://{self.address}/getxml?location=/Status/SIP/CallForward/URI'
-        return url
-    
-    @_get_status_helper
-    def get_status_sip_mailbox_messageWaiting(self):
+        Output: String denoting the value of uri"""),
+    #To be checked later
+    "get_status_sip_mailbox_messageWaiting": ("SIP/Mailbox/MessagesWaiting", "",
         """Description: Indicates how many new messages are in the mailbox for SIP.
         Usage: Requires user role: ADMIN, USER
-        Output: Integer denoting the value of number of messages received and waiting."""
-        #To be checked later
-        url = f'http://{self.address}/getxml?location=/Status/SIP/Mailbox/MessagesWaiting'
-        return url
-    
-    @_get_status_helper
-    def get_status_sip_mailbox_uri(self):
+        Output: Integer denoting the value of number of messages received and waiting."""),
+    #To be checked later
+    "get_status_sip_mailbox_uri": ("SIP/Mailbox/URI", "",
         """Description: Returns the URI for your SIP mailbox.
         Usage: Requires user role: ADMIN, USER
-        Output: String denoting the value of mailbox uri for SIP."""
-        #To be checked later
-        url = f'http://{self.address}/getxml?location=/Status/SIP/Mailbox/URI'
-        return url
-    
-    @_get_status_helper
-    def get_status_sip_proxyAddress(self):
+        Output: String denoting the value of mailbox uri for SIP."""),
+    #To be checked later
+    "get_status_sip_proxyAddress": ("SIP/Proxy/Address", "",
         """Description: Returns the URI for your SIP mailbox.
         Usage: Requires user role: ADMIN, USER
-        Output: String denoting the value of proxy address for SIP."""
-        #To be checked later
-        url = f'http://{self.address}/getxml?location=/Status/SIP/Proxy/Address'
-        return url
-    
-    @_get_status_helper
-    def get_status_sip_proxyStatus(self):
+        Output: String denoting the value of proxy address for SIP."""),
+    "get_status_sip_proxyStatus": ("SIP/Proxy/Status", "",
         """Description: Shows the status of the communication between the device and the SIP Proxy server.
         Usage: Requires user role: ADMIN, USER
         Output: Active/AuthenticationFailed/DNSFailed/Off/Timeout/UnableTCP/UnableTLS/Unknown
@@ -1596,13 +3329,9 @@ class Cisco_RoomOS:
         UnableTCP: The device is unable to use TCP as the transport method.
         UnableTLS: The device is unable to use TLS as the transport method.
         Unknown: The status of the communication is not known.
-        AuthenticationFailed: Wrong username or password."""
-
-        url = f'http://{self.address}/getxml?location=/Status/SIP/Proxy/Status'
-        return url
-    
-    @_get_status_helper
-    def get_status_sip_RegistrationStatus(self):
+        AuthenticationFailed: Wrong username or password."""),
+    #To be checked later
+    "get_status_sip_RegistrationStatus": ("SIP/Registration/Status", "",
         """Description: Shows the status of the communication between the device and the SIP Proxy server.
         Usage: Requires user role: ADMIN, USER
         Output: Deregister/Failed/Inactive/Registered/Registering
@@ -1610,43 +3339,27 @@ class Cisco_RoomOS:
         Failed: The device failed to register to the SIP Proxy.
         Inactive: The device is not registered to any SIP Proxy.
         Registered: The device is registered to the SIP Proxy.
-        Registering: The device is in the process of registering to the SIP Proxy."""
-        #To be checked later
-        url = f'http://{self.address}/getxml?location=/Status/SIP/Registration/Status'
-        return url
-    
-    @_get_status_helper
-    def get_status_sip_registrationAuthentication(self):
+        Registering: The device is in the process of registering to the SIP Proxy."""),
+    #To be checked later
+    "get_status_sip_registrationAuthentication": ("SIP/Registration/Authentication", "",
         """Description: Shows the status of the communication between the device and the SIP Proxy server.
         Usage: Requires user role: ADMIN, USER
         Output: Digest/Off
         Digest: Uses the Digest access authentication method, as specified by RFC 2069.
         Off: No authentication mechanism is used.
-        Returns an empty string if SIP is not available."""
-        #To be checked later
-        url = f'http://{self.address}/getxml?location=/Status/SIP/Registration/Authentication'
-        return url
-    
-    @_get_status_helper
-    def get_status_sip_registrationURI(self):
+        Returns an empty string if SIP is not available."""),
+    #To be checked later
+    "get_status_sip_registrationURI": ("SIP/Registration/URI", "",
         """Description: Shows the URI used for registration to the SIP Proxy server.
         Usage: Requires user role: ADMIN, USER
-        Output: String denoting the value of SIP registration URI. Returns an empty string if SIP is not available."""
-        #To be checked later
-        url = f'http://{self.address}/getxml?location=/Status/SIP/Registration/URI'
-        return url
-    
-    @_get_status_helper
-    def get_status_sip_security(self):
+        Output: String denoting the value of SIP registration URI. Returns an empty string if SIP is not available."""),
+    #To be checked later
+    "get_status_sip_security": ("SIP/Secure", "",
         """Description: Shows the encryption status of the signaling with the SIP Proxy server.
         Usage: Requires user role: ADMIN, USER
-        Output: True/False. Returns an empty string if SIP is not available"""
-        #To be checked later
-        url = f'http://{self.address}/getxml?location=/Status/SIP/Secure'
-        return url
-    
-    @_get_status_helper
-    def get_status_sip_verified(self):
+        Output: True/False. Returns an empty string if SIP is not available"""),
+    #To be checked later
+    "get_status_sip_verified": ("SIP/Verified", "",
         """Description: Shows whether or not the SSL certificate of the server that the device tries to register to is 
         included in the device's trusted CA-list. The server is typically a Cisco VCS or CUCM.
         Usage: Requires user role: ADMIN, USER
@@ -1657,70 +3370,42 @@ class Cisco_RoomOS:
         False: A TLS connection is not set up because the SIP certificate verification failed or the 
         domain name did not match. Note that the status also returns False when TLS is not used 
         (SIP DefaultTransport not set to TLS) or certificate verification is switched 
-        off (SIP TlsVerify: Off. This setting is accessible through your products web interface)."""
-        #To be checked later
-        url = f'http://{self.address}/getxml?location=/Status/SIP/Verified'
-        return url
-    
-    @_get_status_helper
-    def get_status_unit_wifiAvailability(self):
+        off (SIP TlsVerify: Off. This setting is accessible through your products web interface)."""),
+    #To be checked later
+    "get_status_unit_wifiAvailability": ("SystemUnit/Hardware/HasWiFi", "",
         """Description: Shows whether or not the device has wireless internet (WiFi) capability.
         Usage: Requires user role: ADMIN, USER
-        Output: False/True"""
-        #To be checked later
-        url = f'http://{self.address}/getxml?location=/Status/SystemUnit/Hardware/HasWiFi'
-        return url
-    
-    @_get_status_helper
-    def get_status_unit_module_SerialNumber(self):
+        Output: False/True"""),
+    #To be checked later
+    "get_status_unit_module_SerialNumber": ("SystemUnit/Hardware/Module/SerialNumber", "",
         """Description: Shows the serial number of the hardware module in the device.
         Usage: Requires user role: ADMIN, USER
-        Output: String denoting the value of Hardware module's serial number."""
-        #To be checked later
-        url = f'http://{self.address}/getxml?location=/Status/SystemUnit/Hardware/Module/SerialNumber'
-        return url
-    
-    @_get_status_helper
-    def get_status_unit_module_compatibilityScore(self):
+        Output: String denoting the value of Hardware module's serial number."""),
+    #To be checked later
+    "get_status_unit_module_compatibilityScore": ("SystemUnit/Hardware/Module/CompatibilityLevel", "",
         """Description: The devices have different sets of compatibility levels. Please check the release note to find the 
         compatibility levels and minimum software version required for your product.
         Usage: Requires user role: ADMIN, USER
-        Output: String denoting the value of the compatibility level for the device. 0 is the lowest"""
-        #To be checked later
-        url = f'http://{self.address}/getxml?location=/Status/SystemUnit/Hardware/Module/CompatibilityLevel'
-        return url
-    
-    @_get_status_helper
-    def get_status_unit_temperature_status(self):
+        Output: String denoting the value of the compatibility level for the device. 0 is the lowest"""),
+    #To be checked later
+    "get_status_unit_temperature_status": ("SystemUnit/Hardware/Monitoring/Temperature/Status", "",
         """Description: Shows the current temperature alarm level. "High" is meant to raise attention to the temperature trend since the operating temperature is higher than normal. At "Critical" level the device 
         will shut down processes and processors to prevent any damage to the device.
         Usage: Requires user role: ADMIN, USER
-        Output: Unknown, Normal, High, Critical."""
-        #To be checked later
-        url = f'http://{self.address}/getxml?location=/Status/SystemUnit/Hardware/Monitoring/Temperature/Status'
-        return url
-    
-    @_get_status_helper
-    def get_status_unit_fan_speed(self):
+        Output: Unknown, Normal, High, Critical."""),
+    #To be checked later
+    "get_status_unit_fan_speed": ("SystemUnit/Hardware/Monitoring/Fan/Status", "",
         """Description: The feedback shows the speed (rpm) for the specified fan.
         Usage: Requires user role: ADMIN, USER
-        Output: String denoting the value of the speed of fan in Revolutions per Minute (rpm). An empty string is returned if this monitoring is not applicable."""
-        #To be checked later
-        url = f'http://{self.address}/getxml?location=/Status/SystemUnit/Hardware/Monitoring/Fan/Status'
-        return url
-    
-    @_get_status_helper
-    def get_status_unit_notification(self):
+        Output: String denoting the value of the speed of fan in Revolutions per Minute (rpm). An empty string is returned if this monitoring is not applicable."""),
+    #To be checked later
+    "get_status_unit_notification": ("SystemUnit/Notifications/Notification/Text", "",
         """Description: Lists text related to important system notifications. Notifications are issued e.g. when a device 
         was rebooted because of a software upgrade, or when a factory reset has been performed.
         Usage: Requires user role: ADMIN, USER
-        Output: String denoting the text of notification(s). An empty string is returned if this monitoring is not applicable."""
-        #To be checked later
-        url = f'http://{self.address}/getxml?location=/Status/SystemUnit/Notifications/Notification/Text'
-        return url
-    
-    @_get_status_helper
-    def get_status_unit_notificationType(self):
+        Output: String denoting the text of notification(s). An empty string is returned if this monitoring is not applicable."""),
+    #To be checked later
+    "get_status_unit_notificationType": ("SystemUnit/Notifications/Notification/Type", "",
         """Description: Lists notifications types. Notifications are issued e.g. when a device 
         was rebooted because of a software upgrade, or when a factory reset has been performed.
         Usage: Requires user role: ADMIN, USER
@@ -1729,392 +3414,114 @@ class Cisco_RoomOS:
         SoftwareUpgradeFailed: This value is returned after a failed software upgrade attempt.
         RebootRequired: This value is returned when a reboot is required.
         Other: This value is returned for any other notifications. 
-        An empty string is returned if this monitoring is not applicable."""
-        #To be checked later
-        url = f'http://{self.address}/getxml?location=/Status/SystemUnit/Notifications/Notification/Type'
-        return url
-    
-    @_get_status_helper
-    def get_status_unit_productID(self):
+        An empty string is returned if this monitoring is not applicable."""),
+    #To be checked later
+    "get_status_unit_productID": ("SystemUnit/ProductId", "",
         """Description: Shows the product ID.
         Usage: Requires user role: ADMIN, USER
-        Output: String denoting the product ID."""
-        #To be checked later
-        url = f'http://{self.address}/getxml?location=/Status/SystemUnit/ProductId'
-        return url
-    
-    @_get_status_helper
-    def get_status_unit_productPlatform(self):
+        Output: String denoting the product ID."""),
+    #To be checked later
+    "get_status_unit_productPlatform": ("SystemUnit/ProductPlatform", "",
         """Description: Shows the product platform.
         Usage: Requires user role: ADMIN, USER
-        Output: String denoting the product Platform."""
-        #To be checked later
-        url = f'http://{self.address}/getxml?location=/Status/SystemUnit/ProductPlatform'
-        return url
-    
-    @_get_status_helper
-    def get_status_unit_productType(self):
+        Output: String denoting the product Platform."""),
+    #To be checked later
+    "get_status_unit_productType": ("SystemUnit/ProductType", "",
         """Description: Shows the product type.
         Usage: Requires user role: ADMIN, USER
-        Output: String denoting the product Type."""
-        #To be checked later
-        url = f'http://{self.address}/getxml?location=/Status/SystemUnit/ProductType'
-        return url
-    
-    
-    @_get_status_helper
-    def get_status_unit_software_displayName(self):
+        Output: String denoting the product Type."""),
+    #To be checked later
+    "get_status_unit_software_displayName": ("SystemUnit/Software/DisplayName", "",
         """Description: Shows the name of the software that is installed on the device, as it is displayed in the UI.
         Usage: Requires user role: ADMIN, USER
-        Output: String denoting the software name being displayed on the UI."""
-        #To be checked later
-        url = f'http://{self.address}/getxml?location=/Status/SystemUnit/Software/DisplayName'
-        return url
-    
-    @_get_status_helper
-    def get_status_unit_software_installed(self):
+        Output: String denoting the software name being displayed on the UI."""),
+    #To be checked later
+    "get_status_unit_software_installed": ("SystemUnit/Software/Name", "",
         """Description: Shows the name of the software that is installed on the device.
         Usage: Requires user role: ADMIN, USER
-        Output: String denoting the software name installed on the system."""
-        #To be checked later
-        url = f'http://{self.address}/getxml?location=/Status/SystemUnit/Software/Name'
-        return url
-    
-    @_get_status_helper
-    def get_status_unit_software_version(self):
+        Output: String denoting the software name installed on the system."""),
+    #To be checked later
+    "get_status_unit_software_version": ("SystemUnit/Software/Version", "",
         """Description: Shows the software version installed on the device.
         Usage: Requires user role: ADMIN, USER
-        Output: String denoting the software version installed on the system."""
-        #To be checked later
-        url = f'http://{self.address}/getxml?location=/Status/SystemUnit/Software/Version'
-        return url
-    
-    @_get_status_helper
-    def get_status_unit_uptime(self):
+        Output: String denoting the software version installed on the system."""),
+    #To be checked later
+    "get_status_unit_uptime": ("SystemUnit/Uptime", "",
         """Description: Shows the number of seconds since the last restart of the device.
         Usage: Requires user role: ADMIN, USER
-        Output: Integer denoting the System Uptime in seconds."""
-        #To be checked later
-        url = f'http://{self.address}/getxml?location=/Status/SystemUnit/Uptime'
-        return url
-    
-    @_get_status_helper
-    def get_status_unit_timeNow(self):
-        """Description: Returns the date and time set on the device.
-        Usage: Requires user role: ADMIN, INTEGRATOR, USER
-        Output: String denoting date and time."""
-        #To be checked later
-        url = f'http://{self.address}/getxml?location=/Status/Time/SystemTime'
-        return url
-    
-    
-    
-    def test_call(self,extension : str ,duration : int = 30,output_debug : bool =False):
-        """Description: Test calls automatically for desired duration to termintae automatically.
-        Usage: provide the remote destination extension/uri: extension , call duration  to be tested is set at 30 seconds by default, can be changed. Note that the call either must be received or set to auto answer on remote device."""
-            
-        url = f"http://{self.address}/putxml"
-        payload_connect = f"<Command>\r\n\t<Dial>\r\n\t\t<Number>{extension}</Number>\r\n\t</Dial>\r\n</Command>"
-        headers = {
-          'Content-Type': 'text/xml',
-        }
-        try:
-            response_connect = requests.post(url, headers=headers,auth=HTTPBasicAuth(self.username,self.password), data=payload_connect)
-            call_id = jxmlease.parse(response_connect.text)['Command']['DialResult']['CallId']
-            if (response_connect.status_code==401):
-                    raise Exception("Authorisation Failed , Please check Credentials\n")
-            elif (response_connect.status_code==400):
-                    raise Exception("Connection Failed , Please check Connection\n")
-            elif (response_connect.status_code==200):
-                time.sleep(duration)
-                payload_disconnect = f"<Command>\r\n\t<Call>\r\n\t\t<Disconnect>\r\n \t\t\t<CallId>{call_id}</CallId>\r\n \t\t</Disconnect>\r\n\t</Call>\r\n</Command>"
-                response_disconnect = requests.post(url, headers=headers,auth=HTTPBasicAuth(self.username,self.password), data=payload_disconnect)
-                call_data = self.get_call_history(output_debug=False)['Command']['CallHistoryGetResult']['Entry'][0]
-                if output_debug:
-                    print(call_data)
-                return call_data
-        except Exception as e:
-            return (e)
-    
-    def set_call_protocol_priotity(self,protocol : str,output_debug :bool = False):
-        """Descriptopn: Set protocol priority for calls
-        Usage: WebRTC, Auto"""
-
-        url = f"http://{self.address}/putxml"
-        headers = {
-          'Content-Type': 'text/xml',
-        }
-        payload_Bookings_protocol_priotity = f"<Configuration>\r\n\t\t<Bookings>\r\n\t\t<ProtocolPriority>{protocol}</ProtocolPriority>\r\n\t\t</Bookings>\r\n</Configuration>"
-        try:
-            response = requests.post(url, headers=headers,auth=HTTPBasicAuth(self.username,self.password), data=payload_Bookings_protocol_priotity,verify=self.ssl_verify)
-            call_priotity = jxmlease.parse(response.text)
-            if response.status_code == 200:
-                if "Success" in response.text:
-                    if output_debug:
-                        print(call_priotity)
-                    return(call_priotity)
-                elif "Error" in response.text:
-                    error = jxmlease.parse(response.text)['Configuration']['Error']['Details']
-                    raise f"Error: {error}"
-            else:
-                if response.status_code == 401:
-                    raise Exception("Authorisation Failed , Please check Credentials\n")
-                elif (response.status_code==400):
-                    raise Exception("Connection Failed , Please check Connection\n")
-                else:
-                    raise Exception(f"Error: {response.status_code}")
-        except Exception as e:
-            if output_debug:
-                print(e)
-            return(e)
-        
-        
-    def set_default_call_protocol(self,protocol : str,output_debug: bool =False):
-        """Description: Set the default call protocol
-        Usage : Auto/H320/H323/Sip/Spark"""
-        
-        url = f"http://{self.address}/putxml"
-        headers = {
-          'Content-Type': 'text/xml',
-        }
-        payload_default_call_protocol = f"<Configuration>\r\n\t<Conference>\r\n\t\t<DefaultCall>\r\n\t \t\t<Protocol>{protocol}</Protocol>\r\n\t\t</DefaultCall>\r\n\t</Conference>\r\n</Configuration>"
-        
-        try:
-            response = requests.post(url, headers=headers,auth=HTTPBasicAuth(self.username,self.password), data=payload_default_call_protocol)
-            default_call_proto = jxmlease.parse(response.text)
-            if response.status_code == 200:
-                if "Success" in response.text:
-                    if output_debug:
-                        print(default_call_proto)
-                    return(default_call_proto)
-                elif "Error" in response.text:
-                    error = jxmlease.parse(response.text)['Configuration']['Error']['Details']
-                    raise f"Error: {error}"
-            else:
-                if response.status_code == 401:
-                    raise Exception("Authorisation Failed , Please check Credentials\n")
-                elif (response.status_code==400):
-                    raise Exception("Connection Failed , Please check Connection\n")
-                else:
-                    raise Exception(f"Error: {response.status_code}")
-        except Exception as e:
-            if output_debug:
-                print(e)
-            return(e)
-            
-    
-    def set_auto_answer(self,mode: str,mute: str,delay: int=0,output_debug: bool=False):
-        """Description: Set Auto Answer on or off along with associated functions like mute and delay in seconds
-        Usage Provide mode, mute mode and delay is by default 0, can be set as desired."""
-        
-        url = f"http://{self.address}/putxml"
-        headers = {
-          'Content-Type': 'text/xml',
-        }
-        payload_auto_answer = f"<Configuration>\r\n\t<Conference>\r\n\t\t<AutoAnswer>\r\n\t\t\t<Mode>{mode}</Mode><Delay>{delay}</Delay><Mute>{mute}</Mute>\r\n\t\t</AutoAnswer>\r\n\t</Conference>\r\n</Configuration>"
-        try:
-            response = requests.post(url, headers=headers,auth=HTTPBasicAuth(self.username,self.password), data=payload_auto_answer)
-            auto_answer = jxmlease.parse(response.text)
-            if response.status_code == 200:
-                if "Success" in response.text:
-                    if output_debug:
-                        print(auto_answer)
-                    return(auto_answer)
-                elif "Error" in response.text:
-                    error = jxmlease.parse(response.text)['Configuration']['Error'][0]['Details']
-                    raise Exception(f"Error: {error}")
-            else:
-                if response.status_code == 401:
-                    raise Exception("Authorisation Failed , Please check Credentials\n")
-                elif (response.status_code==400):
-                    raise Exception("Connection Failed , Please check Connection\n")
-                else:
-                    raise Exception(f"Error: {response.status_code}")
-        except Exception as e:
-            if output_debug:
-                print(e)
-            return(e)
-        
-    def get_call_history(self,output_debug : bool =False):
-        """Description: Get call history
-        Usage: Call the function , returns json structured output for all calls"""
-        
-        url = f"http://{self.address}/putxml"
-        
-        payload_call_history = f"<Command>\r\n\t<CallHistory>\r\n\t\t<Get>\r\n\t\t\t<DetailLevel>Full</DetailLevel>\t\r\n\t\t</Get>\r\n\t</CallHistory>\r\n</Command>"
+        Output: Integer denoting the System Uptime in seconds."""),
+    #To be checked later
+    "get_status_unit_timeNow": ("Time/SystemTime", "",
+        """Description: Returns the date and time set on the device.
+        Usage: Requires user role: ADMIN, INTEGRATOR, USER
+        Output: String denoting date and time."""),
+}
 
-        headers = {
-          'Content-Type': 'text/xml',
-        }
-        try:
-            response_call_history = requests.post(url, headers=headers,auth=HTTPBasicAuth(self.username,self.password), data=payload_call_history)
-            call_history = jxmlease.parse(response_call_history.text)
-            #print(response_call_history.text)
-            if response_call_history.status_code == 200:
-                if output_debug:
-                    print(call_history)
-                return(call_history)
-            else:
-                if response_call_history.status_code == 401:
-                    raise Exception("Authorisation Failed , Please check Credentials\n")
-                elif (response_call_history.status_code==400):
-                    raise Exception("Connection Failed , Please check Connection\n")
-                else:
-                    raise Exception(f"Error: {response_call_history.status_code}")
-        except Exception as e:
-            if output_debug:
-                print(e)
-            return(e)
-        
-    def set_audio_noise_removal(self,mode : str ,output_debug : bool =False):
+_CONFIG_ACCESSORS = {
+    # name: (path below Configuration, parameters, docstring), the first parameter is the value written by self.set_config, output_debug is added
+    "set_call_protocol_priotity": ("Bookings/ProtocolPriority", "protocol: str",
+        """Descriptopn: Set protocol priority for calls
+        Usage: WebRTC, Auto"""),
+    "set_default_call_protocol": ("Conference/DefaultCall/Protocol", "protocol: str",
+        """Description: Set the default call protocol
+        Usage : Auto/H320/H323/Sip/Spark"""),
+    "set_audio_noise_removal": ("Audio/Microphones/NoiseRemoval/Mode", "mode: str",
         """Description: Audio Noise Removal
-        usage mode = on, off"""
-        
-        payload = f"<Configuration>\r\n\t<Audio>\r\n\t\t<Microphones>\r\n\t\t\t<NoiseRemoval>\r\n\t\t\t\t<Mode>{mode}</Mode>\r\n\t\t\t</NoiseRemoval>\r\n\t\t</Microphones>\r\n\t</Audio>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-        
-    def set_encryption_mode(self,mode : str,output_debug:bool=False):
+        usage mode = on, off"""),
+    "set_encryption_mode": ("Conference/Encryption/Mode", "mode: str",
         """Description: Encrytion Mode
-        usage Off/On/BestEffort"""
-        
-        payload = f"<Configuration>\r\n\t<Conference>\r\n\t\t<Encryption>\r\n\t\t\t<Mode>{mode}</Mode>\r\n\t\t\t</Encryption>\r\n\t\t</Conference>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-        
-    def set_default_call_rate(self,value:int=6000,output_debug:bool=False):
+        usage Off/On/BestEffort"""),
+    "set_default_call_rate": ("Conference/DefaultCall/Rate", "value: int = 6000",
         """Description: Default call rate
-        usage 64-6000"""
-        
-        payload = f"<Configuration>\r\n\t<Conference>\r\n\t\t<DefaultCall>\r\n\t\t\t<Rate>{value}</Rate>\r\n\t\t\t</DefaultCall>\r\n\t\t</Conference>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-        
-    def set_far_end_ctrl_sig_capbality(self,mode:str,output_debug:bool=False):
+        usage 64-6000"""),
+    "set_far_end_ctrl_sig_capbality": ("Conference/FarEndControl/SignalCapability", "mode: str",
         """Description: far end control signal capability
-        usage Off/On"""
-    
-        payload = f"<Configuration>\r\n\t<Conference>\r\n\t\t<FarEndControl>\r\n\t\t\t<SignalCapability>{mode}</SignalCapability>\r\n\t\t\t</FarEndControl>\r\n\t\t</Conference>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-        
-    def set_h323_auth_mode(self,mode:str,output_debug:bool=False):
+        usage Off/On"""),
+    "set_h323_auth_mode": ("H323/Authentication/Mode", "mode: str",
         """Off: The device will not try to authenticate itself to a H.323 Gatekeeper, but will still try a 
         normal registration.
         On: If an H.323 Gatekeeper indicates that it requires authentication, the device will try 
         to authenticate itself to the gatekeeper. Requires the H323 Authentication LoginName 
         and H323 Authentication Password settings to be defined on both the device and the 
         Gatekeeper
-        usage Off/On"""
-            
-        payload = f"<Configuration>\r\n\t<H323>\r\n\t\t<Authentication>\r\n\t\t\t<Mode>{mode}</Mode>\r\n\t\t\t</Authentication>\r\n\t\t</H323>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-        
-    def set_h323_encryption_key_size(self,size:str="Min1024bit",output_debug:bool=False):
+        usage Off/On"""),
+    "set_h323_encryption_key_size": ("H323/Encryption/KeySize", "size: str = 'Min1024bit'",
         """Description: Set the encryption key size for H323
-        usage : Max1024bit/Min1024bit/Min2048bit"""
-        
-        payload = f"<Configuration>\r\n\t<H323>\r\n\t\t<Encryption>\r\n\t\t\t<KeySize>{size}</KeySize>\r\n\t\t\t</Encryption>\r\n\t\t</H323>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-        
-    def set_h323_login_name_password(self,name:str,password:str,output_debug:bool=False):
-        """Description: The device sends the H323 Authentication Login Name and the H323 Authentication Password 
-        to an H.323 Gatekeeper for authentication. The authentication is a one way authentication from 
-        the device to the H.323 Gatekeeper, i.e. the device is authenticated to the gatekeeper. If the 
-        H.323 Gatekeeper indicates that no authentication is required, the device will still try to register. 
-        Requires the H.323 Authentication Mode to be enabled.
-        Usage : Provide Name and password , string """
-        
-        url = f"http://{self.address}/putxml"
-        headers = {
-          'Content-Type': 'text/xml',
-        }
-        payload_name = f"<Configuration>\r\n\t<H323>\r\n\t\t<Authentication>\r\n\t\t\t<LoginName>{name}</LoginName>\r\n\t\t\t</Authentication>\r\n\t\t</H323>\r\n</Configuration>"
-        try:
-            response_name = requests.post(url, headers=headers,auth=HTTPBasicAuth(self.username,self.password), data=payload_name)
-            parse_name = jxmlease.parse(response_name.text)
-            if response_name.status_code == 200:
-                if "Success" in response_name.text:
-                    payload_password = f"<Configuration>\r\n\t<H323>\r\n\t\t<Authentication>\r\n\t\t\t<Password>{password}</Password>\r\n\t\t\t</Authentication>\r\n\t\t</H323>\r\n</Configuration>"
-                    response_h323_pass = requests.post(url, headers=headers,auth=HTTPBasicAuth(self.username,self.password), data=payload_password)
-                    if output_debug:
-                        print(parse_name)
-                    return(parse_name)
-                else:
-                    error = jxmlease.parse(response_name.text)['Configuration']['Error']['Details']
-                    raise Exception(f"Error: {error}")
-            else:
-                if response_name.status_code == 401:
-                    raise Exception("Authorisation Failed , Please check Credentials\n")
-                elif (response_name.status_code==400):
-                    raise Exception("Connection Failed , Please check Connection\n")
-                else:
-                    raise Exception(f"Error: {response_name.status_code}")
-        except Exception as e:
-            if output_debug:
-                print(e)
-            return(e)
-        
-    def set_h323_gateway_address(self,address:str,output_debug:bool=False):
+        usage : Max1024bit/Min1024bit/Min2048bit"""),
+    "set_h323_gateway_address": ("H323/Gatekeeper/Address", "address: str",
         """Description: Define the IP address of the Gatekeeper. Requires H323 CallSetup Mode to be set to 
         Gatekeeper.
-        Usage : Valid IPv4 or IPv6 addresses or DNS record address"""
-        
-        
-        payload = f"<Configuration>\r\n\t<H323>\r\n\t\t<Gatekeeper>\r\n\t\t\t<Address>{address}</Address>\r\n\t\t\t</Gatekeeper>\r\n\t\t</H323>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-        
-    def set_h323_alias_id(self,alias_id:str,output_debug:bool=False):
+        Usage : Valid IPv4 or IPv6 addresses or DNS record address"""),
+    "set_h323_alias_id": ("H323/H323Alias/ID", "alias_id: str",
         """Description: Define the H.323 Alias ID, which is used to address the device on a H.323 Gatekeeper and will 
         be displayed in the call lists
-        Usage : Proper alias ID"""
-
-        payload = f"<Configuration>\r\n\t<H323>\r\n\t\t<H323Alias>\r\n\t\t\t<ID>{alias_id}</ID>\r\n\t\t\t</H323Alias>\r\n\t\t</H323>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_sip_mode(self,mode:str,output_debug:bool=False):
+        Usage : Proper alias ID"""),
+    "set_sip_mode": ("NetworkServices/SIP/Mode", "mode: str",
         """Description: SNMP (Simple Network Management Protocol) is used by network management systems to 
         monitor and manage devices such as routers, servers, and switches, that are connected to the 
         IP network. SNMP exposes management data in the form of variables on the managed devices, 
         which describe the device status and configuration. These variables can then be remotely 
         queried, and sometimes set, by managing applications
-        Usage: Off/ReadOnly/ReadWrite , Requires user role: ADMIN, INTEGRATOR"""
-        
-        payload = f"<Configuration>\r\n\t<NetworkServices>\r\n\t\t<SIP>\r\n\t\t\t<Mode>{mode}</Mode>\r\n\t\t\t</SIP>\r\n\t\t</NetworkServices>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    
-    def set_snmp_community_name(self,community_name:str,output_debug:bool=False):
+        Usage: Off/ReadOnly/ReadWrite , Requires user role: ADMIN, INTEGRATOR"""),
+    "set_snmp_community_name": ("NetworkServices/SNMP/CommunityName", "community_name: str",
         """Description: Define the name of the SNMP community. The SNMP community name is used to authenticate 
         SNMP requests. If an SNMP request from a management system does not include a matching 
         community name (case sensitive), the message is dropped and the SNMP agent in the video 
         device will not send a response. 
         If you have the Cisco TelePresence Management Suite (TMS) you must make sure the same 
         SNMP community is configured there.
-        Usage: Supply string of community name , Requires user role: ADMIN, INTEGRATOR"""
-        
-        payload = f"<Configuration>\r\n\t<NetworkServices>\r\n\t\t<SNMP>\r\n\t\t\t<CommunityName>{community_name}</CommunityName>\r\n\t\t\t</SNMP>\r\n\t\t</NetworkServices>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_snmp_system_contact(self, system_contact:str,output_debug:bool=False):
+        Usage: Supply string of community name , Requires user role: ADMIN, INTEGRATOR"""),
+    "set_snmp_system_contact": ("NetworkServices/SNMP/SystemContact", "system_contact: str",
         """Description: Define contact information that SNMP servers can use
-        Usage: Supply string of contact details , Requires user role: ADMIN, INTEGRATOR"""
-        
-        payload = f"<Configuration>\r\n\t<NetworkServices>\r\n\t\t<SNMP>\r\n\t\t\t<SystemContact>{system_contact}</SystemContact>\r\n\t\t\t</SNMP>\r\n\t\t</NetworkServices>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-        
-    def set_snmp_location(self,system_location:str,output_debug:bool=False):
+        Usage: Supply string of contact details , Requires user role: ADMIN, INTEGRATOR"""),
+    "set_snmp_location": ("NetworkServices/SNMP/SystemLocation", "system_location: str",
         """Description: Define location information that SNMP servers can use
-        Usage: Supply System Location, Requires user role: ADMIN, INTEGRATOR"""
-        
-        payload = f"<Configuration>\r\n\t<NetworkServices>\r\n\t\t<SNMP>\r\n\t\t\t<SystemLocation>{system_location}</SystemLocation>\r\n\t\t\t</SNMP>\r\n\t\t</NetworkServices>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-        
-    def set_ssh_mode(self,mode:str,output_debug:bool=False):
+        Usage: Supply System Location, Requires user role: ADMIN, INTEGRATOR"""),
+    "set_ssh_mode": ("NetworkServices/SSH/Mode", "mode: str",
         """Description: The SSH (or Secure Shell) protocol can provide secure encrypted communication between the 
         video conferencing device and your local computer
-        Usage: Off/On, Requires user role: ADMIN"""
-        
-        payload = f"<Configuration>\r\n\t<NetworkServices>\r\n\t\t<SSH>\r\n\t\t\t<Mode>{mode}</Mode>\r\n\t\t\t</SSH>\r\n\t\t</NetworkServices>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-        
-    def set_wifi_allowed(self,allow:str,output_debug:bool=False):
+        Usage: Off/On, Requires user role: ADMIN"""),
+    "set_wifi_allowed": ("NetworkServices/Wifi/Allowed", "allow: str",
         """Description: Devices that have a built-in Wi-Fi adapter, can connect to the network either via Ethernet or 
         Wi-Fi. Both Ethernet and Wi-Fi are allowed by default, and the user can choose which one to 
         use from the user interface. With this setting, the administrator can disable Wi-Fi configuration, 
@@ -2125,69 +3532,40 @@ class Cisco_RoomOS:
         and open networks (not secured).
         If the PID (Product ID), found on the rating label at the rear of the device, contains the letters NR 
         (No Radio) the device does not support Wi-F
-        Usage: True, False, Requires user role: ADMIN, USER"""
-            
-        payload = f"<Configuration>\r\n\t<NetworkServices>\r\n\t\t<Wifi>\r\n\t\t\t<Allowed>{allow}</Allowed>\r\n\t\t\t</Wifi>\r\n\t\t</NetworkServices>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-        
-    def set_ssh_key_algorithm(self,algorithm:str,output_debug:bool=False):
+        Usage: True, False, Requires user role: ADMIN, USER"""),
+    "set_ssh_key_algorithm": ("NetworkServices/SSH/HostKeyAlgorithm", "algorithm: str",
         """Description: Choose the cryptographic algorithm that shall be used for the SSH host key. Choices are 
         RSA (Rivest–Shamir–Adleman) with 2048 bits keysize, ECDSA (Elliptic Curve Digital Signature 
         Algorithm) with NIST curve P-384, and EdDSA (Edwards-curve Digital Signature Algorithm) with 
         ed25519 signature schema
-        usage:ECDSA/RSA/ed25519 , Requires user role: ADMIN"""
-        
-        payload = f"<Configuration>\r\n\t<NetworkServices>\r\n\t\t<SSH>\r\n\t\t\t<HostKeyAlgorithm>{algorithm}</HostKeyAlgorithm>\r\n\t\t\t</SSH>\r\n\t\t</NetworkServices>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-        
-    def set_touchpanel_remote_pairing(self,mode:str,output_debug:bool=False):
+        usage:ECDSA/RSA/ed25519 , Requires user role: ADMIN"""),
+    "set_touchpanel_remote_pairing": ("Peripherals/Pairing/CiscoTouchPanels/RemotePairing", "mode: str",
         """Description: In order to use a touch controller (Cisco Webex Room Navigator or Cisco Touch 10) as user 
         interface for the video conferencing device, the touch controller must be paired to the device. 
         When the touch controller is paired via the network (LAN), this is referred to as remote pairing. 
         Remote pairing is allowed by default; you must switch this setting Off if you want to prevent 
         remote pairing.
-        Usage: On/Off, Requires user role: ADMIN"""
-        
-        payload = f"<Configuration>\r\n\t<Peripherals>\r\n\t\t<Pairing>\r\n\t\t\t<CiscoTouchPanels>\r\n\t\t\t\t<RemotePairing>{mode}</RemotePairing>\r\n\t\t\t</CiscoTouchPanels>\r\n\t\t\t</Pairing>\r\n\t\t</Peripherals>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_provisioning_mode(self,mode:str,output_debug:bool=False):
+        Usage: On/Off, Requires user role: ADMIN"""),
+    "set_provisioning_mode": ("Provisioning/Mode", "mode: str",
         """Description: It is possible to configure a device using a provisioning system (external manager). This allows 
         video conferencing network administrators to manage many devices simultaneously. With this 
         setting you choose which type of provisioning system to use. Provisioning can also be switched 
         off. Contact your provisioning system provider/representative for more information.
-        Usage: Off/Auto/CUCM/Edge/Webex/WebexCalling/TMS/VCS , Requires user role: ADMIN, USER"""
-        
-        payload = f"<Configuration>\r\n\t<Provisioning>\r\n\t\t<Mode>{mode}</Mode>\r\n\t</Provisioning>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_provisioning_login_name(self,name:str,output_debug:bool=False):
+        Usage: Off/Auto/CUCM/Edge/Webex/WebexCalling/TMS/VCS , Requires user role: ADMIN, USER"""),
+    "set_provisioning_login_name": ("Provisioning/LoginName", "name: str",
         """Desscription: This is the username part of the credentials used to authenticate the device with the provisioning server. 
         This setting must be used when required by the provisioning server
-        Usage:  Suppy login name ,Requires user role: ADMIN, USER"""
-        
-        payload = f"<Configuration>\r\n\t<Provisioning>\r\n\t\t<LoginName>{name}</LoginName>\r\n\t</Provisioning>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    
-    def set_provisioning_login_password(self,password:str,output_debug:bool=False):
+        Usage:  Suppy login name ,Requires user role: ADMIN, USER"""),
+    "set_provisioning_login_password": ("Provisioning/Password", "password: str",
         """Desscription: This is the password part of the credentials used to authenticate the device with the provisioning server. 
         This setting must be used when required by the provisioning server
-        Usage:  Supply password ,Requires user role: ADMIN, USER"""
-        
-        payload = f"<Configuration>\r\n\t<Provisioning>\r\n\t\t<Password>{password}</Password>\r\n\t</Provisioning>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_provisioning_webex_edge(self,mode:str,output_debug:bool=False):
+        Usage:  Supply password ,Requires user role: ADMIN, USER"""),
+    "set_provisioning_webex_edge": ("Provisioning/WebexEdge", "mode: str",
         """Define if the device is linked to Webex Edge for Devices, which gives access to select Webex 
         cloud services.
         The setting applies only to devices that are registered to an on-premises service
-        Usage: Off/On, Requires user role: ADMIN, USER"""
-        
-        payload = f"<Configuration>\r\n\t<Provisioning>\r\n\t\t<WebexEdge>{mode}</WebexEdge>\r\n\t</Provisioning>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_provisioning_tls_verify(self,mode:str,output_debug:bool=False):
+        Usage: Off/On, Requires user role: ADMIN, USER"""),
+    "set_provisioning_tls_verify": ("Provisioning/TlsVerify", "mode: str",
         """Description: This setting applies when a video conferencing device connects to a provisioning server via 
         HTTPS.
         Before establishing a connection between the device and the HTTPS server, the device checks 
@@ -2197,21 +3575,13 @@ class Cisco_RoomOS:
         There are two exceptions to this rule: 1) For compatibility reasons, the minimum TLS version is 
         1.0 for devices that are registered to CUCM. 2) Devices registered to the Webex cloud service 
         always use version 1.2.
-        Usage: Off/On , Requires user role: ADMIN, USER"""
-        
-        payload = f"<Configuration>\r\n\t<Provisioning>\r\n\t\t<TlsVerify>{mode}</TlsVerify>\r\n\t</Provisioning>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_proximity_alternate_port(self,mode:str,output_debug:bool=False):
+        Usage: Off/On , Requires user role: ADMIN, USER"""),
+    "set_proximity_alternate_port": ("Proximity/AlternatePort/Enabled", "mode: str",
         """Description: This setting applies only when NetworkServices HTTP Mode is set to HTTP+HTTPS or HTTPS.
         By default, Proximity connections use TCP port 443. Use this setting to allow Proximity 
         connections also on port 65533
-        Usage: True/ False, Requires user role: ADMIN"""
-        
-        payload = f"<Configuration>\r\n\t<Proximity>\r\n\t\t<AlternatePort>\r\n\t\t\t<Enabled>{mode}</Enabled>\r\n\t</AlternatePort>\r\n\t</Proximity>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_proximity_mode(self,mode:str,output_debug:bool=False):
+        Usage: True/ False, Requires user role: ADMIN"""),
+    "set_proximity_mode": ("Proximity/Mode", "mode: str",
         """Description: The Proximity Mode setting has no effect for devices that are registered to the Webex cloud 
         service. To prevent a cloud registered device from sending ultrasound pairing messages, you 
         must set Audio Ultrasound MaxVolume to 0.
@@ -2224,81 +3594,39 @@ class Cisco_RoomOS:
         The Proximity Mode and Audio Ultrasound MaxVolume settings only affect ultrasound pairing 
         messages. To stop all ultrasound emissions, the RoomAnalytics PeoplePresenceDetector and 
         Standby WakeupOnMotionDetection settings must also be switched Off.
-        Usage: Off/On , Requires user role: ADMIN, USER"""
-
-        payload = f"<Configuration>\r\n\t<Proximity>\r\n\t\t<Mode>{mode}</Mode>\r\n\t</Proximity>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_proximity_services_callcontrol(self,mode:str,output_debug:bool=False):
+        Usage: Off/On , Requires user role: ADMIN, USER"""),
+    "set_proximity_services_callcontrol": ("Proximity/Services/CallControl", "mode: str",
         """Description: Enable or disable basic call control features on Cisco collaboration clients. When this setting is 
         enabled, you are able to control a call using a Cisco collaboration client (for example dial, mute, 
         adjust volume and hang up). This service is supported by mobile devices (iOS and Android). 
         Proximity Mode must be On for this setting to take any effect.
-        Usage: Enabled/Disabled, Requires user role: ADMIN, USER"""
-        
-        payload = f"<Configuration>\r\n\t<Proximity>\r\n\t\t<Services>\r\n\t\t\t<CallControl>{mode}</CallControl>\r\n\t</Services>\r\n\t</Proximity>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_proximity_contentshare_from_clients(self,mode:str,output_debug:bool=False):
+        Usage: Enabled/Disabled, Requires user role: ADMIN, USER"""),
+    "set_proximity_contentshare_from_clients": ("Proximity/Services/ContentShare/FromClients", "mode: str",
         """Description: Enable or disable content sharing from Cisco collaboration clients. When this setting is enabled, 
         you can share content from a Cisco collaboration client wirelessly on the device, e.g. share your 
         laptop screen. This service is supported by laptops (OS X and Windows). Proximity Mode must 
         be On for this setting to take any effect.
-        Usage: Enabled/ Disabled , Requires user role: ADMIN, USER"""
-        
-        payload = f"<Configuration>\r\n\t<Proximity>\r\n\t\t<Services>\r\n\t\t\t<ContentShare>\r\n\t\t\t<FromClients>{mode}</FromClients>\r\n\t</ContentShare>\r\n\t</Services>\r\n\t</Proximity>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_ambient_noise_estimation_interval(self,interval:int=10,output_debug:bool=False):
-        """Set the interval at which the ambient noise estimation is run, if enabled. The xConfiguration 
-        RoomAnalytics AmbientNoiseEstimation Mode can be used to enable or disable ambient noise 
-        estimations.
-        Usage:  (Default 10)-60 ,Requires user role: ADMIN, INTEGRATOR, USER"""
-        
-        payload = f"<Configuration>\r\n\t<RoomAnalytics>\r\n\t\t<AmbientNoiseEstimation>\r\n\t\t\t<Interval>{int(interval)}</Interval>\r\n\t</AmbientNoiseEstimation>\r\n\t</RoomAnalytics>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_ambient_noise_estimation_mode(self,mode:str,output_debug:bool=False):
+        Usage: Enabled/ Disabled , Requires user role: ADMIN, USER"""),
+    "set_ambient_noise_estimation_mode": ("RoomAnalytics/AmbientNoiseEstimation/Mode", "mode: str",
         """Description: The device can estimate the stationary ambient noise level (background noise level) in the 
         room. The result is reported in the RoomAnalytics AmbientNoise Level dBA status. The status 
         is updated when a new ambient noise level is detected
-        Usage : Off/On, Requires user role: ADMIN, INTEGRATOR, USER"""
-        
-        payload = f"<Configuration>\r\n\t<RoomAnalytics>\r\n\t\t<AmbientNoiseEstimation>\r\n\t\t\t<Mode>{mode}</Mode>\r\n\t</AmbientNoiseEstimation>\r\n\t</RoomAnalytics>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_people_count_out_of_call_mode(self, mode:str, output_debug:bool=False):
+        Usage : Off/On, Requires user role: ADMIN, INTEGRATOR, USER"""),
+    "set_people_count_out_of_call_mode": ("RoomAnalytics/PeopleCountOutOfCall", "mode: str",
         """By using face detection, the device has the capability to find how many persons are in the 
         room. By default, the device only counts people when in a call, or when displaying the self-view 
         picture.
         Codec Plus, Codec Pro: Applies only when the device has a Cisco Quad Camera connected.
-        Usage: On/Off ,Requires user role: ADMIN, INTEGRATOR, USER"""
-        
-        payload = f"<Configuration>\r\n\t<RoomAnalytics>\r\n\t\t<PeopleCountOutOfCall>{mode}</PeopleCountOutOfCall>\r\n\t</RoomAnalytics>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_people_presence_detector_mode(self,mode:str,output_debug:bool=False):
+        Usage: On/Off ,Requires user role: ADMIN, INTEGRATOR, USER"""),
+    "set_people_presence_detector_mode": ("RoomAnalytics/PeoplePresenceDetector", "mode: str",
         """Description: The device has the capability to find whether or not people are present in the room, and report 
         the result in the RoomAnalytics PeoplePresence status. The feature is based on ultrasound. 
         Read the status description for more details.
         Ultrasound signals for presence detection are not emitted when both this setting AND 
         the Standby WakeupOnMotionDetection setting are switched Off. The Audio Ultrasound 
         MaxVolume and Proximity Mode settings has no effect on presence detection
-        Usage: On/ Off , Requires user role: ADMIN, INTEGRATOR, USER"""
-        
-        payload = f"<Configuration>\r\n\t<RoomAnalytics>\r\n\t\t<PeoplePresenceDetector>{mode}</PeoplePresenceDetector>\r\n\t</RoomAnalytics>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_reverberation_time_interval(self,interval:int=1800,output_debug:bool=False):
-        """Description: Defines how often the RT60 will be measured and reported to the RoomAnalytics status. The 
-        interval is in seconds.
-        The RoomAnalytics ReverberationTime Mode configuration must be enabled to set the interval.
-        Usage: Supply interval value (60-3600), default = 1800, Requires user role: ADMIN, INTEGRATOR, USER"""
-        
-        payload = f"<Configuration>\r\n\t<RoomAnalytics>\r\n\t\t<ReverberationTime>\r\n\t\t\t<Interval>{int(interval)}</Interval>\r\n\t</ReverberationTime>\r\n\t</RoomAnalytics>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_reverberation_time_mode(self,mode:str,output_debug:bool=False):
+        Usage: On/ Off , Requires user role: ADMIN, INTEGRATOR, USER"""),
+    "set_reverberation_time_mode": ("RoomAnalytics/ReverberationTime/Mode", "mode: str",
         """Description: Reverberation time is a measure of how fast a sound will "fade away" or decay in a room.
         This is highly related to the perception of the acoustic quality of a room.
         The Cisco Webex devices are capable of measuring the reverberation time, RT60, directly from 
@@ -2309,629 +3637,280 @@ class Cisco_RoomOS:
         correct according to the ISO 3382-2 standard.
         The measurements will measure the RT60 values for each octave band from 125 Hz to 4 kHz.
         Usage: On/ Off, Requires user role: ADMIN, INTEGRATOR, USER
-        """
-        
-        
-        payload = f"<Configuration>\r\n\t<RoomAnalytics>\r\n\t\t<ReverberationTime>\r\n\t\t\t<Mode>{mode}</Mode>\r\n\t</ReverberationTime>\r\n\t</RoomAnalytics>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_ssh_welcome_text(self,mode:str,output_debug:bool=False):
+        """),
+    "set_ssh_welcome_text": ("NetworkServices/WelcomeText", "mode: str",
         """Description: Choose which information the user should see when logging on to the device through SSH
         Off: The welcome text is: Login successful
         On: The welcome text is: Welcome to <system name>; Software version; Software 
         release date; Login successful.
-        Usage: message in string format"""
-        
-        payload = f"<Configuration>\r\n\t<NetworkServices>\r\n\t\t<WelcomeText>{mode}</WelcomeText>\r\n\t\t</NetworkServices>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_ntp_mode(self,mode:str,output_debug:bool=False):
-        """Description: The Network Time Protocol (NTP) is used to synchronize the device's time and date to a reference time server. The time server will be queried regularly for time updates.
-        Usage: Auto/Off , Requires user role: ADMIN"""
-        
-        payload = f"<Configuration>\r\n\t<NetworkServices>\r\n\t\t<NTP>\r\n\t<Mode>{mode}</Mode>\r\n\t\t</NTP>\r\n\t\t</NetworkServices>\r\n</Configuration>"
-        if mode == "Auto" or mode == "Off":
-            return (self.__post_parser_return(payload,output_debug))
-        else:
-            raise Exception("Illegal Value")
-        
-    def set_ntp_manual_mode(self,address:str,order:int=1,output_debug:bool=False):
-        #TO BE CHECKED
-        payload_manual = f"<Configuration>\r\n\t<NetworkServices>\r\n\t\t<NTP>\r\n\t<Mode>{address}</Mode>\r\n\t\t</NTP>\r\n\t\t</NetworkServices>\r\n</Configuration>"
-        manual_setting = str(self.__post_parser_return(payload_manual,output_debug))
-        if "Success" in manual_setting:
-            payload_set = f"<Configuration>\r\n\t<NetworkServices>\r\n\t\t<NTP>\r\n\t\t\t<Server>{order}</Server><Address>{address}</Address>\r\n\t\t</NTP>\r\n\t</NetworkServices>\r\n</Configuration>"
-            return (self.__post_parser_return(payload_set,output_debug))
-    
-        
-    def set_cdp_mode(self,mode:str,output_debug:bool=False):
+        Usage: message in string format"""),
+    "set_cdp_mode": ("NetworkServices/CDP/Mode", "mode: str",
         """Description: Enable or disable the CDP (Cisco Discovery Protocol) daemon. Enabling CDP will make the 
             device report certain statistics and device identifiers to a CDP-enabled switch. If CDP is 
             disabled, the Network VLAN Voice Mode: Auto setting will not work
-        Usage: Off/On , Requires user role: ADMIN"""
-        
-        payload = f"<Configuration>\r\n\t<NetworkServices>\r\n\t\t<CDP>\r\n\t<Mode>{mode}</Mode>\r\n\t\t</CDP>\r\n\t\t</NetworkServices>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_http_mode(self,mode: str,output_debug: bool=False):
+        Usage: Off/On , Requires user role: ADMIN"""),
+    "set_http_mode": ("NetworkServices/HTTP/Mode", "mode: str",
         """Description: Define whether or not to allow access to the device using the HTTP or HTTPS (HTTP Secure) 
         protocols. Note that the device's web interface use HTTP or HTTPS. If this setting is switched 
         Off, you cannot use the web interface.
         For additional security (encryption and decryption of requests and pages that are returned by 
         the web server), allow only HTTPS.
-        Usage: Off/HTTP+HTTPS/HTTPS"""
-        
-        payload = f"<Configuration>\r\n\t<NetworkServices>\r\n\t\t<HTTP>\r\n\t<Mode>{mode}</Mode>\r\n\t\t</HTTP>\r\n\t\t</NetworkServices>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_http_proxy_mode(self,mode:str,output_debug:bool=False):
-        
-        """Description: You can configure to use a proxy server for HTTP, HTTPS, and WebSocket traffic. The HTTP 
-        proxy can be set up manually, it can be auto-configured (PACUrl), fully automated (WPAD), or it 
-        can be turned off.
-        If NetworkServices HTTP Proxy Mode is not turned Off, you can further specify which 
-        services shall use the proxy in the HttpClient UseHttpProxy, HttpFeedback UseHttpProxy, and 
-        WebEngine UseHttpProxy settings.
-        Communication with the Cisco Webex cloud will always go via the proxy if NetworkServices 
-        HTTP Proxy Mode is not turned Off.
-        Regardless of the Proxy Mode, the device will never communicate with CUCM, MRA (CUCM via 
-        Expressway), or TMS via proxy.
-        Usage : Manual/Off/PACUrl/WPAD"""
-        
-        if mode == "Manual":
-             global __man_flag
-             __man_flag = 1
-        elif mode == "Off" or mode=="WPAD":
-             #__man_flag, PACUrl_flag
-             __man_flag = 0;PACUrl_flag=0;
-        elif mode == "PACUrl":
-            global __PACUrl_flag
-            __PACUrl_flag=1
-
-        payload = f"<Configuration>\r\n\t<NetworkServices>\r\n\t\t<HTTP>\r\n\t\t<Proxy>\r\n\t<Mode>{mode}</Mode>\r\n\t\t</Proxy>\r\n\t\t</HTTP>\r\n\t\t</NetworkServices>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_http_proxy_url(self,url:str,output_debug:bool=False):
-        """Description: Requires user role: ADMIN, USER
-        Set the URL of the HTTP proxy server. Requires that the NetworkServices HTTP Proxy Mode is 
-        set to Manual.
-        Usage: Requires user role: ADMIN, USER
-        Set the URL of the HTTP proxy server. Requires that the NetworkServices HTTP Proxy Mode is 
-        set to Manual."""
-        global __man_flag
-        if __PACUrl_flag==0 and __man_flag==1:
-            
-            __man_flag = 0
-            payload = f"<Configuration>\r\n\t<NetworkServices>\r\n\t\t<HTTP>\r\n\t\t<Proxy>\r\n\t<Url>{url}</Url>\r\n\t\t</Proxy>\r\n\t\t</HTTP>\r\n\t\t</NetworkServices>\r\n</Configuration>"
-            return (self.__post_parser_return(payload,output_debug))
-        else:
-            raise Exception("Please set proxy mode to manual with set_http_proxy_mode('Manual') and try again")
-    
-    def set_http_proxy_pacurl(self,url:str,output_debug:bool=False):
-        """Description: Set the URL of the PAC (Proxy Auto Configuration) script. Requires that the NetworkServices 
-        HTTP Proxy Mode is set to PACUrl
-        Usage: supply URL ,Requires user role: ADMIN, USER"""
-        global __PACUrl_flag
-        if __PACUrl_flag==1 and __man_flag==0:
-            
-            __PACUrl_flag = 0
-            payload = f"<Configuration>\r\n\t<NetworkServices>\r\n\t\t<HTTP>\r\n\t\t<Proxy>\r\n\t<PACUrl>{url}</PACUrl>\r\n\t\t</Proxy>\r\n\t\t</HTTP>\r\n\t\t</NetworkServices>\r\n</Configuration>"
-            return (self.__post_parser_return(payload,output_debug))
-        else:
-            raise Exception("Please set proxy mode to PACUrl with set_http_proxy_mode('PACUrl') and try again")
-    
-    def set_https_min_tls(self,tlsv:str,output_debug:bool=False):
+        Usage: Off/HTTP+HTTPS/HTTPS"""),
+    "set_https_min_tls": ("NetworkServices/HTTPS/Server/MinimumTLSVersion", "tlsv: str",
         """Description: Set the lowest version of the TLS (Transport Layer Security) protocol that is allowed for HTTPS.
-        Usage: Requires user role: ADMIN , TLSv1.1/TLSv1.2"""
-        
-        payload = f"<Configuration>\r\n\t<NetworkServices>\r\n\t\t<HTTPS>\r\n\t\t<Server>\r\n\t<MinimumTLSVersion>{tlsv}</MinimumTLSVersion>\r\n\t\t</Server>\r\n\t\t</HTTPS>\r\n\t\t</NetworkServices>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_https_strict_transport(self,mode:str,output_debug:bool=False):
+        Usage: Requires user role: ADMIN , TLSv1.1/TLSv1.2"""),
+    "set_https_strict_transport": ("NetworkServices/HTTPS/StrictTransportSecurity", "mode: str",
         """Description: The HTTP Strict Transport Security header lets a web site inform the browser that it should 
         never load the site using HTTP and should automatically convert all attempts to access the site 
         using HTTP to HTTPS requests instead
-        Usage: Requires user role: ADMIN, Off/On"""
-        
-        payload = f"<Configuration>\r\n\t<NetworkServices>\r\n\t\t<HTTPS>\r\n\t\t<StrictTransportSecurity>{mode}</StrictTransportSecurity>\r\n\t\t</HTTPS>\r\n\t\t</NetworkServices>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_incoming_call_notification(self,mode:str,output_debug:bool=False):
+        Usage: Requires user role: ADMIN, Off/On"""),
+    "set_incoming_call_notification": ("UserInterface/Accessibility/IncomingCallNotification", "mode: str",
         """Description: You can enable an incoming call notification with amplified visuals. The screen and touch 
         controller will flash red/white approximately once every second (1.75 Hz) to make it easier for 
         hearing impaired users to notice an incoming call. If the device is already in a call the screen 
         will not flash as this will disturb the on-going call, instead you will get a normal notification on 
         screen and touch panel.
-        Usage: AmplifiedVisuals/Default , Requires user role: ADMIN, INTEGRATOR, USER"""
-        
-        payload = f"<Configuration>\r\n\t<UserInterface>\r\n\t\t<Accessibility>\r\n\t\t<IncomingCallNotification>{mode}</IncomingCallNotification>\r\n\t\t</Accessibility>\r\n\t\t</UserInterface>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-        
-    def set_ui_webex_assistance(self,mode:str,output_debug:bool=False):
+        Usage: AmplifiedVisuals/Default , Requires user role: ADMIN, INTEGRATOR, USER"""),
+    "set_ui_webex_assistance": ("UserInterface/Assistant/Mode", "mode: str",
         """Description: Webex Assistant allows you to control the device by using voice commands. Webex Assistant 
         is a cloud service, so the device must either be registered to the Webex cloud service or registered to an on-premises service and linked to Webex Edge for Devices. 
         Use this setting to enable or disable the Webex Assistant on the device
-        Usage:  Off/On ,Requires user role: ADMIN"""
-        
-        payload = f"<Configuration>\r\n\t<UserInterface>\r\n\t\t<Assistant>\r\n\t\t<Mode>{mode}</Mode>\r\n\t\t</Assistant>\r\n\t\t</UserInterface>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_ui_bookings_visibility_tree(self,mode:str,output_debug:bool=False):
+        Usage:  Off/On ,Requires user role: ADMIN"""),
+    "set_ui_bookings_visibility_tree": ("UserInterface/Bookings/Visibility/Title", "mode: str",
         """Description: Sets the meeting details to private. “Schedule meeting” will be displayed as the title of the 
         meeting.
-        Usage: Auto/Hidden, Requires user role: ADMIN, INTEGRATOR, USER"""
-        
-        payload = f"<Configuration>\r\n\t<UserInterface>\r\n\t\t<Bookings>\r\n\t\t<Visibility>\r\n\t\t<Title>{mode}</Title>\r\n\t\t</Visibility>\r\n\t\t</Bookings>\r\n\t\t</UserInterface>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_ui_branding_awake_colors(self, mode:str, output_debug:bool=False):
+        Usage: Auto/Hidden, Requires user role: ADMIN, INTEGRATOR, USER"""),
+    "set_ui_branding_awake_colors": ("UserInterface/Branding/AwakeBranding/Colors", "mode: str",
         """Description: If the device is set up with branding customizations, this setting affects the colors of the 
         logo that is shown when the device is awake. You can choose whether you want to show the 
         logo in full color, or reduce the opacity of the logo so that it blends in more naturally with the 
         background and other elements on the screen.
-        Usage: Auto/Native , Requires user role: ADMIN, INTEGRATOR"""
-        
-        payload = f"<Configuration>\r\n\t<UserInterface>\r\n\t\t<Branding>\r\n\t\t<AwakeBranding>\r\n\t\t<Colors>{mode}</Colors>\r\n\t\t</AwakeBranding>\r\n\t\t</Branding>\r\n\t\t</UserInterface>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    
-    def set_ui_contact_info_type(self,mode:str,output_debug:bool=False):
+        Usage: Auto/Native , Requires user role: ADMIN, INTEGRATOR"""),
+    "set_ui_contact_info_type": ("UserInterface/ContactInfo/Type", "mode: str",
         """Description: Choose which type of contact information to show in the user interface
-        Usage:  Auto/DisplayName/E164Alias/H320Number/H323Id/IPv4/IPv6/None/SipUri/SystemName, Requires user role: ADMIN"""
-        
-        payload = f"<Configuration>\r\n\t<UserInterface>\r\n\t\t<ContactInfo>\r\n\t\t<Type>{mode}</Type>\r\n\t\t</ContactInfo>\r\n\t\t</UserInterface>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_ui_ket_tones_mode(self,mode:str,output_debug:bool=False):
+        Usage:  Auto/DisplayName/E164Alias/H320Number/H323Id/IPv4/IPv6/None/SipUri/SystemName, Requires user role: ADMIN"""),
+    "set_ui_ket_tones_mode": ("UserInterface/KeyTones/Mode", "mode: str",
         """Description: You can configure the device to make a keyboard click sound effect (key tone) when typing text 
         or numbers.
-        Usage: Off/On , Requires user role: ADMIN, USER."""
-        
-        payload = f"<Configuration>\r\n\t<UserInterface>\r\n\t\t<KeyTones>\r\n\t\t<Mode>{mode}</Mode>\r\n\t\t</KeyTones>\r\n\t\t</UserInterface>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_ui_features_call_end(self,mode:str,output_debug:bool=False):
+        Usage: Off/On , Requires user role: ADMIN, USER."""),
+    "set_ui_features_call_end": ("UserInterface/Features/Call/End", "mode: str",
         """Description: Choose whether or not to remove the default End Call button from the user interface. The 
         setting removes only the button, not its functionality as such.
-        Usage:  Auto/Hidden, Requires user role: ADMIN, INTEGRATOR"""
-        
-        payload = f"<Configuration>\r\n\t<UserInterface>\r\n\t\t<Features>\r\n\t\t<Call>r\n\t\t<End>{mode}</End>\r\n\t\t</Call>\r\n\t\t</Features>\r\n\t\t</UserInterface>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_ui_features_call_keypad(self,mode:str,output_debug:bool=False):
+        Usage:  Auto/Hidden, Requires user role: ADMIN, INTEGRATOR"""),
+    "set_ui_features_call_keypad": ("UserInterface/Features/Call/End", "mode: str",
         """Description: Choose whether or not to remove the default in-call Keypad button from the user interface. 
         This button opens a keypad, which for example can be used for DTMF input.
-        Usage:  Auto/Hidden ,Requires user role: ADMIN, INTEGRATOR"""
-        
-        payload = f"<Configuration>\r\n\t<UserInterface>\r\n\t\t<Features>\r\n\t\t<Call>r\n\t\t<End>{mode}</End>\r\n\t\t</Call>\r\n\t\t</Features>\r\n\t\t</UserInterface>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_time_zone(self,zone:str,output_debug:bool=False):
+        Usage:  Auto/Hidden ,Requires user role: ADMIN, INTEGRATOR"""),
+    "set_time_zone": ("Time/Zone", "zone: str",
         """Description: Define the time zone for the geographical location of the device. The information in the value 
         space is from the tz database, also called the IANA Time Zone Database.
-        Usage: Zone , Requires user role: ADMIN, INTEGRATOR, USER"""
-        
-        payload = f"<Configuration>\r\n\t<Time>\r\n\t\t<Zone>\{zone}</Zone>\r\n\t\t</Time>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_time_format(self, time_format:int,output_debug:bool=False):
-        """Description: Define the time format
-        Usage: 24/12, Requires user role: ADMIN, USER"""
-        
-        payload = f"<Configuration>\r\n\t<Time>\r\n\t\t<TimeFormat>\{time_format}H</TimeFormat>\r\n\t\t</Time>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_date_format(self, date_format:str,output_debug:bool=False):
+        Usage: Zone , Requires user role: ADMIN, INTEGRATOR, USER"""),
+    "set_date_format": ("Time/DateFormat", "date_format: str",
         """Descriotion: Define the date format.
-        Usage: DD_MM_YY/MM_DD_YY/YY_MM_DD, Requires user role: ADMIN, USER"""
-        
-        payload = f"<Configuration>\r\n\t<Time>\r\n\t\t<DateFormat>{date_format}</DateFormat>\r\n\t\t</Time>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_standby_boot_action(self, camrea_pos:str,output_debug=False):
+        Usage: DD_MM_YY/MM_DD_YY/YY_MM_DD, Requires user role: ADMIN, USER"""),
+    "set_standby_boot_action": ("Standby/BootAction", "camrea_pos: str",
         """Description: Define the camera position after a restart of the video conferencing device
-        Usage: None/DefaultCameraPosition/RestoreCameraPosition, Requires user role: ADMIN, INTEGRATOR, USER"""
-        
-        payload = f"<Configuration>\r\n\t<Standby>\r\n\t\t<BootAction>{camrea_pos}</BootAction>\r\n\t\t</Standby>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-        
-    
-    def set_standby_control(self,mode:str,output_debug:bool=False):
+        Usage: None/DefaultCameraPosition/RestoreCameraPosition, Requires user role: ADMIN, INTEGRATOR, USER"""),
+    "set_standby_control": ("Standby/Control", "mode: str",
         """Description: Define whether the device should go into standby mode or not
-        Usage: Off/On, Requires user role: ADMIN, INTEGRATOR"""
-        
-        payload = f"<Configuration>\r\n\t<Standby>\r\n\t\t<Control>{mode}</Control>\r\n\t\t</Standby>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_standby_signage_audio(self, mode:str="Off",output_debug:bool=False):
+        Usage: Off/On, Requires user role: ADMIN, INTEGRATOR"""),
+    "set_standby_signage_audio": ("Standby/Signage/Audio", "mode: str = 'Off'",
         """By default, a device does not play out audio in digital signage mode even if the web page has 
         audio. You can use this setting to override the default behavior.
-        Usage: Off/On ,Requires user role: ADMIN, INTEGRATOR"""
-        
-        payload = f"<Configuration>\r\n\t<Standby>\r\n\t\t<Signage>\r\n\t\t\t<Audio>{mode}</Audio>\r\n\t\t</Signage>\r\n\t\t</Standby>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_standby_delay(self, delay:int=7, output_debug:bool=False):
-        """Descreiption: Define how long (in minutes) the device shall be in idle mode before it goes into standby mode. 
-        Requires the Standby Control to be enabled.
-        Usage: Integer (1..480), Requires user role: ADMIN, INTEGRATOR"""
-        
-        payload = f"<Configuration>\r\n\t<Standby>\r\n\t\t<Delay>{int(delay)}</Delay>\r\n\t\t</Standby>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    
-    def set_standby_signage_mode(self,mode:str="Off",output_debug:bool=False):
+        Usage: Off/On ,Requires user role: ADMIN, INTEGRATOR"""),
+    "set_standby_signage_mode": ("Standby/Signage/Mode", "mode: str = 'Off'",
         """Description: Content from a URL (a web page) can replace the traditional half-wake background image and 
         information. This feature is called digital signage. Users can interact with the web page if the 
         device has an interactive screen, for example click on a link or enter text in a form.
         The use of digital signage does not prevent the device from entering standby the normal way. 
         Therefore, the Standby Delay setting determines for how long the digital signage is shown 
         before the device goes into standby.
-        Usage: Off/On, Requires user role: ADMIN, INTEGRATOR"""
-        
-        payload = f"<Configuration>\r\n\t<Standby>\r\n\t\t<Signage>\r\n\t\t\t<Mode>{mode}</Mode>\r\n\t\t</Signage>\r\n\t\t</Standby>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-        
-    def set_standby_signage_url(self, url:str,output_debug:bool=False):
+        Usage: Off/On, Requires user role: ADMIN, INTEGRATOR"""),
+    "set_standby_signage_url": ("Standby/Signage/Url", "url: str",
         """Description: Set the URL of the web page you want to display on the screen (digital signage). If the length 
         of the URL is 0, the device retains normal half-wake mode. If the URL fails, the device retains 
         normal half-wake mode and a diagnostics message is issued.
-        Usage: string of valid url, Requires user role: ADMIN, INTEGRATOR"""
-        
-        payload = f"<Configuration>\r\n\t<Standby>\r\n\t\t<Signage>\r\n\t\t\t<Url>{url}</Url>\r\n\t\t</Signage>\r\n\t\t</Standby>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_standby_signage_refresh_interval(self, interval:int=0,output_debug:bool=False):
-        """Description: You can use this setting to force a web page to refresh at regular intervals. This is useful for 
-        web pages that are not able to refresh themselves. It is not recommended to set a refresh 
-        interval with the interactive mode.
-        Usage: Integer (0..1440), Requires user role: ADMIN, INTEGRATOR"""
-        
-        payload = f"<Configuration>\r\n\t<Standby>\r\n\t\t<Signage>\r\n\t\t\t<RefreshInterval>{int(interval)}</RefreshInterval>\r\n\t\t</Signage>\r\n\t\t</Standby>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_standby_wakeup_action(self,camera_pos:str,output_debug:bool=False):
+        Usage: string of valid url, Requires user role: ADMIN, INTEGRATOR"""),
+    "set_standby_wakeup_action": ("Standby/WakeupAction", "camera_pos: str",
         """Define the camera position when leaving standby mode
-        Usage:None/RestoreCameraPosition/DefaultCameraPosition, Requires user role: ADMIN, INTEGRATOR, USER"""
-        
-        payload = f"<Configuration>\r\n\t<Standby>\r\n\t\t<WakeupAction>{camera_pos}</WakeupAction>\r\n\t\t</Standby>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-        
-    def set_standby_wakeup_motion_detection(self,mode:str,output_debug:bool=False):
+        Usage:None/RestoreCameraPosition/DefaultCameraPosition, Requires user role: ADMIN, INTEGRATOR, USER"""),
+    "set_standby_wakeup_motion_detection": ("Standby/WakeupOnMotionDetection", "mode: str",
         """Automatic wake up on motion detection is a feature that allows the device to detect when 
         people enter the room. The feature is based on ultrasound detection.
         Ultrasound signals for motion detection are not emitted when both this setting AND the 
         RoomAnalytics PeoplePresenceDetector setting are switched Off. The Audio Ultrasound 
         MaxVolume and Proximity Mode settings has no effect on motion detection
-        Usage: Off/On , Requires user role: ADMIN, INTEGRATOR"""
-        
-        payload = f"<Configuration>\r\n\t<Standby>\r\n\t\t<WakeupOnMotionDetection>{mode}</WakeupOnMotionDetection>\r\n\t\t</Standby>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-        
-    def set_system_unit_name(self,name:str,output_debug:bool=False):
+        Usage: Off/On , Requires user role: ADMIN, INTEGRATOR"""),
+    "set_system_unit_name": ("SystemUnit/Name", "name: str",
         """Description: Define the device name. The device name will be sent as the hostname in a DHCP request and 
         when the device is acting as an SNMP Agent
-        Usage: String ,Requires user role: ADMIN"""
-        
-        payload = f"<Configuration>\r\n\t<SystemUnit>\r\n\t\t<Name>{name}</Name>\r\n\t\t</SystemUnit>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-        
-    def set_system_unit_crash_reporting(self,mode:str,output_debug:bool=False):
+        Usage: String ,Requires user role: ADMIN"""),
+    "set_system_unit_crash_reporting": ("SystemUnit/CrashReporting/Mode", "mode: str",
         """Description: If the device crashes, the device can automatically send logs to the Cisco Automatic Crash 
         Report tool (ACR) for analyses. The ACR tool is for Cisco internal usage only and not available 
         to customers
-        Usage: Off/On , Requires user role: ADMIN"""
-        
-        payload = f"<Configuration>\r\n\t<SystemUnit>\r\n\t\t<CrashReporting>\r\n\t\t<Mode>{mode}</Mode>\r\n\t\t</CrashReporting>\r\n\t\t</SystemUnit>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_system_unit_crash_report_url(self,url:str,output_debug:bool=False):
+        Usage: Off/On , Requires user role: ADMIN"""),
+    "set_system_unit_crash_report_url": ("SystemUnit/CrashReporting/Url", "url: str",
         """Description: If the device crashes, the device can automatically send logs to the Cisco Automatic Crash 
         Report tool (ACR) for analyses. The ACR tool is for Cisco internal usage only and not available 
         to customers
-        Usage: String with valid url, Requires user role: ADMIN"""
-        
-        payload = f"<Configuration>\r\n\t<SystemUnit>\r\n\t\t<CrashReporting>\r\n\t\t<Url>{url}</Url>\r\n\t\t</CrashReporting>\r\n\t\t</SystemUnit>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))  
-    
-    def set_system_unit_custom_id(self, sys_id:str,output_debug:bool=False):
+        Usage: String with valid url, Requires user role: ADMIN"""),
+    "set_system_unit_custom_id": ("SystemUnit/CustomDeviceId", "sys_id: str",
         """Description: The SystemUnit CustomDeviceId provides a place for you to store custom information about a 
         unit. This can be useful, for example, in aiding to track devices in a provisioning setup).
-        Usage: String (0..255), Requires user role: ADMIN, INTEGRATOR"""
-        
-        payload = f"<Configuration>\r\n\t<SystemUnit>\r\n\t\t<CustomDeviceId>{sys_id}</CustomDeviceId>\r\n\t\t</SystemUnit>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))  
-    
-    def set_sip_anat(self, mode:str="On",output_debug:bool=False):
+        Usage: String (0..255), Requires user role: ADMIN, INTEGRATOR"""),
+    "set_sip_anat": ("SIP/ANAT", "mode: str = 'On'",
         """Description: ANAT (Alternative Network Address Types) enables media negotiation for multiple addresses 
         and address types, as specified in RFC 4091.
-        Usage: Off/On, Requires user role: ADMIN"""
-        
-        payload = f"<Configuration>\r\n\t<SIP>\r\n\t\t<ANAT>{mode}</ANAT>\r\n\t\t</SIP>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))  
-    
-    def set_sip_auth_username(self,name:str,output_debug:bool=False):
+        Usage: Off/On, Requires user role: ADMIN"""),
+    "set_sip_auth_username": ("SIP/Authentication/UserName", "name: str",
         """Description: This is the username part of the credentials used to authenticate towards the SIP proxy
-        Usage: String (0..128), Requires user role: ADMIN"""
-        
-        payload = f"<Configuration>\r\n\t<SIP>\r\n\t\t<Authentication>\r\n\t\t<UserName>{name}</UserName>\r\n\t\t</Authentication>\r\n\t\t</SIP>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))  
-    
-    def set_sip_auth_password(self,password:str,output_debug:bool=False):
+        Usage: String (0..128), Requires user role: ADMIN"""),
+    "set_sip_auth_password": ("SIP/Authentication/Password", "password: str",
         """Description: This is the password part of the credentials used to authenticate towards the SIP proxy
-        Usage: String (0..128), Requires user role: ADMIN"""
-        
-        payload = f"<Configuration>\r\n\t<SIP>\r\n\t\t<Authentication>\r\n\t\t<Password>{password}</Password>\r\n\t\t</Authentication>\r\n\t\t</SIP>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))  
-    
-    def set_sip_default_transport(self,protocol:str,output_debug:bool=False):
+        Usage: String (0..128), Requires user role: ADMIN"""),
+    "set_sip_default_transport": ("SIP/DefaultTransport", "protocol: str",
         """Description: Select the transport protocol to be used over the LAN
-        Usage: Auto/TCP/Tls/UDP, Requires user role: ADMIN"""
-        
-        payload = f"<Configuration>\r\n\t<SIP>\r\n\t\t<DefaultTransport>{protocol}</DefaultTransport>\r\n\t\t</SIP>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug)) 
-    
-    def set_sip_display_name(self,name:str,output_debug:bool=False):
+        Usage: Auto/TCP/Tls/UDP, Requires user role: ADMIN"""),
+    "set_sip_display_name": ("SIP/DisplayName", "name: str",
         """Description: When configured the incoming call will report the display name instead of the SIP URI.
-        Usage: String (0, 550), Requires user role: ADMIN"""
-        
-        payload = f"<Configuration>\r\n\t<SIP>\r\n\t\t<DisplayName>{name}</DisplayName>\r\n\t\t</SIP>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_sip_ice_mode(self,mode:str="Auto",output_debug=False):
+        Usage: String (0, 550), Requires user role: ADMIN"""),
+    "set_sip_ice_mode": ("SIP/Ice/Mode", "mode: str = 'Auto'",
         """Description: ICE (Interactive Connectivity Establishment, RFC 5245) is a NAT traversal solution that the 
         devices can use to discover the optimized media path. Thus the shortest route for audio and 
         video is always secured between the devices. Initially STUN (Session Traversal Utilities for NAT) 
         messages are exchanged when setting up the media path.
-        Usage: Auto/Off/On , Requires user role: ADMIN"""
-        
-        payload = f"<Configuration>\r\n\t<SIP>\r\n\t\t<Ice>\r\n\t\t<Mode>{mode}</Mode>\r\n\t\t</Ice>\r\n\t\t</SIP>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))  
-        
-    def set_sip_ice_default_candidate(self,mode:str="Host",output_debug=False):
+        Usage: Auto/Off/On , Requires user role: ADMIN"""),
+    "set_sip_ice_default_candidate": ("SIP/Ice/DefaultCandidate", "mode: str = 'Host'",
         """Description: The ICE protocol needs some time to reach a conclusion about which media route to use (up to 
         the first 5 seconds of a call). During this period media for the device will be sent to the Default 
-        Candidate as defined in this setting.
-        Usage: Host/Rflx/Relay, Requires user role: ADMIN"""
-        
-        payload = f"<Configuration>\r\n\t<SIP>\r\n\t\t<Ice>\r\n\t\t<DefaultCandidate>{mode}</DefaultCandidate>\r\n\t\t</Ice>\r\n\t\t</SIP>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))  
-    
-    def set_sip_listen_port_mode(self,mode:str,output_debug:bool=False):
+        Candidate as defined in this setting.
+        Usage: Host/Rflx/Relay, Requires user role: ADMIN"""),
+    "set_sip_listen_port_mode": ("SIP/ListenPort", "mode: str",
         """Description: Turn on or off the listening for incoming connections on the SIP TCP/UDP ports. If turned off, 
         the device will only be reachable through a SIP Proxy (CUCM or VCS). As a security measure, 
         SIP ListenPort should be Off when the device is registered to a SIP Proxy
-        Usage: Auto/Off/On , Requires user role: ADMIN"""
-        
-        payload = f"<Configuration>\r\n\t<SIP>\r\n\t\t<ListenPort>{mode}</ListenPort>\r\n\t\t</SIP>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))  
-    
-    def sip_min_tls_version(self,tls_version:str="TLSv1.0",output_debug:bool=False):
+        Usage: Auto/Off/On , Requires user role: ADMIN"""),
+    "sip_min_tls_version": ("SIP/MinimumTLSVersion", "tls_version: str = 'TLSv1.0'",
         """Description: Set the lowest version of the TLS (Transport Layer Security) protocol that is allowed for SIP.
-        Usage: TLSv1.0/TLSv1.1/TLSv1.2 , Requires user role: ADMIN"""
-        
-        payload = f"<Configuration>\r\n\t<SIP>\r\n\t\t<MinimumTLSVersion>{tls_version}</MinimumTLSVersion>\r\n\t\t</SIP>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-        
-        
-    def set_ui_features_join_webex(self,mode:str="Auto",output_debug:bool=False):
+        Usage: TLSv1.0/TLSv1.1/TLSv1.2 , Requires user role: ADMIN"""),
+    "set_ui_features_join_webex": ("UserInterface/Features/Call/JoinWebex", "mode: str = 'Auto'",
         """Description: Choose whether or not to remove the default Join Webex button from the user interface. 
         The button allows users to dial into a Webex meeting using just the Webex meeting number, no 
         domain is required. However, for this to work, you must set up the infrastructure to allow calls to 
         be routed to *@webex.com"
-        Usage: Auto/Hidden , Requires user role: ADMIN, INTEGRATOR"""
-        
-        payload = f"<Configuration>\r\n\t<UserInterface>\r\n\t\t<Features>\r\n\t\t<Call>r\n\t\t<JoinWebex>{mode}</JoinWebex>\r\n\t\t</Call>\r\n\t\t</Features>\r\n\t\t</UserInterface>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-                    
-    def set_ui_features_call_midcall_controls(self,mode:str="Auto",output_debug:bool=False):
+        Usage: Auto/Hidden , Requires user role: ADMIN, INTEGRATOR"""),
+    "set_ui_features_call_midcall_controls": ("UserInterface/Features/Call/MidCallControls", "mode: str = 'Auto'",
         """Description: Choose whether or not to remove the default Hold, Transfer, and Resume in-call buttons from 
         the user interface. The setting removes only the buttons, not their functionality as such.
-        Usage: Auto/Hidden ,Requires user role: ADMIN, INTEGRATOR"""
-        
-        payload = f"<Configuration>\r\n\t<UserInterface>\r\n\t\t<Features>\r\n\t\t<Call>r\n\t\t<MidCallControls>{mode}</MidCallControls>\r\n\t\t</Call>\r\n\t\t</Features>\r\n\t\t</UserInterface>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_ui_features_call_musicmode(self,mode:str="Hidden",output_debug:bool=False):
+        Usage: Auto/Hidden ,Requires user role: ADMIN, INTEGRATOR"""),
+    "set_ui_features_call_musicmode": ("UserInterface/Features/Call/MusicMode", "mode: str = 'Hidden'",
         """Description: Choose whether or not to show the toggle button for Music Mode in the user interface
-        Usage: Auto/Hidden ,Requires user role: ADMIN, INTEGRATOR"""
-        
-        payload = f"<Configuration>\r\n\t<UserInterface>\r\n\t\t<Features>\r\n\t\t<Call>r\n\t\t<MusicMode>{mode}</MusicMode>\r\n\t\t</Call>\r\n\t\t</Features>\r\n\t\t</UserInterface>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-        
-    def set_ui_features_call_start(self,mode:str="Auto",output_debug:bool=False):
+        Usage: Auto/Hidden ,Requires user role: ADMIN, INTEGRATOR"""),
+    "set_ui_features_call_start": ("UserInterface/Features/Call/Start", "mode: str = 'Auto'",
         """Description: Choose whether or not to remove the default Call button (including the directory, favorites, and 
         recent calls lists) and the default in-call Add participant button from the user interface. The 
         setting removes only the buttons, not their functionality as such.
-        Usage: Auto/Hidden , Requires user role: ADMIN, INTEGRATOR"""
-        
-        payload = f"<Configuration>\r\n\t<UserInterface>\r\n\t\t<Features>\r\n\t\t<Call>r\n\t\t<Start>{mode}</Start>\r\n\t\t</Call>\r\n\t\t</Features>\r\n\t\t</UserInterface>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_ui_features_hide_all(self,mode:bool=False,output_debug:bool=False):
+        Usage: Auto/Hidden , Requires user role: ADMIN, INTEGRATOR"""),
+    "set_ui_features_hide_all": ("UserInterface/Features/HideAll", "mode: bool = False",
         """Description: Choose whether or not to remove all default buttons from the user interface. The setting 
         removes only the buttons, not their functionality as such.
-        Usage: False/True, Requires user role: ADMIN, INTEGRATOR"""
-        
-        payload = f"<Configuration>\r\n\t<UserInterface>\r\n\t\t<Features>\r\n\t\t<HideAll>{mode}</HideAll>\r\n\t\t</Features>\r\n\t\t</UserInterface>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_ui_features_share_start(self,mode:str="Auto",output_debug:bool=False):
+        Usage: False/True, Requires user role: ADMIN, INTEGRATOR"""),
+    "set_ui_features_share_start": ("UserInterface/Features/Share/Start", "mode: str = 'Auto'",
         """Description: Choose whether or not to remove the default buttons and other UI elements for sharing and 
         previewing content, both in call and out of call, from the user interface. The setting removes 
         only the buttons and UI elements, not their functionality as such. You can still share content 
         using Cisco Proximity or Cisco Webex apps.
-        Usage: Auto/Hidden , Requires user role: ADMIN, INTEGRATOR"""
-        
-        payload = f"<Configuration>\r\n\t<UserInterface>\r\n\t\t<Features>\r\n\t\t<Share>r\n\t\t<Start>{mode}</Start>\r\n\t\t</Share>\r\n\t\t</Features>\r\n\t\t</UserInterface>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_ui_language(self,language:str="English",output_debug:bool=False):
+        Usage: Auto/Hidden , Requires user role: ADMIN, INTEGRATOR"""),
+    "set_ui_language": ("UserInterface/Language", "language: str = 'English'",
         """Description: Select the language to be used in the user interface. If the language is not supported, the 
         default language (English) will be used
-        Usage: Language as string , Requires user role: ADMIN, USER"""
-        
-        payload = f"<Configuration>\r\n\t<UserInterface>\r\n\t\t<Language>{language}</Language>\r\n\t\t</UserInterface>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-        
-    def set_ui_osd_mode(self,mode:str,output_debug:bool=False):
+        Usage: Language as string , Requires user role: ADMIN, USER"""),
+    "set_ui_osd_mode": ("UserInterface/OSD/Mode", "mode: str",
         """Description: You can configure a device to output a clean video stream. This is referred to as broadcast 
         mode. In this mode the indicators, notifications, and controls are removed. This mode is primarily for broadcasting and recording services where you only want to pass on the video to your 
         viewers
-        Usage: Auto/Unobstructed , Requires user role: ADMIN"""
-        
-        payload = f"<Configuration>\r\n\t<UserInterface>\r\n\t\t<OSD>\r\n\t\t<Mode>{mode}</Mode>\r\n\t\t</OSD>\r\n\t\t</UserInterface>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_ui_soundeffects_mode(self, mode:str="On", output_debug:bool=False):
+        Usage: Auto/Unobstructed , Requires user role: ADMIN"""),
+    "set_ui_soundeffects_mode": ("UserInterface/SoundEffects/Mode", "mode: str = 'On'",
         """Description: You can configure the device to make a sound effect, e.g. when someone connects a laptop or 
         mobile through Proximity.
         The keyboard click sound effect when typing text is not affected by this setting (refer to the 
         UserInterface Keytones Mode setting).
-        Usage: Off/On , Requires user role: ADMIN, USER"""
-        
-        payload = f"<Configuration>\r\n\t<UserInterface>\r\n\t\t<SoundEffects>\r\n\t\t<Mode>{mode}</Mode>\r\n\t\t</SoundEffects>\r\n\t\t</UserInterface>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_ui_settings_menu_visibility(self, mode:str="Auto",output_debug:bool=False):
+        Usage: Off/On , Requires user role: ADMIN, USER"""),
+    "set_ui_settings_menu_visibility": ("UserInterface/SettingsMenu/Visibility", "mode: str = 'Auto'",
         """Description: Choose whether or not to show the device name (or contact information) and the associated 
         drop down menu and Settings panel on the user interface.
-        Usage: Auto/Hidden , Requires user role: ADMIN"""
-        
-        payload = f"<Configuration>\r\n\t<UserInterface>\r\n\t\t<SettingsMenu>\r\n\t\t<Visibility>{mode}</Visibility>\r\n\t\t</SettingsMenu>\r\n\t\t</UserInterface>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_ui_whiteboard_actiity_indicators(self,mode:str="On",output_debug:bool=False):
+        Usage: Auto/Hidden , Requires user role: ADMIN"""),
+    "set_ui_whiteboard_actiity_indicators": ("UserInterface/Whiteboard/ActivityIndicators", "mode: str = 'On'",
         """Description: Activity indicators let you see who is drawing and annotating in a call.
         The avatars of the participants or the initials of the device are displayed when someone is interacting with the whiteboard, so you can follow who is drawing or annotating.
         Applies only to cloud-registered devices.
-        Usage: Off/On , Requires user role: ADMIN"""
-        
-        payload = f"<Configuration>\r\n\t<UserInterface>\r\n\t\t<Whiteboard>\r\n\t\t<ActivityIndicators>{mode}</ActivityIndicators>\r\n\t\t</Whiteboard>\r\n\t\t</UserInterface>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_video_default_source(self,default_source:int=1,output_debug:bool=False):
+        Usage: Off/On , Requires user role: ADMIN"""),
+    "set_video_default_source": ("Video/DefaultMainSource", "default_source: int = 1",
         """Description: Define the default input source for main video in calls. The main video is played on this 
         source when you switch on or restart the video conferencing device. Use the Video Input 
         SetMainVideoSource command to change to another source while the device is running.
-        Usage: 1/2/3/4/5/6 [ CodecPro ] , 1/2/3/4 [ Room70G2  RoomPanorama/Room70Panorama ] ,  [ RoomKitMini  Boards ],1/2/3 [ RoomKit  CodecPlus  Room55  Room70/Room55D  DeskPro/DeskLE ] , Requires user role: ADMIN, USER"""
-        
-        payload = f"<Configuration>\r\n\t<Video>\r\n\t\t<DefaultMainSource>{default_source}</DefaultMainSource>\r\n\t\t</Video>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    
-    def set_video_presentation_priority(self,priority:str,output_debug:bool=False):
+        Usage: 1/2/3/4/5/6 [ CodecPro ] , 1/2/3/4 [ Room70G2  RoomPanorama/Room70Panorama ] ,  [ RoomKitMini  Boards ],1/2/3 [ RoomKit  CodecPlus  Room55  Room70/Room55D  DeskPro/DeskLE ] , Requires user role: ADMIN, USER"""),
+    "set_video_presentation_priority": ("Video/Presentation/Priority", "priority: str",
         """Description: Specify how to distribute the bandwidth between the presentation channel and the main video 
         channel.
-        Usage: Equal/High/Low [ RoomKit  RoomKitMini  CodecPlus  CodecPro  Room55  Room70/Room55D  Room70G2  DeskPro/DeskLE  Boards ] , Equal [ RoomPanorama/Room70Panorama ], Requires user role: ADMIN"""
-        
-        payload = f"<Configuration>\r\n\t<Video>\r\n\t\t<Presentation>\r\n\t\t<Priority>{priority}</Priority>\r\n\t\t</Presentation>\r\n\t\t</Video>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_ldap_mode(self,mode:str,output_debug:bool=False):
+        Usage: Equal/High/Low [ RoomKit  RoomKitMini  CodecPlus  CodecPro  Room55  Room70/Room55D  Room70G2  DeskPro/DeskLE  Boards ] , Equal [ RoomPanorama/Room70Panorama ], Requires user role: ADMIN"""),
+    "set_ldap_mode": ("UserManagement/LDAP/Mode", "mode: str",
         """Description: The device supports the use of an LDAP (Lightweight Directory Access Protocol) server as a 
         central place to store and validate usernames and passwords. Use this setting to configure 
         whether or not to use LDAP authentication. Our implementation is tested for the Microsoft 
         Active Directory (AD) service.
         If you switch on LDAP Mode, make sure to configure the other UserManagement LDAP settings 
         to suit your setup
-        Usage: Off/On , Requires user role: ADMIN"""
-        
-        payload = f"<Configuration>\r\n\t<UserManagement>\r\n\t\t<LDAP>\r\n\t\t<Mode>{mode}</Mode>\r\n\t\t</LDAP>\r\n\t\t</UserManagement>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_ldap_address(self, address:str,output_debug:bool=False):
+        Usage: Off/On , Requires user role: ADMIN"""),
+    "set_ldap_address": ("UserManagement/LDAP/Server/Address", "address: str",
         """Description: Set the IP address or hostname of the LDAP server.
-        Usage: String (0..255), Requires user role: ADMIN"""
-        
-        payload = f"<Configuration>\r\n\t<UserManagement>\r\n\t\t<LDAP>\r\n\t\t\t<Server>\r\n\t\t<Address>{address}</Address>\r\n\t\t</Server>\r\n\t\t</LDAP>\r\n\t\t</UserManagement>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_ldap_port(self,port:int=0,output_debug:bool=False):
+        Usage: String (0..255), Requires user role: ADMIN"""),
+    "set_ldap_port": ("UserManagement/LDAP/Server/Port", "port: int = 0",
         """Description: Set the port to connect to the LDAP server on. If set to 0, use the default for the selected 
         protocol (see the UserManagement LDAP Encryption setting).
-        Usage: Integer (0..65535) , Requires user role: ADMIN"""
-        
-        payload = f"<Configuration>\r\n\t<UserManagement>\r\n\t\t<LDAP>\r\n\t\t\t<Server>\r\n\t\t<Port>{port}</Port>\r\n\t\t</Server>\r\n\t\t</LDAP>\r\n\t\t</UserManagement>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_ldap_verify_certificate_mode(self,mode:str="On",output_debug:bool=False):
+        Usage: Integer (0..65535) , Requires user role: ADMIN"""),
+    "set_ldap_verify_certificate_mode": ("UserManagement/LDAP/VerifyServerCertificate", "mode: str = 'On'",
         """Description: When the device connects to an LDAP server, the server will identify itself to the device by 
         presenting its certificate. Use this setting to determine whether or not the device will verify the 
         server certificate
-        Usage: Off/On, Requires user role: ADMIN"""
-        
-        payload = f"<Configuration>\r\n\t<UserManagement>\r\n\t\t<LDAP>\r\n\t\t\t<VerifyServerCertificate>{mode}</VerifyServerCertificate>\r\n\t\t</LDAP>\r\n\t\t</UserManagement>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_ldap_admin_group(self, group:str,output_debug:bool=False):
+        Usage: Off/On, Requires user role: ADMIN"""),
+    "set_ldap_admin_group": ("UserManagement/LDAP/Admin/Group", "group: str",
         """Description: Members of this AD (Active Directory) group will be given administrator access. This setting is a 
         shorthand for saying (memberOf:1.2.840.113556.1.4.1941:=<group name>). 
         You always have to set either an LDAP Admin Group or an LDAP Admin Filter. An LDAP 
         Admin Filter takes precedence, so if the UserManagement LDAP Admin Filter is set, the 
         UserManagement LDAP Admin Group setting is ignored
-        Usage: String (0..255) , Requires user role: ADMIN"""
-        
-        payload = f"<Configuration>\r\n\t<UserManagement>\r\n\t\t<LDAP>\r\n\t\t\t<Admin>\r\n\t\t<Group>{group}</Group>\r\n\t\t</Admin>\r\n\t\t</LDAP>\r\n\t\t</UserManagement>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_ldap_attribute(self, attribute:str, output_debug:bool=False):
+        Usage: String (0..255) , Requires user role: ADMIN"""),
+    "set_ldap_attribute": ("UserManagement/LDAP/Attribute", "attribute: str",
         """Description: The attribute used to map to the provided username. If not set, sAMAccountName is used
-        Usage: String (0..255) , Requires user role: ADMIN"""
-         
-        payload = f"<Configuration>\r\n\t<UserManagement>\r\n\t\t<LDAP>\r\n\t\t\t<Attribute>{attribute}</Attribute>\r\n\t\t</LDAP>\r\n\t\t</UserManagement>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_ldap_min_tls_version(self,tls_version:str="TLSv1.2",output_debug:bool=False):
+        Usage: String (0..255) , Requires user role: ADMIN"""),
+    "set_ldap_min_tls_version": ("UserManagement/LDAP/MinimumTLSVersion", "tls_version: str = 'TLSv1.2'",
         """Description: Set the lowest version of the TLS (Transport Layer Security) protocol that is allowed for LDAP
-        Usage: TLSv1.0/TLSv1.1/TLSv1.2 , Requires user role: ADMIN"""
-        
-        payload = f"<Configuration>\r\n\t<UserManagement>\r\n\t\t<LDAP>\r\n\t\t\t<MinimumTLSVersion>{tls_version}</MinimumTLSVersion>\r\n\t\t</LDAP>\r\n\t\t</UserManagement>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_ldap_encryption(self,encryption:str="LDAPS",output_debug:bool=False):
+        Usage: TLSv1.0/TLSv1.1/TLSv1.2 , Requires user role: ADMIN"""),
+    "set_ldap_encryption": ("UserManagement/LDAP/Encryption", "encryption: str = 'LDAPS'",
         """Description: Define how to secure the communication between the device and the LDAP server. You can 
         override the port number by using the UserManagement LDAP Server Port setting
-        Usage: LDAPS/None/STARTTLS , Requires user role: ADMIN"""
-        
-        payload = f"<Configuration>\r\n\t<UserManagement>\r\n\t\t<LDAP>\r\n\t\t\t<Encryption>{encryption}</Encryption>\r\n\t\t</LDAP>\r\n\t\t</UserManagement>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-        
-    def set_ldap_basedn(self,basedn:str,output_debug:bool=False):
+        Usage: LDAPS/None/STARTTLS , Requires user role: ADMIN"""),
+    "set_ldap_basedn": ("UserManagement/LDAP/BaseDN", "basedn: str",
         """Description: The distinguishing name of the entry at which to start a search (base).
-        Usage: String (0..255) , Requires user role: ADMIN"""
-        
-        payload = f"<Configuration>\r\n\t<UserManagement>\r\n\t\t<LDAP>\r\n\t\t\t<BaseDN>{basedn}</BaseDN>\r\n\t\t</LDAP>\r\n\t\t</UserManagement>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_voice_control_wakeword_mode(self, mode:str,output_debug:bool=False):
+        Usage: String (0..255) , Requires user role: ADMIN"""),
+    "set_voice_control_wakeword_mode": ("VoiceControl/Wakeword/Mode", "mode: str",
         """Description: Use this setting to enable or disable the wakeword (e.g., "Ok Webex") that is used by the 
         Webex Assistant. The Webex Assistant allows you to use the device hands free, and by using 
         the wakeword you can initiate tasks, such as placing a call and starting a presentation.
         Use the UserInterface Assistant Mode setting to switch on the Webex Assistant.
-        Usage: Off/On , Requires user role: ADMIN, INTEGRATOR"""
-        
-        payload = f"<Configuration>\r\n\t<VoiceControl>\r\n\t\t<Wakeword>\r\n\t\t\t<Mode>{mode}</Mode>\r\n\t\t</Wakeword>\r\n\t\t</VoiceControl>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-        
-    def set_video_selfview_oncall_mode(self,mode:str,output_debug:bool=False):
+        Usage: Off/On , Requires user role: ADMIN, INTEGRATOR"""),
+    "set_video_selfview_oncall_mode": ("Video/Selfview/OnCall/Mode", "mode: str",
         """Description: This setting is used to switch on self-view for a short while when setting up a call. The Video 
         Selfview OnCall Duration setting determines for how long it remains on. This applies when self view in general is switched off.
-        Usage: Off/On, Requires user role: ADMIN, INTEGRATOR"""
-        
-        payload = f"<Configuration>\r\n\t<Video>\r\n\t\t<Selfview>\r\n\t\t\t<OnCall>\r\n\t\t\t\t<Mode>{mode}</Mode>\r\n\t\t</OnCall>\r\n\t\t</Selfview>\r\n\t\t</Video>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_video_selfview_oncall_duration(self,duration:int,output_debug:bool=False):
+        Usage: Off/On, Requires user role: ADMIN, INTEGRATOR"""),
+    "set_video_selfview_oncall_duration": ("Video/Selfview/OnCall/Duration", "duration: int",
         """Description: This setting only has an effect when the Video Selfview OnCall Mode setting is switched On. In 
         this case, the number of seconds set here determines for how long self-view is shown before it 
         is automatically switched off.
-        Usage: Integer (1..60) , Requires user role: ADMIN, INTEGRATOR"""
-        
-        payload = f"<Configuration>\r\n\t<Video>\r\n\t\t<Selfview>\r\n\t\t\t<OnCall>\r\n\t\t\t\t<Duration>{duration}</Duration>\r\n\t\t</OnCall>\r\n\t\t</Selfview>\r\n\t\t</Video>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_network_speed(self,speed:str="Auto",output_debug=False):
+        Usage: Integer (1..60) , Requires user role: ADMIN, INTEGRATOR"""),
+    "set_network_speed": ("Network/Speed", "speed: str = 'Auto'",
         """Description: Define the Ethernet link speed. We recommend not to change from the default value, which 
         negotiates with the network to set the speed automatically. If you do not use auto-negotiation, 
         make sure that the speed you choose is supported by the closest switch in your network 
@@ -2941,91 +3920,34 @@ class Cisco_RoomOS:
         10full: Force link to 10 Mbps full-duplex.
         100half: Force link to 100 Mbps half-duplex.
         100full: Force link to 100 Mbps full-duplex.
-        1000full: Force link to 1 Gbps full-duplex"""
-        
-        payload = f"<Configuration>\r\n\t<Network><Speed>{speed}</Speed>\r\n\t</Network>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_ipv4_mode(self,mode:str,output_debug:bool=False):
+        1000full: Force link to 1 Gbps full-duplex"""),
+    "set_ipv4_mode": ("Network/IPv4/Assignment", "mode: str",
         """Description: Define how the device will obtain its IPv4 address, subnet mask and gateway address.
         The client identifier, which is used in the DHCP requests, is different for different products: MAC 
         address (Touch 10), "01" followed by the MAC address (Room Kit, Room Kit Mini, Room 55, 
         Room 70, Room 70 G2, Room 70 Panorama, Room Panorama, Boards, Codec Plus, and Codec 
         Pro), and DHCP Unique Identifier (DUID) as specified in RFC 4361 (other products, including 
         Room Navigator)
-        Usage: Static/DHCP , Requires user role: ADMIN, USER"""
-        
-        payload = f"<Configuration>\r\n\t<Network>\r\n\t\t<IPv4>\r\n\t\t<Assignment>{mode}</Assignment>\r\n\t</IPv4>\r\n\t</Network>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_ipv4_address(self, address:str,gateway:str,subnetmask:str,output_debug:bool=False):
-        """Requires user role: ADMIN, USER
-        Define the static IPv4 network address for the device. 
-        Define the IPv4 network subnet mask.
-        Define the IPv4 network gateway address. 
-        ****Applicable only when the Network IPv4 Assignment 
-        is set to Static
-        Usage: String (0, 64) a valid IPv4 address for IpV4 address and Gateway, and valid subnet mask for Subnet mask , Requires user role: ADMIN, USER"""
-        #DO NO TEST
-        payload = f"<Configuration>\r\n\t<Network>\r\n\t\t<IPv4>\r\n\t\t<Address>{address}</Address>\r\n\t</IPv4>\r\n\t</Network>\r\n</Configuration>"
-        resp = self.__post_parser_return(payload,output_debug)
-        if "Success" in str(resp):
-            payload = f"<Configuration>\r\n\t<Network>\r\n\t\t<IPv4>\r\n\t\t<Gateway>{gateway}</Gateway>\r\n\t</IPv4>\r\n\t</Network>\r\n</Configuration>"
-            resp = self.__post_parser_return(payload,output_debug)
-            if "Success" in str(resp):
-                payload = f"<Configuration>\r\n\t<Network>\r\n\t\t<IPv4>\r\n\t\t<SubnetMask>{subnetmask}</SubnetMask>\r\n\t</IPv4>\r\n\t</Network>\r\n</Configuration>"
-                return self.__post_parser_return(payload,output_debug)
-            else:
-                return resp
-        return resp
-    
-    def set_network_mtu_size(self,mtu_size:int=1500,output_debug:bool=False):
+        Usage: Static/DHCP , Requires user role: ADMIN, USER"""),
+    "set_network_mtu_size": ("Network/MTU", "mtu_size: int = 1500",
         """Description:Define the Ethernet MTU (Maximum Transmission Unit) size. The MTU size must be supported 
         by your network infrastructure. The minimum size is 576 for IPv4 and 1280 for IPv6
-        Usage: Integer (576..1500) , default: 1500 , Requires user role: ADMIN, USER"""
-        
-        payload = f"<Configuration>\r\n\t<Network>\r\n\t\t<MTU>{mtu_size}</MTU>\r\n\t</Network>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_ipv6_mode(self,mode:str="Autoconf",output_debug:bool=False):
+        Usage: Integer (576..1500) , default: 1500 , Requires user role: ADMIN, USER"""),
+    "set_ipv6_mode": ("Network/IPv6/Assignment", "mode: str = 'Autoconf'",
         """Description: Define how the device will obtain its IPv6 address, subnet mask and gateway address.
         The client identifier, which is used in the DHCP requests, is different for different products: MAC 
         address (Touch 10), "01" followed by the MAC address (Room Kit, Room Kit Mini, Room 55, 
         Room 70, Room 70 G2, Room 70 Panorama, Room Panorama, Boards, Codec Plus, and Codec 
         Pro), and DHCP Unique Identifier (DUID) as specified in RFC 4361 (other products, including 
         Room Navigator)
-        Usage: Static/DHCPv6/Autoconf , Requires user role: ADMIN, USER"""
-        
-        payload = f"<Configuration>\r\n\t<Network>\r\n\t\t<IPv6>\r\n\t\t<Assignment>{mode}</Assignment>\r\n\t</IPv6>\r\n\t</Network>\r\n</Configuration>"
-        return (self.__post_parser_return(payload,output_debug))
-    
-    def set_ipv6_address(self, address:str,gateway:str,output_debug:bool=False):
-        """Description: Define the static IPv6 network address for the device and its gateway.
-        ****Applicable only when the Network IPv6 
-        Assignment is set to Static.
-        Usage:String (0, 64) , A valid IPv6 address including a network mask. Example: 2001:DB8::/48 , 
-        Define the IPv6 network gateway address.  Requires user role: ADMIN, USER"""
-        
-        payload = f"<Configuration>\r\n\t<Network>\r\n\t\t<IPv6>\r\n\t\t<Address>{address}</Address>\r\n\t</IPv6>\r\n\t</Network>\r\n</Configuration>"
-        resp = self.__post_parser_return(payload,output_debug)
-        if "Success" in str(resp):
-            payload = f"<Configuration>\r\n\t<Network>\r\n\t\t<IPv6>\r\n\t\t<Gateway>{gateway}</Gateway>\r\n\t</IPv6>\r\n\t</Network>\r\n</Configuration>"
-            resp = self.__post_parser_return(payload,output_debug)
-            return resp
-        else:
-            return resp
-        
-    def set_ipv6_dhcp_options(self, mode:str="On",output_debug:bool=False):
-         """Description: Retrieve a set of DHCP options, for example NTP and DNS server addresses, from a DHCPv6 
+        Usage: Static/DHCPv6/Autoconf , Requires user role: ADMIN, USER"""),
+    "set_ipv6_dhcp_options": ("Network/IPv6/DHCPOptions", "mode: str = 'On'",
+        """Description: Retrieve a set of DHCP options, for example NTP and DNS server addresses, from a DHCPv6 
          server
          Usage: Off/On,  Requires user role: ADMIN, USER
          Off: Disable the retrieval of DHCP options from a DHCPv6 server.
-         On: Enable the retrieval of a selected set of DHCP options from a DHCPv6 server."""
-         
-         payload = f"<Configuration>\r\n\t<Network>\r\n\t\t<IPv6>\r\n\t\t<DHCPOptions>{mode}</DHCPOptions>\r\n\t</IPv6>\r\n\t</Network>\r\n</Configuration>"
-         return self.__post_parser_return(payload,output_debug)
-     
-    def set_ipv6_interface_identifier(self, interface_id:str,output_debug:bool=False):
+         On: Enable the retrieval of a selected set of DHCP options from a DHCPv6 server."""),
+    "set_ipv6_interface_identifier": ("Network/IPv6/InterfaceIdentifier", "interface_id: str",
         """Description: Define the IPv6 interface identifier for the device. The interface identifier you choose, either 
         MAC or Opaque, will determine the method that is used for generating part of the the 
         IPv6 address. This is applicable to both link-local IPv6 addresses and Stateless Address 
@@ -3034,13 +3956,8 @@ class Cisco_RoomOS:
         With MAC, an EUI-64 based interface identifier is generated, as described in RFC-2373.
         With Opaque, a random 64-bit interface identifier is generated as described in RFC-7217 on 
         the first boot of the device, and this is used forever, or until factory reset.
-        Usage: MAC/Opaque , Requires user role: ADMIN, USER"""
-        
-        payload = f"<Configuration>\r\n\t<Network>\r\n\t\t<IPv6>\r\n\t\t<InterfaceIdentifier>{interface_id}</InterfaceIdentifier>\r\n\t</IPv6>\r\n\t</Network>\r\n</Configuration>"
-        return self.__post_parser_return(payload,output_debug)
-        
-        
-    def set_network_qos_mode(self,mode:str,output_debug:bool=False):
+        Usage: MAC/Opaque , Requires user role: ADMIN, USER"""),
+    "set_network_qos_mode": ("Network/QoS/Mode", "mode: str",
         """Description: The QoS (Quality of Service) is a method which handles the priority of audio, video and other 
         data in the network. The QoS settings must be supported by the infrastructure. Diffserv 
         (Differentiated Services) is a networking architecture that specifies a simple, scalable and 
@@ -3050,152 +3967,83 @@ class Cisco_RoomOS:
         Off: No QoS method is used. 
         Diffserv: The Network QoS Diffserv Audio, Network QoS Diffserv Video, Network QoS 
         Diffserv Data, Network QoS Diffserv Signalling, Network QoS Diffserv ICMPv6 and 
-        Network QoS Diffserv NTP settings are used to prioritize packets"""
-        
-        payload = f"<Configuration>\r\n\t<Network>\r\n\t\t<QoS>\r\n\t\t<Mode>{mode}</Mode>\r\n\t</QoS>\r\n\t</Network>\r\n</Configuration>"
-        return self.__post_parser_return(payload,output_debug)
-    
-    def set_allow_remote_access(self,address:str,output_debug:bool=False):
+        Network QoS Diffserv NTP settings are used to prioritize packets"""),
+    "set_allow_remote_access": ("Network/RemoteAccess/Allow", "address: str",
         """Description: Define which IP addresses (IPv4/IPv6) are allowed for remote access to the device from SSH/
         HTTP/HTTPS. Multiple IP addresses are separated by a white space. 
         A network mask (IP range) is specified by <ip address>/N, where N is 1-32 for IPv4, and N is 
         1-128 for IPv6. The /N is a common indication of a network mask where the first N bits are set. 
-        Usage: String (0..255), A valid IPv4 address to be allowed, Requires user role: ADMIN, USER"""
-        
-        payload = f"<Configuration>\r\n\t<Network>\r\n\t\t<RemoteAccess>\r\n\t\t<Allow>{address}</Allow>\r\n\t</RemoteAccess>\r\n\t</Network>\r\n</Configuration>"
-        return self.__post_parser_return(payload,output_debug)
-            
-    def set_vlan_voice_mode(self,mode:str="Auto",output_debug:bool=False):
+        Usage: String (0..255), A valid IPv4 address to be allowed, Requires user role: ADMIN, USER"""),
+    "set_vlan_voice_mode": ("Network/VLAN/Voice/Mode", "mode: str = 'Auto'",
         """Description: Define the VLAN voice mode. The VLAN Voice Mode will be set to Auto automatically if you 
         have Cisco UCM (Cisco Unified Communications Manager) as provisioning infrastructure. Note 
         that Auto mode will NOT work if the NetworkServices CDP Mode setting is Off.
         Usage: Auto/Manual/Off , Requires user role: ADMIN, USER
         Auto: The Cisco Discovery Protocol (CDP), if available, assigns an id to the voice VLAN. If CDP is not available, VLAN is not enabled. 
         Manual: The VLAN ID is set manually using the Network VLAN Voice VlanId setting. If CDP is available, the manually set value will be overruled by the value assigned by CDP.
-        Off: VLAN is not enabled."""
-        
-        payload = f"<Configuration>\r\n\t<Network>\r\n\t\t<VLAN>\r\n\t\t<Voice>\r\n\t\t<Mode>{mode}</Mode>\r\n\t</Voice>\r\n\t</VLAN>\r\n\t</Network>\r\n</Configuration>"
-        return self.__post_parser_return(payload,output_debug)
-        
-    def set_vlan_voice_id(self, vlan_id:int=1,output_debug=False):
+        Off: VLAN is not enabled."""),
+    "set_vlan_voice_id": ("Network/VLAN/Voice/VlanId", "vlan_id: int = 1",
         """Description: Define the VLAN voice ID. This setting will only take effect if Network VLAN Voice Mode is set 
         to Manual.
-        Usage: Integer (1..4094), a vlaid VLAN id, Requires user role: ADMIN, USER"""
-        
-        payload = f"<Configuration>\r\n\t<Network>\r\n\t\t<VLAN>\r\n\t\t<Voice>\r\n\t\t<VlanId>{vlan_id}</VlanId>\r\n\t</Voice>\r\n\t</VLAN>\r\n\t</Network>\r\n</Configuration>"
-        return self.__post_parser_return(payload,output_debug)
-    
-    def set_network_qos_diffserv_ntp(self,ntp_priority:int=0,output_debug:bool=False):
+        Usage: Integer (1..4094), a vlaid VLAN id, Requires user role: ADMIN, USER"""),
+    "set_network_qos_diffserv_ntp": ("Network/QoS/Diffserv/NTP", "ntp_priority: int = 0",
         """Description: This setting takes effect only if Network QoS Mode is set to Diffserv.
         Define which priority NTP packets should have in the IP network. The traffic classes recomended in the DiffServ RFCs map to a decimal value between 0 and 63. We recommend you 
         use 0 for NTP.
         The priority set here might be overridden when packets are leaving the network controlled by 
         the local network administrator
-        Usage:  Integer (0..63) a set priority, 0 means 'best-effort', Requires user role: ADMIN, USER"""
-        
-        payload = f"<Configuration>\r\n\t<Network>\r\n\t\t<QoS>\r\n\t\t<Diffserv>\r\n\t\t<NTP>{ntp_priority}</NTP>\r\n\t</Diffserv>\r\n\t</QoS>\r\n\t</Network>\r\n</Configuration>"
-        return self.__post_parser_return(payload,output_debug)
-    
-    def set_network_qos_diffserv_audio(self,audio_priority:int=46,output_debug:bool=False):
+        Usage:  Integer (0..63) a set priority, 0 means 'best-effort', Requires user role: ADMIN, USER"""),
+    "set_network_qos_diffserv_audio": ("Network/QoS/Diffserv/Audio", "audio_priority: int = 46",
         """Description: This setting takes effect only if Network QoS Mode is set to Diffserv.
         Define which priority Audio packets should have in the IP network. The traffic classes recommended in the DiffServ RFCs map to a decimal value between 0 and 63. Cisco recommends you 
         use EF for Audio. EF equals the decimal value 46.
         The priority set here might be overridden when packets are leaving the network controlled by 
         the local network administrator
-        Usage: Integer (0..63) , set Audio packet priority, 0 means 'best-effort', Requires user role: ADMIN, USER"""
-        
-        payload = f"<Configuration>\r\n\t<Network>\r\n\t\t<QoS>\r\n\t\t<Diffserv>\r\n\t\t<Audio>{audio_priority}</Audio>\r\n\t</Diffserv>\r\n\t</QoS>\r\n\t</Network>\r\n</Configuration>"
-        return self.__post_parser_return(payload,output_debug)
-    
-    def set_network_qos_diffserv_video(self,video_priority:int=34,output_debug:bool=False):
+        Usage: Integer (0..63) , set Audio packet priority, 0 means 'best-effort', Requires user role: ADMIN, USER"""),
+    "set_network_qos_diffserv_video": ("Network/QoS/Diffserv/Video", "video_priority: int = 34",
         """Description: This setting takes effect only if Network QoS Mode is set to Diffserv.
         Define which priority Video packets should have in the IP network. The packets of the presentation channel (shared content) are also in the Video packet category. The traffic classes 
         recommended in the DiffServ RFCs map to a decimal value between 0 and 63. Cisco recommends 
         you use AF41 for Video. AF41 equals the decimal value 34.
         The priority set here might be overridden when packets are leaving the network controlled by 
         the local network administrator
-        Usage: Integer (0..63) , set Video packet priority, 0 means 'best-effort', Requires user role: ADMIN, USER """
-        
-        payload = f"<Configuration>\r\n\t<Network>\r\n\t\t<QoS>\r\n\t\t<Diffserv>\r\n\t\t<Video>{video_priority}</Video>\r\n\t</Diffserv>\r\n\t</QoS>\r\n\t</Network>\r\n</Configuration>"
-        return self.__post_parser_return(payload,output_debug)        
-    
-    def set_network_qos_diffserv_data(self,data_priority:int=34,output_debug:bool=False):
+        Usage: Integer (0..63) , set Video packet priority, 0 means 'best-effort', Requires user role: ADMIN, USER """),
+    "set_network_qos_diffserv_data": ("Network/QoS/Diffserv/Data", "data_priority: int = 34",
         """Description: This setting takes effect only if Network QoS Mode is set to Diffserv.
         Define which priority Data packets should have in the IP network. The traffic classes recommended in the DiffServ RFCs map to a decimal value between 0 and 63. Cisco recommends you 
         use AF41 for Data. AF41 equals the decimal value 34.
         The priority set here might be overridden when packets are leaving the network controlled by 
         the local network administrator
-        Usage: Integer (0..63) , set Data packet priority, 0 means 'best-effort', Requires user role: ADMIN, USER """
-        
-        payload = f"<Configuration>\r\n\t<Network>\r\n\t\t<QoS>\r\n\t\t<Diffserv>\r\n\t\t<Data>{data_priority}</Data>\r\n\t</Diffserv>\r\n\t</QoS>\r\n\t</Network>\r\n</Configuration>"
-        return self.__post_parser_return(payload,output_debug)        
-    
-    def set_network_qos_diffserv_signalling(self,signalling_priority:int=24,output_debug:bool=False):
+        Usage: Integer (0..63) , set Data packet priority, 0 means 'best-effort', Requires user role: ADMIN, USER """),
+    "set_network_qos_diffserv_signalling": ("Network/QoS/Diffserv/Signalling", "signalling_priority: int = 24",
         """Description: This setting takes effect only if Network QoS Mode is set to Diffserv.
         Define which priority Signalling packets that are deemed critical (time-sensitive) for the real time operation should have in the IP network. The traffic classes recommended in the DiffServ 
         RFCs map to a decimal value between 0 and 63. Cisco recommends you use CS3 for Signalling. 
         CS3 equals the decimal value 24.
         The priority set here might be overridden when packets are leaving the network controlled by 
         the local network administrator
-        Usage: Integer (0..63) , set Signalling packet priority, 0 means 'best-effort', Requires user role: ADMIN, USER"""
-        
-        payload = f"<Configuration>\r\n\t<Network>\r\n\t\t<QoS>\r\n\t\t<Diffserv>\r\n\t\t<Signalling>{signalling_priority}</Signalling>\r\n\t</Diffserv>\r\n\t</QoS>\r\n\t</Network>\r\n</Configuration>"
-        return self.__post_parser_return(payload,output_debug)    
-    
-    def command_audioDiagnose_MeasureDelay(self,output_debug=False):
-        payload = "<Command>\r\n\t<Audio>\r\n\t\t<Diagnostics>\r\n \t\t\t<MeasureDelay></MeasureDelay>\r\n \t\t</Diagnostics>\r\n\t</Audio>\r\n</Command>"
-        return self.__command_parser_return(payload) 
-    
-    def command_music_mode(self):
+        Usage: Integer (0..63) , set Signalling packet priority, 0 means 'best-effort', Requires user role: ADMIN, USER"""),
+}
+
+_COMMAND_ACCESSORS = {
+    # name: (path below Command, parameters, command arguments, docstring), the method returns self.command(path, arguments)
+    "command_audioDiagnose_MeasureDelay": ("Audio/Diagnostics/MeasureDelay", "output_debug=False", "",
+        None),
+    "command_music_mode": ("Audio/Microphones/MusicMode/Start", "", "",
         """Description: Start using MusicMode in the current call. Music mode allows the dynamic range of music go 
         through. When Music mode is in use, sound level variations are transmitted intact and the noise 
         filtering is kept to a minimum. MusicMode is automatically turned off when the call ends.
-        Usage: Requires user role: ADMIN, INTEGRATOR, USER"""
-        
-        payload = "<Command>\r\n\t<Audio>\r\n\t\t<Microphones>\r\n\t\t\t<MusicMode><Start></Start></MusicMode>\r\n\t\t</Microphones>\r\n\t</Audio>\r\n</Command>"
-        return self.__command_parser_return(payload)
-    
-    def command_activate_NoiseRemoval(self,mode:str):
+        Usage: Requires user role: ADMIN, INTEGRATOR, USER"""),
+    "command_activate_NoiseRemoval": ("Audio/Microphones/NoiseRemoval/{mode}", "mode: str", "",
         """Description: Activate noise removal on the device.
         Usage: Supply Activate to activate the Noise removal feature, Deactivate to deactivate the noise removal. Requires user role: ADMIN, INTEGRATOR, USER 
-        Note that Noise removal mode should be set to enable to use this feature. Use : to activate"""
-        payload = f"<Command>\r\n\t<Audio>\r\n\t\t<Microphones>\r\n\t\t\t<NoiseRemoval><{mode}></{mode}></NoiseRemoval>\r\n\t\t</Microphones>\r\n\t</Audio>\r\n</Command>"
-        return self.__command_parser_return(payload)
-    
-    def command_microphoneToggle_mute(self):
-        """Description: Toggle the microphone between muted and unmuted. Returns result along with Microphones Mute status.
-        Usage:Requires user role: ADMIN, INTEGRATOR, USER"""
-        payload = "<Command>\r\n\t<Audio>\r\n\t\t<Microphones>\r\n\t\t\t<ToggleMute></ToggleMute>\r\n\t\t</Microphones>\r\n\t</Audio>\r\n</Command>"
-        print (self.__command_parser_return(payload))
-        return self.get_status_audio_input_microphone_mute()
-    
-    
-    def command_book_meeting(self,BookingId:str,Title:str,Duration:int=30,StartTime:str="Default"):
-        """Description: Book the meeting room for the specified period. If you don’t specify the start time and duration, 
-        the room will be booked from now on and for 30 minutes. Use get_booking_byID function to confirm if the meeting was scheduled.
-        Usage: Requires user role: ADMIN, USER.
-        Arguments:
-        BookingId:String (1, 128) , A unique identifier for the booking request.
-        Duration: Integer (0..1440), The duration of the meeting, in minutes. Default value: 30
-        StartTime:String (1, 128), The start time of the meeting in the following UTC format: YYYY-MM-DDThh:mm:ssZ. Example: 2022-07-20T01:29:00Z.
-        Title:String (1, 128), The title or subject field in the calendar booking. It will also be displayed on screen in the today’s bookings list."""
-        
-        __current_time = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
-        if StartTime == "Default":
-            StartTime = __current_time
-        payload = f"<Command>\r\n\t<Bookings>\r\n\t\t<Book>\r\n\t\t\t<BookingRequestUUID>{BookingId}</BookingRequestUUID><Duration>{Duration}</Duration><StartTime>{StartTime}</StartTime><Title>{Title}</Title>\r\n\t\t</Book>\r\n\t</Bookings>\r\n</Command>"
-        return self.__command_parser_return(payload)
-    
-    def get_booking_byID(self,BookingId:str):
+        Note that Noise removal mode should be set to enable to use this feature. Use : to activate"""),
+    "get_booking_byID": ("Bookings/Get", "BookingId: str", "Id=BookingId",
         """Description: Get the booking information for a specific ID.
         Usage: Requires user role: ADMIN, USER. 
         Arguments:
-        BookingId:String (1, 128) , A unique identifier used for the booking request."""
-                
-        payload = f"<Command>\r\n\t<Bookings>\r\n\t\t<Get><Id>{BookingId}</Id></Get>\r\n\t</Bookings>\r\n</Command>"
-        return self.__command_parser_return(payload)
-    
-    def get_bookings_list(self,Days:int,DayOffset:int=0,Limit:int=15,Offset:int=0):
+        BookingId:String (1, 128) , A unique identifier used for the booking request."""),
+    "get_bookings_list": ("Bookings/List", "Days: int, DayOffset: int = 0, Limit: int = 15, Offset: int = 0", "Days=Days, DayOffset=DayOffset, Limit=Limit, Offset=Offset",
         """Description: Book the meeting room for the specified period. If you don’t specify the start time and duration, 
         the room will be booked from now on and for 30 minutes.
         Usage: Requires user role: ADMIN, USER
@@ -3204,80 +4052,654 @@ class Cisco_RoomOS:
         DayOffset: Integer (0..365), Which day to start the search from (today: 0, tomorrow: 1, …). Default value: 0
         Limit: Integer (1..65534), Max number of bookings to list. Default value: 15
         Offset: Integer (0..65534), Offset number of bookings for this search. Default value: 0
-        """
-        payload = f"<Command>\r\n\t<Bookings>\r\n\t\t<List>\r\n\t\t\t<Days>{Days}</Days><DayOffset>{DayOffset}</DayOffset><Limit>{Limit}</Limit><Offset>{Offset}</Offset>\r\n\t\t</List>\r\n\t</Bookings>\r\n</Command>"
-        return self.__command_parser_return(payload)
-    
-    def set_bookings_notificationSnooze(self,Id:str,SecondsToSnooze:int=300):
+        """),
+    "set_bookings_notificationSnooze": ("Bookings/NotificationSnooze", "Id: str, SecondsToSnooze: int = 300", "Id=Id, SecondsToSnooze=SecondsToSnooze",
         """Description: Sets notifications for the stored bookings in this device to snooze.
         Usage: Requires user role: ADMIN, USER
         Arguments:
         Id:String (0, 128), The ID of the notification snooze setting.
         SecondsToSnooze:Integer (1..3600), The duration of the snooze period, in seconds. Default value: 300
-        """
-        payload = f"<Command>\r\n\t<Bookings>\r\n\t\t<NotificationSnooze>\r\n\t\t\t<Id>{Id}</Id><SecondsToSnooze>{SecondsToSnooze}</SecondsToSnooze>\r\n\t\t</NotificationSnooze>\r\n\t</Bookings>\r\n</Command>"
-        return self.__command_parser_return(payload)
+        """),
+}
+
+
+def _path_source(path : str):
+    """Source of the path tuple of an accessor, {name} parts are its parameters"""
+    return "(" + "".join((part[1:-1] if part.startswith("{") else f'"{part}"') + ", " for part in path.split("/")) + ")"
+
+
+def _build_accessor(name : str):
+    if name in _STATUS_ACCESSORS:
+        path, params, doc = _STATUS_ACCESSORS[name]
+        call = f"self.get_status({_path_source(path)})"
+    elif name in _CONFIG_ACCESSORS:
+        path, params, doc = _CONFIG_ACCESSORS[name]
+        value = re.match(r"\w+", params).group()
+        params += ", output_debug: bool = False"
+        call = f"self.set_config({_path_source(path)}, {value}, output_debug)"
+    else:
+        path, params, args, doc = _COMMAND_ACCESSORS[name]
+        call = f"self.command({_path_source(path)}{', ' + args if args else ''})"
+    namespace = {}
+    exec(f"def {name}(self{', ' + params if params else ''}):\n    return {call}\n", {}, namespace)
+    function = namespace[name]
+    function.__doc__ = doc
+    function.__module__ = __name__
+    function.__qualname__ = f"Cisco_RoomOS.{name}"
+    return function
+
+
+class _Accessor:
+    """Class attribute standing for a table accessor until its first lookup"""
+    __slots__ = ("name",)
     
+    def __init__(self, name : str):
+        self.name = name
     
-        
-    def __command_parser_return(self,payload):
+    def __get__(self, instance, owner):
+        function = _build_accessor(self.name)
+        setattr(Cisco_RoomOS, self.name, function)
+        return function if instance is None else function.__get__(instance, owner)
+
+
+def _install_accessors():
+    for name in itertools.chain(_STATUS_ACCESSORS, _CONFIG_ACCESSORS, _COMMAND_ACCESSORS):
+        setattr(Cisco_RoomOS, name, _Accessor(name))
+
+_install_accessors()
+
+
+@lru_cache(maxsize=1)
+def _all_methods():
+    accessors = set(itertools.chain(_STATUS_ACCESSORS, _CONFIG_ACCESSORS, _COMMAND_ACCESSORS))
+    defined = {name for name in dir(Cisco_RoomOS) if name not in accessors and callable(getattr(Cisco_RoomOS, name))}
+    return tuple(sorted(accessors | defined))
+
+
+
+class AsyncCisco_RoomOS(Cisco_RoomOS):
+    """
+    asyncio counterpart of Cisco_RoomOS, every get_status_*, set_*, command_* and bookings method is a coroutine.
+    The URLs and payloads are the ones defined on Cisco_RoomOS, only the transport is replaced by aiohttp.
+    
+    Usage: async with AsyncCisco_RoomOS(address, username, password) as codec:
+               await codec.get_status_sip_RegistrationStatus()
+    Pass a shared aiohttp.ClientSession as client to keep thousands of requests for many devices on one connector.
+    """
+    
+    def __init__(self,address : str ,username : str ,password :str ,ssl_verify: str = False,
+                 limit_per_host: int = 4, client = None, timeout: tuple = (5, 60), retries: int = 2, backoff: float = 0.5,
+                 breaker_threshold: int = 5, breaker_cooldown: float = 30.0, scheme: str = "http", min_tls: str = "TLSv1.2",
+                 parser: str = "fast", lazy_results: bool = False, raise_errors: bool = False, compression: bool = True,
+                 config_cache: float = None, skip_unchanged: bool = False):
+        """limit_per_host: number of connections kept open to the device when no client is supplied
+        client: aiohttp.ClientSession to send the requests with, it is not closed by close()
+        timeout, retries, backoff, breaker_threshold, breaker_cooldown, scheme, min_tls, parser, lazy_results, raise_errors,
+        compression, config_cache, skip_unchanged: as for Cisco_RoomOS, aiohttp decompresses the answers as they arrive. last_timing is not kept"""
+        if scheme not in ("http", "https"):
+            raise Exception("Unidentified scheme requested, please choose http or https")
+        if parser not in _PARSERS:
+            raise Exception("Unidentified parser requested, please choose fast or jxmlease")
+        self.address:str = address
+        self.scheme:str = scheme
+        self.base_url:str = f"{scheme}://{address}"
+        self.min_tls:str = min_tls
+        self.username:str = username
+        self.password:str = password
+        self.ssl_verify:bool = ssl_verify
+        self.parser:str = parser
+        self._parse = _PARSERS[parser]
+        self.lazy_results:bool = lazy_results
+        self.raise_errors:bool = raise_errors
+        self.compression:bool = compression
+        self.skip_unchanged:bool = skip_unchanged
+        self.skipped_writes:int = 0
+        if config_cache is not None:
+            self._config_cache = self._write_cache = _ConfigCache(config_cache)
+        elif skip_unchanged:
+            self._write_cache = _ConfigCache(60.0)
+        self.auth_mode:str = "basic"
+        self.timeout:tuple = timeout
+        self.retries:int = retries
+        self.backoff:float = backoff
+        self.breaker_threshold:int = breaker_threshold
+        self.breaker_cooldown:float = breaker_cooldown
+        self._limit_per_host = limit_per_host
+        self._client = client
+        self._owns_client = client is None
+        self._auth = None
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+    
+    async def close(self):
+        """Description: Close the connections to the device"""
+        if self._owns_client and self._client is not None:
+            await self._client.close()
+            self._client = None
+    
+    def _get_client(self):
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError("AsyncCisco_RoomOS requires aiohttp, install it with pip install aiohttp")
+        if self._auth is None:
+            self._auth = aiohttp.BasicAuth(self.username, self.password)
+        if self._client is None:
+            # created on first use so that it binds to the running event loop
+            self._client = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=0, limit_per_host=self._limit_per_host))
+        return self._client
+    
+    async def _request(self, method : str, url : str, headers : dict = None, data : str = None):
+        """Returns the status code and body bytes of the response, with the timeouts, retries and circuit breaker of Cisco_RoomOS"""
+        import aiohttp
+        import asyncio
+        breaker = self._breaker()
+        if breaker is not None:
+            breaker.check(self.address)
+        retries = self.retries if method in ("GET", "HEAD") else 0
+        attempt = 0
+        while True:
+            try:
+                status_code, body = await self._send(method, url, headers, data)
+            except aiohttp.ClientSSLError as e:
+                # a certificate this client refuses is its own setting, not a failing device: no retry, no breaker count
+                raise TransportError(f"Connection Failed , {e}\n") from e
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if breaker is not None:
+                    breaker.record(False)
+                if attempt >= retries:
+                    raise TransportError(f"Connection Failed , {e}\n") from e
+            else:
+                failed = status_code in self._RETRY_STATUS
+                if breaker is not None:
+                    breaker.record(not failed)
+                if not failed or attempt >= retries:
+                    return status_code, body
+            await asyncio.sleep(self._backoff_delay(attempt))
+            attempt += 1
+            if breaker is not None:
+                breaker.check(self.address)
+    
+    def _request_options(self):
+        import aiohttp
+        connect_timeout, read_timeout = self.timeout if isinstance(self.timeout, tuple) else (self.timeout, self.timeout)
+        return {"auth": self._auth, "ssl": _shared_ssl_context(self.ssl_verify, self.min_tls),
+                "timeout": aiohttp.ClientTimeout(sock_connect=connect_timeout, sock_read=read_timeout)}
+    
+    def _headers(self, headers : dict = None):
+        return {**(headers or {}), "Accept-Encoding": "gzip, deflate" if self.compression else "identity"}
+    
+    async def _send(self, method : str, url : str, headers : dict, data : str):
+        client = self._get_client()
+        async with client.request(method, url, headers=self._headers(headers), data=data, **self._request_options()) as response:
+            return response.status, await response.read()
+    
+    async def _stream_chunks(self, url : str):
+        """Body of a GET as it arrives, under the circuit breaker of the device. A stream is not retried"""
+        import aiohttp
+        import asyncio
+        breaker = self._breaker()
+        if breaker is not None:
+            breaker.check(self.address)
+        client = self._get_client()
+        try:
+            async with client.get(url, headers=self._headers(), **self._request_options()) as response:
+                if breaker is not None:
+                    breaker.record(response.status not in self._RETRY_STATUS)
+                self._result("document", response.status, None)
+                async for chunk in response.content.iter_chunked(self._STREAM_CHUNK):
+                    yield chunk
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            if breaker is not None and not isinstance(e, aiohttp.ClientSSLError):
+                breaker.record(False)
+            raise TransportError(f"Connection Failed , {e}\n") from e
+    
+    async def stream_extract(self, paths : list, document : str = "status"):
+        """Description: Read only the given subtrees or leaves of status.xml or configuration.xml, see Cisco_RoomOS.stream_extract
+        Usage: async for path, value in codec.stream_extract(paths):"""
+        if document not in ("status", "configuration"):
+            raise Exception("Unidentified document requested, please choose status or configuration\n")
+        extractor = _StreamExtractor(paths)
+        if self._snapshot is not None and document == "status":
+            for match in extractor.feed(await self._snapshot_status(["Status"]), True):
+                yield match
+            return
+        if self._config_cache is not None and document == "configuration":
+            for match in extractor.feed(await self._config_document(["Configuration"]), True):
+                yield match
+            return
+        chunks = self._stream_chunks(f"{self.base_url}/{document}.xml")
+        try:
+            async for chunk in chunks:
+                for match in extractor.feed(chunk):
+                    yield match
+                if extractor.done:
+                    return
+            for match in extractor.feed(b"", True):
+                yield match
+        finally:
+            await chunks.aclose()
+    
+    async def get_status_many(self, requests : list):
+        """Description: Read several status values with as few getxml requests as possible, see Cisco_RoomOS.get_status_many"""
+        try:
+            paths, groups = self._status_many_plan(requests)
+        except Exception as e:
+            return self._failed(e)
+        if self._snapshot is not None:
+            return {key: await self._get_status(self._getxml_url(path)) for key, path in paths.items()}
+        import asyncio
+        bodies = await asyncio.gather(*(self._get_body(self._getxml_url(location)) for location in groups), return_exceptions=True)
+        results = {}
+        for keys, body in zip(groups.values(), bodies):
+            try:
+                if isinstance(body, Exception):
+                    raise body
+                root = ET.fromstring(body)
+                for key in keys:
+                    results[key] = self._status_many_extract(root, paths[key])
+            except Exception as e:
+                for key in keys:
+                    results[key] = e
+        return {key: results[key] for key in paths}
+    
+    @asynccontextmanager
+    async def transaction(self, max_bytes : int = 64 * 1024):
+        """Description: Send the values of every set_* call made inside the block in one putxml request, see Cisco_RoomOS.transaction
+        Usage: async with codec.transaction() as transaction:
+                   rate = await codec.set_default_call_rate(6000)"""
+        if self._transaction is not None:
+            yield self._transaction
+            return
+        transaction = ConfigTransaction(max_bytes)
+        self._transaction = transaction
+        try:
+            yield transaction
+        finally:
+            self._transaction = None
+        await self._commit(transaction)
+    
+    async def _commit(self, transaction : ConfigTransaction):
+        for payload, writes in transaction.chunks():
+            try:
+                status_code, body = await self._request("POST", f"{self.base_url}/putxml", headers={'Content-Type': 'text/xml'}, data=payload)
+                transaction.settle(writes, self._parse(self._result("document", status_code, body)))
+            except Exception as e:
+                transaction.settle(writes, exception=e)
+            for write in writes:
+                self._write_through(write.leaves, write.ok)
+        if self.raise_errors and transaction.failed:
+            raise transaction.failed[0].exception
+    
+    async def apply_desired_config(self, spec : dict, dry_run : bool = False):
+        """Description: Write only the values of spec that differ from configuration.xml, see Cisco_RoomOS.apply_desired_config
+        Usage: report = await codec.apply_desired_config({"Conference/DefaultCall/Rate": 6000})"""
+        try:
+            if self._transaction is not None and not dry_run:
+                raise Exception(_IN_TRANSACTION)
+            desired = _desired_leaves(spec)
+            matches = [match async for match in self.stream_extract([_index_key(parts) for parts in desired], "configuration")]
+            changes, unchanged = _desired_changes(desired, matches)
+            if dry_run or not changes:
+                return _config_report(changes, unchanged)
+            async with self.transaction() as transaction:
+                writes = [await self.set_config(change.path, change.desired) for change in changes]
+            return _config_report(changes, unchanged, writes, transaction.requests)
+        except Exception as e:
+            return self._failed(e)
+    
+    async def _snapshot_status(self, path : list):
+        import asyncio
+        snapshot = self._snapshot
+        if snapshot.async_lock is None:
+            snapshot.async_lock = asyncio.Lock()
+        # coroutines gathered inside snapshot() wait for the one fetch in flight instead of each sending their own
+        async with snapshot.async_lock:
+            if snapshot.stale():
+                snapshot.load(await self._get_body(f"{self.base_url}/status.xml"))
+        return snapshot.render(path)
+    
+    async def refresh_config(self):
+        """Description: Fetch configuration.xml into the configuration cache now, see Cisco_RoomOS.refresh_config"""
+        try:
+            cache = self._write_cache
+            if cache is None:
+                raise Exception(_NO_CONFIG_CACHE)
+            cache.load(await self._get_body(f"{self.base_url}/configuration.xml"))
+        except Exception as e:
+            return self._failed(e)
+    
+    async def _config_document(self, path : list):
+        cache = self._config_cache
+        if cache.stale():
+            cache.load(await self._get_body(f"{self.base_url}/configuration.xml"))
+        return cache.render(path)
+    
+    async def _unchanged(self, payloads : list):
+        cache = self._write_cache
+        try:
+            if cache.stale():
+                cache.load(await self._get_body(f"{self.base_url}/configuration.xml"))
+            return all(cache.value(path) == value for payload in payloads for path, value in _payload_leaves(payload))
+        except Exception:
+            return False
+    
+    async def _records(self, url : str, record):
+        try:
+            path = self._snapshot.location(url) if self._snapshot is not None else None
+            if path is not None:
+                return record.parse(await self._snapshot_status(path))
+            status_code, body = await self._request("GET", url, headers={'Content-Type': 'text/xml'})
+            return record.parse(self._result("document", status_code, body))
+        except Exception as e:
+            return self._failed(e)
+    
+    async def _get_status(self, url : str):
+        headers = {
+          'Content-Type': 'text/xml',
+        }
+        try:
+            path = self._snapshot.location(url) if self._snapshot is not None else None
+            if path is not None:
+                return self._result("status", 200, await self._snapshot_status(path))
+            status_code, body = await self._request("GET", url, headers=headers)
+            return self._result("status", status_code, body)
+        except Exception as e:
+            return self._failed(e)
+    
+    # the setters and commands of Cisco_RoomOS call these through their name mangled private names
+    async def _Cisco_RoomOS__post_parser_return(self,payload,output_debug):
+        if self.skip_unchanged and await self._unchanged([payload]):
+            return self._skip_write([payload], output_debug)
+        if self._transaction is not None:
+            return self._transaction.add([payload], output_debug)
         try:
-            url = f"http://{self.address}/putxml"
+            url = f"{self.base_url}/putxml"
             headers = {
               'Content-Type': 'text/xml',
             }
-            response = requests.post(url, headers=headers,auth=HTTPBasicAuth(self.username,self.password), data=payload,verify= self.ssl_verify)
-            response_json = jxmlease.parse(response.text)
-            if response.status_code == 200:
-                if "OK" in response.text:
-                    return "OK\n"
-                elif "Error" in response.text:
-                    print(f"Something went wrong, Couldn't verify the Command.Please check and run again. Returned Error:\n{response_json}")
-                    return(response_json)
-            else:
-                if response.status_code == 401:
-                    raise Exception("Authorisation Failed , Please check Credentials\n")
-                elif (response.status_code==400):
-                    raise Exception("Connection Failed , Please check Connection\n")
-                else:
-                    raise Exception(f"Error: {response.status_code}")
+            status_code, body = await self._request("POST", url, headers=headers, data=payload)
+            result = self._result("configuration", status_code, body, output_debug)
+            if self._write_cache is not None:
+                self._write_through(_payload_leaves(payload), _config_written(result))
+            return result
         except Exception as e:
-            return(str(e))
+            self._write_through(None, False)
+            if output_debug:
+                print(e)
+            return self._failed(e)
     
-    def __post_parser_return(self,payload,output_debug):
+    async def _Cisco_RoomOS__command_parser_return(self,payload):
         try:
-            url = f"http://{self.address}/putxml"
+            url = f"{self.base_url}/putxml"
             headers = {
               'Content-Type': 'text/xml',
             }
-            response = requests.post(url, headers=headers,auth=HTTPBasicAuth(self.username,self.password), data=payload, verify=self.ssl_verify)
-            response_json = jxmlease.parse(response.text)
-            if response.status_code == 200:
-                if "Success" in response.text:
-                    if output_debug:
-                        print(response_json)
-                    return(response_json)
-                elif "Error" in response.text:
-                    error = jxmlease.parse(response.text)['Configuration']['Error']['Details']
-                    raise Exception(f"Error: {error}")
-                else:
-                    return(response_json)
+            status_code, body = await self._request("POST", url, headers=headers, data=payload)
+            return self._result("command", status_code, body)
+        except Exception as e:
+            return str(self._failed(e))
+    
+    async def _post_sequence(self, payloads : list, output_debug : bool):
+        if self._transaction is not None:
+            if self.skip_unchanged and await self._unchanged(payloads):
+                return self._skip_write(payloads, output_debug)
+            return self._transaction.add(payloads, output_debug)
+        resp = None
+        for payload in payloads:
+            resp = await self._Cisco_RoomOS__post_parser_return(payload,output_debug)
+            if not _config_written(resp):
+                break
+        return resp
+    
+    async def _get_body(self, url : str):
+        status_code, body = await self._request("GET", url)
+        return self._result("document", status_code, body)
+    
+    async def _get_text(self, url : str):
+        return (await self._get_body(url)).decode("utf-8")
+    
+    async def get_device_status(self,return_type : str = "json"):
+        """Description: Get full device status"""
+        try:
+            if self._snapshot is not None:
+                return self._device_status_result(await self._snapshot_status(["Status"]), return_type)
+            return self._device_status_result(await self._get_body(f"{self.base_url}/status.xml"), return_type)
+        except Exception as e:
+            return self._failed(e)
+    
+    async def get_device_backup(self):
+        """Description: Get device configuration backup, written to a file named after the device"""
+        try:
+            if self._config_cache is not None:
+                return _BackupFile.save([await self._config_document(["Configuration"])])
+            backup = _BackupFile()
+            try:
+                async for chunk in self._stream_chunks(f'{self.base_url}/configuration.xml'):
+                    backup.write(chunk)
+                backup.finish()
+            except BaseException:
+                backup.abort()
+                raise
+        except Exception as e:
+            return self._failed(e)
+    
+    async def get_device_video_config(self,output_debug : bool =False):
+        """Description: get device video configuration"""
+        url = f'{self.base_url}/getxml?location=/Configuration/Video'
+        try:
+            if self._config_cache is not None:
+                text = await self._config_document(self._config_cache.location(url))
             else:
-                if response.status_code == 401:
-                    raise Exception("Authorisation Failed , Please check Credentials\n")
-                elif (response.status_code==400):
-                    raise Exception("Connection Failed , Please check Connection\n")
-                else:
-                    raise Exception(f"Error: {response.status_code}")
+                text = await self._get_text(url)
+            if output_debug:
+                print(text)
+            return(text)
         except Exception as e:
             if output_debug:
                 print(e)
-            return(e)
+            return self._failed(e)
     
-    def __return_type_parser(response,return_type):
-        if return_type == "json":
-            return jxmlease.parse(response.text)
-        elif return_type == "xml":
-            return response.text
-        else:
-            raise Exception("Unidentified return type requested, please choose xml or json")
\ No newline at end of file
+    async def get_audio_status(self,output_debug : bool = False):
+        """Description: Get audio status"""
+        try:
+            text = await self._get_text(f'{self.base_url}/getxml?location=/Status/Audio')
+            if output_debug:
+                print(text)
+            return(text)
+        except Exception as e:
+            if output_debug:
+                print(e)
+            return self._failed(e)
+    
+    async def get_call_history(self,output_debug : bool =False):
+        """Description: Get call history"""
+        headers = {
+          'Content-Type': 'text/xml',
+        }
+        try:
+            status_code, body = await self._request("POST", f"{self.base_url}/putxml", headers=headers, data=self._CALL_HISTORY_PAYLOAD)
+            return self._result("call_history", status_code, body, output_debug)
+        except Exception as e:
+            if output_debug:
+                print(e)
+            return self._failed(e)
+    
+    async def get_call_history_records(self):
+        """Description: Get call history as CallHistoryEntry records"""
+        headers = {
+          'Content-Type': 'text/xml',
+        }
+        try:
+            status_code, body = await self._request("POST", f"{self.base_url}/putxml", headers=headers, data=self._CALL_HISTORY_PAYLOAD)
+            return CallHistoryEntry.parse(self._result("document", status_code, body))
+        except Exception as e:
+            return self._failed(e)
+    
+    async def test_call(self,extension : str ,duration : int = 30,output_debug : bool =False):
+        """Description: Test calls automatically for desired duration to termintae automatically."""
+        url = f"{self.base_url}/putxml"
+        headers = {
+          'Content-Type': 'text/xml',
+        }
+        try:
+            status_code, body = await self._request("POST", url, headers=headers, data=self._dial_payload(extension))
+            call_id = self._result("dial", status_code, body)
+            import asyncio
+            await asyncio.sleep(duration)
+            await self._request("POST", url, headers=headers, data=self._disconnect_payload(call_id))
+            call_data = (await self.get_call_history(output_debug=False))['Command']['CallHistoryGetResult']['Entry'][0]
+            if output_debug:
+                print(call_data)
+            return call_data
+        except Exception as e:
+            return self._failed(e)
+    
+    async def command_microphoneToggle_mute(self):
+        """Description: Toggle the microphone between muted and unmuted. Returns result along with Microphones Mute status."""
+        print (await self._Cisco_RoomOS__command_parser_return(self._TOGGLE_MUTE_PAYLOAD))
+        return await self.get_status_audio_input_microphone_mute()
+
+
+
+class FleetResult(namedtuple("FleetResult", ("address", "method", "result", "error", "started", "elapsed", "dns"), defaults=(0.0,))):
+    """Outcome of one method call on one device of a CiscoFleet, dns is the part of elapsed spent resolving host names"""
+    __slots__ = ()
+
+
+def _fleet_invoke(codec : Cisco_RoomOS, method : str, args : tuple, kwargs : dict):
+    started = time.time()
+    resolution = _resolution_seconds()
+    t0 = time.perf_counter()
+    try:
+        result = getattr(codec, method)(*args, **kwargs)
+        error = None
+        if isinstance(result, Exception):
+            # the library returns its errors instead of raising them
+            result, error = None, result
+    except Exception as e:
+        result, error = None, e
+    return result, error, started, time.perf_counter() - t0, _resolution_seconds() - resolution
+
+
+_fleet_process_codecs = {}
+
+def _fleet_process_call(device : tuple, options : dict, method : str, args : tuple, kwargs : dict):
+    """Runs in a worker process, the Cisco_RoomOS objects are kept per process so their connections are reused"""
+    # fleets with other client options get objects of their own in the same worker
+    key = (device, tuple(sorted(options.items())))
+    codec = _fleet_process_codecs.get(key)
+    if codec is None:
+        codec = _fleet_process_codecs[key] = Cisco_RoomOS(*device, **options)
+    return _fleet_invoke(codec, method, args, kwargs)
+
+
+class CiscoFleet:
+    """
+    Run any Cisco_RoomOS method across many devices concurrently.
+    
+    Usage: fleet = CiscoFleet([(address, username, password), ...], max_workers=64)
+           for r in fleet.run("get_status_sip_RegistrationStatus"):
+               print(r.address, r.elapsed, r.error or r.result)
+    max_workers caps the calls in flight across the fleet, per_device caps the calls in flight to one device.
+    executor is "thread" or "process". Other keyword arguments are passed to Cisco_RoomOS.
+    """
+    
+    def __init__(self, devices : list, max_workers : int = 32, per_device : int = 1, executor : str = "thread", **options):
+        if executor not in ("thread", "process"):
+            raise Exception("Unidentified executor requested, please choose thread or process")
+        self.devices:list = [tuple(device) for device in devices]
+        self.max_workers:int = max_workers
+        self.per_device:int = per_device
+        self.executor:str = executor
+        options.setdefault("pool_maxsize", max(per_device, 1))
+        self._options = options
+        self._codecs = {}
+        self._lock = threading.Lock()
+        self._pool = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """Description: Stop the workers and close the connections to all devices"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+        for codec in self._codecs.values():
+            codec.close()
+        self._codecs.clear()
+    
+    def preresolve(self, ttl : float = 300.0):
+        """Description: Resolve the host names of all devices concurrently into the shared DNS cache, pass dns_ttl to use it
+        Usage: fleet = CiscoFleet(devices, dns_ttl=300); fleet.preresolve(). Worker processes keep their own cache"""
+        return Cisco_RoomOS.preresolve([device[0] for device in self.devices], ttl=ttl, max_workers=self.max_workers)
+    
+    def _codec(self, device : tuple):
+        with self._lock:
+            codec = self._codecs.get(device)
+            if codec is None:
+                codec = self._codecs[device] = Cisco_RoomOS(*device, **self._options)
+            return codec
+    
+    def _submit(self, device : tuple, method : str, args : tuple, kwargs : dict):
+        if self._pool is None:
+            if self.executor == "thread":
+                from concurrent.futures import ThreadPoolExecutor
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers)
+            else:
+                from concurrent.futures import ProcessPoolExecutor
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        if self.executor == "thread":
+            return self._pool.submit(_fleet_invoke, self._codec(device), method, args, kwargs)
+        return self._pool.submit(_fleet_process_call, device, self._options, method, args, kwargs)
+    
+    def run(self, method : str, *args, **kwargs):
+        """Description: Call a Cisco_RoomOS method on every device
+        Usage: Supply the method name and its arguments, yields FleetResult as the calls complete"""
+        return self.run_many([(method, args, kwargs)])
+    
+    def run_many(self, calls : list):
+        """Description: Call several Cisco_RoomOS methods on every device
+        Usage: Supply a list of (method name, args tuple, kwargs dict), yields FleetResult as the calls complete"""
+        calls = [(call[0], tuple(call[1]) if len(call) > 1 else (), dict(call[2]) if len(call) > 2 else {}) for call in calls]
+        for method, _, _ in calls:
+            if method.startswith("_") or not callable(getattr(Cisco_RoomOS, method, None)):
+                raise AttributeError(f"Cisco_RoomOS has no method {method}")
+        
+        from concurrent.futures import wait, FIRST_COMPLETED
+        queues = {device: deque(calls) for device in self.devices}
+        ready = deque(device for device in self.devices if calls)
+        in_flight_per_device = dict.fromkeys(self.devices, 0)
+        in_flight = {}
+        try:
+            while ready or in_flight:
+                while ready and len(in_flight) < self.max_workers:
+                    device = ready.popleft()
+                    method, args, kwargs = queues[device].popleft()
+                    in_flight[self._submit(device, method, args, kwargs)] = (device, method)
+                    in_flight_per_device[device] += 1
+                    if queues[device] and in_flight_per_device[device] < self.per_device:
+                        ready.append(device)
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    device, method = in_flight.pop(future)
+                    in_flight_per_device[device] -= 1
+                    if queues[device] and in_flight_per_device[device] == self.per_device - 1:
+                        # the device was held back by its cap, it can take work again
+                        ready.append(device)
+                    try:
+                        result, error, started, elapsed, dns = future.result()
+                    except Exception as e:
+                        result, error, started, elapsed, dns = None, e, time.time(), 0.0, 0.0
+                    yield FleetResult(device[0], method, result, error, started, elapsed, dns)
+        finally:
+            for future in in_flight:
+                future.cancel()
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+Bytes on the wire and latency of status.xml, configuration.xml and call history with and without gzip, against the
+xAPI stand-in sending at a limited rate, as over a WAN link to a remote site. Figures come from last_timing.
+
+Usage: python benchmarks/bench_compression.py
+       python benchmarks/bench_compression.py --rate 250000 --calls 8 --history 500 -r 5
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(here, ".."))
+sys.path.insert(0, here)
+import Cisco_RoomOS_Lib
+import xapi_standin
+from bench_parser import synthetic_configuration, synthetic_status
+
+
+def measure(codec, call, repeat):
+    """Median total time and the last_timing of the final run"""
+    times = []
+    for _ in range(repeat):
+        result = call(codec)
+        if isinstance(result, str) and result.startswith("Error"):
+            raise SystemExit(result)
+        times.append(codec.last_timing["total"])
+    return statistics.median(times), codec.last_timing
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rate", type=float, default=1000000, help="bytes per second the stand-in sends at, 0 for unlimited")
+    parser.add_argument("--calls", type=int, default=8, help="calls in the synthetic status document")
+    parser.add_argument("--history", type=int, default=200, help="entries in the call history")
+    parser.add_argument("-r", "--repeat", type=int, default=3)
+    args = parser.parse_args()
+    server = xapi_standin.start(status=synthetic_status(calls=args.calls), configuration=synthetic_configuration(), rate=args.rate or None)
+    server.device.history = args.history
+    address = f"127.0.0.1:{server.server_address[1]}"
+    cases = [("status.xml", lambda codec: codec.get_device_status()),
+             ("configuration.xml", lambda codec: codec.get_device_backup()),
+             ("call history", lambda codec: codec.get_call_history())]
+    cwd = os.getcwd()
+    try:
+        # get_device_backup writes its file to the working directory
+        os.chdir(tempfile.mkdtemp())
+        for label, call in cases:
+            for compression in (False, True):
+                codec = Cisco_RoomOS_Lib.Cisco_RoomOS(address, "admin", "admin", compression=compression)
+                total, timing = measure(codec, call, args.repeat)
+                codec.close()
+                print(f"{label:<18} {timing['encoding'] or 'identity':<9} wire {timing['wire_bytes'] / 1024:8.1f} KB   "
+                      f"decoded {timing['bytes'] / 1024:8.1f} KB   first byte {timing['latency'] * 1000:7.2f} ms   total {total * 1000:8.2f} ms")
+    finally:
+        os.chdir(cwd)
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
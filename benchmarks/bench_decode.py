@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+Cost of the old response pipeline (response.text, substring scans, parse of the text) against the current one
+(parse of response.content, classification on the tree) for a status document and a configuration write answer.
+The codec answer is replayed from memory without a charset in Content-Type, the case where requests sniffs the encoding.
+
+Usage: python benchmarks/bench_decode.py
+       python benchmarks/bench_decode.py status.xml -r 50
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+import requests
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(here, ".."))
+sys.path.insert(0, here)
+import Cisco_RoomOS_Lib
+from bench_parser import synthetic_status
+
+
+def replay(body, content_type="text/xml"):
+    """A requests response carrying body, as it comes out of the adapter before anything read it"""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response.headers["Content-Type"] = content_type
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    return response
+
+
+def old_status(codec, body, content_type):
+    response = replay(body, content_type)
+    return codec._parse(response.text)
+
+
+def new_status(codec, body, content_type):
+    response = replay(body, content_type)
+    return codec._result("status", response.status_code, response.content)
+
+
+def old_config(codec, body, content_type):
+    response = replay(body, content_type)
+    parsed = codec._parse(response.text)
+    if "Success" in response.text:
+        return parsed
+    elif "Error" in response.text:
+        raise Exception(codec._parse(response.text)['Configuration']['Error']['Details'])
+    return parsed
+
+
+def new_config(codec, body, content_type):
+    response = replay(body, content_type)
+    return codec._result("configuration", response.status_code, response.content)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("status", nargs="?", help="recorded status.xml, a synthetic document is used when omitted")
+    parser.add_argument("-r", "--repeat", type=int, default=20)
+    args = parser.parse_args()
+    if args.status:
+        with open(args.status, "rb") as f:
+            status = f.read()
+    else:
+        status = synthetic_status().encode()
+    config = b'<?xml version="1.0"?>\n<Configuration><Success/></Configuration>'
+    codec = Cisco_RoomOS_Lib.Cisco_RoomOS("127.0.0.1", "admin", "admin")
+    cases = [("status.xml", status, old_status, new_status), ("putxml Success", config, old_config, new_config)]
+    # application/xml without charset is where requests runs charset detection, text/xml falls back to ISO-8859-1
+    for content_type in ("application/xml", "text/xml"):
+        for label, body, old, new in cases:
+            times = [min(timeit.repeat(lambda: run(codec, body, content_type), number=1, repeat=args.repeat)) for run in (old, new)]
+            print(f"{label:<16} {content_type:<16} {len(body) / 1024:7.1f} KB   text {times[0] * 1000:8.3f} ms   bytes {times[1] * 1000:8.3f} ms"
+                  f"   saved {(times[0] - times[1]) * 1000:8.3f} ms ({times[0] / times[1]:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Cost of loading Cisco_RoomOS_Lib in a short-lived CLI invocation: import time of the module itself, resident
+memory added by the import and the time of the first accessor lookups, each measured in a fresh interpreter. With --rev the module of a git revision is measured
+too, for a before/after comparison. Byte code is compiled once before measuring, as for an installed package.
+
+Usage: python benchmarks/bench_import.py -n 20
+       python benchmarks/bench_import.py --rev HEAD~1
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+here = os.path.dirname(os.path.abspath(__file__))
+root = os.path.join(here, "..")
+
+CHILD = """
+import json, resource, sys, time
+sys.path.insert(0, sys.argv[1])
+# dependencies are imported first so that only the module itself is measured
+for name in ("requests", "urllib3", "jxmlease", "aiohttp", "asyncio", "concurrent.futures.process", "xml.etree.ElementTree",
+             "xml.sax.saxutils", "xml.parsers.expat", "ssl", "ipaddress", "typing", "datetime", "urllib.parse"):
+    try:
+        __import__(name)
+    except ImportError:
+        pass
+before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+import Cisco_RoomOS_Lib
+imported = time.perf_counter()
+after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+functions = sum(type(value).__name__ == "function" for value in vars(Cisco_RoomOS_Lib.Cisco_RoomOS).values())
+lookup = time.perf_counter()
+Cisco_RoomOS_Lib.Cisco_RoomOS.get_status_call_duration
+Cisco_RoomOS_Lib.Cisco_RoomOS.set_default_call_rate
+first = time.perf_counter() - lookup
+print(json.dumps({"import": imported - start, "first": first, "rss": after - before, "functions": functions}))
+"""
+
+
+def measure(directory, count):
+    subprocess.run([sys.executable, "-m", "py_compile", os.path.join(directory, "Cisco_RoomOS_Lib.py")], check=True)
+    runs = [json.loads(subprocess.run([sys.executable, "-c", CHILD, directory], check=True, capture_output=True, text=True).stdout)
+            for _ in range(count)]
+    return {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+
+
+def report(label, result):
+    # ru_maxrss is in kilobytes on Linux
+    print(f"{label:<14} import {result['import'] * 1000:7.2f} ms   first accessors {result['first'] * 1000:6.3f} ms"
+          f"   rss +{result['rss'] / 1024:6.2f} MB   class functions {result['functions']:4.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", type=int, default=15, help="interpreters started per measurement")
+    parser.add_argument("--rev", help="git revision to compare the working tree with")
+    args = parser.parse_args()
+    if args.rev:
+        with tempfile.TemporaryDirectory() as directory:
+            source = subprocess.run(["git", "-C", root, "show", f"{args.rev}:Cisco_RoomOS_Lib.py"], check=True, capture_output=True).stdout
+            with open(os.path.join(directory, "Cisco_RoomOS_Lib.py"), "wb") as f:
+                f.write(source)
+            report(args.rev, measure(directory, args.n))
+    report("working tree", measure(root, args.n))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Parse time of status and configuration documents with the fast expat parser and with jxmlease,
+checking that both give the same structure.
+
+Usage: python benchmarks/bench_parser.py status.xml configuration.xml
+       python benchmarks/bench_parser.py --record 10.10.10.10 admin secret   (saves the documents of a codec, then benchmarks them)
+       python benchmarks/bench_parser.py                                     (synthetic documents of codec size)
+"""
+
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import Cisco_RoomOS_Lib
+
+
+def synthetic_status(calls=4, channels=12, peripherals=20, messages=40):
+    """A status document shaped like the one of a codec in a call, about 40 KB with the defaults"""
+    parts = ['<?xml version="1.0"?>\n<Status product="Cisco Codec" version="ce10.0.0">']
+    parts.append("<Audio>" + "".join(f'<Input><Connectors><Microphone item="{m}"><ConnectionStatus>Connected</ConnectionStatus><Mute>Off</Mute></Microphone></Connectors></Input>' for m in range(1, 9)) + "<Volume>50</Volume></Audio>")
+    for c in range(1, calls + 1):
+        parts.append(f'<Call item="{c}" maxOccurrence="n"><AnswerState>Answered</AnswerState><CallType>Video</CallType><CallbackNumber>sip:room{c}@example.com</CallbackNumber>'
+                     f'<DeviceType>Endpoint</DeviceType><Direction>Outgoing</Direction><DisplayName>Room {c}</DisplayName><Duration>{c * 60}</Duration>'
+                     f'<Encryption><Type>Aes-128</Type></Encryption><Protocol>Sip</Protocol><ReceiveCallRate>6000</ReceiveCallRate>'
+                     f'<RemoteNumber>room{c}@example.com</RemoteNumber><Status>Connected</Status><TransmitCallRate>6000</TransmitCallRate></Call>')
+        channel_parts = []
+        for ch in range(1, channels + 1):
+            netstat = "".join(f"<{name}>{ch * 7}</{name}>" for name in ("Bytes", "ChannelRate", "Jitter", "LastIntervalLost", "LastIntervalReceived", "Loss", "MaxJitter", "Packets"))
+            channel_parts.append(f'<Channel item="{ch}"><Direction>{"incoming" if ch % 2 else "outgoing"}</Direction><Encryption>On</Encryption>'
+                                 f'<Type>{"Audio" if ch % 3 == 0 else "Video"}</Type><Video><ChannelRole>Main</ChannelRole><FrameRate>30</FrameRate>'
+                                 f'<Protocol>H264</Protocol><ResolutionX>1920</ResolutionX><ResolutionY>1080</ResolutionY></Video>'
+                                 f'<NetStat>{netstat}</NetStat><ParticipantId>{ch}</ParticipantId></Channel>')
+        parts.append(f'<MediaChannels><Call item="{c}">{"".join(channel_parts)}</Call></MediaChannels>')
+    parts.append('<Network item="1"><CDP><Address>10.0.0.2</Address><DeviceId>switch</DeviceId></CDP><DNS><Domain><Name>example.com</Name></Domain>'
+                 '<Server item="1"><Address>10.0.0.53</Address></Server></DNS><Ethernet><MacAddress>00:11:22:33:44:55</MacAddress><Speed>1000full</Speed></Ethernet>'
+                 '<IPv4><Address>10.0.0.5</Address><Gateway>10.0.0.1</Gateway><SubnetMask>255.255.255.0</SubnetMask></IPv4></Network>')
+    parts.append("<Peripherals>" + "".join(f'<ConnectedDevice item="{1000 + p}"><HardwareInfo>{p}</HardwareInfo><ID>00:00:00:00:{p:02x}</ID><Name>Peripheral {p}</Name>'
+                                            f'<SerialNumber>FOC{p:08d}</SerialNumber><SoftwareInfo>RoomOS 10.0</SoftwareInfo><Status>Connected</Status>'
+                                            f'<Type>TouchPanel</Type><UpgradeStatus>None</UpgradeStatus></ConnectedDevice>' for p in range(peripherals)) + "</Peripherals>")
+    parts.append("<Diagnostics>" + "".join(f'<Message item="{m}"><Description>Diagnostic message number {m} with some explanatory text &amp; details</Description>'
+                                            f'<Level>Warning</Level><References>ref={m}</References><Type>Type{m}</Type></Message>' for m in range(messages)) + "</Diagnostics>")
+    parts.append("<SIP><Registration item=\"1\"><Status>Registered</Status><URI>room@example.com</URI></Registration></SIP>"
+                 "<SystemUnit><ProductId>Cisco Room Kit</ProductId><Software><Version>ce10.0.0</Version></Software><Uptime>123456</Uptime></SystemUnit>"
+                 "<UserInterface><ContactInfo><Name>Room-1</Name></ContactInfo></UserInterface></Status>")
+    return "".join(parts)
+
+
+def synthetic_configuration(sections=60, leaves=12):
+    parts = ['<?xml version="1.0"?>\n<Configuration product="Cisco Codec" version="ce10.0.0">']
+    for s in range(sections):
+        body = "".join(f'<Setting{l} valueSpaceRef="/Valuespace/TTPAR_OnOff">{"On" if l % 2 else "Off"}</Setting{l}>' for l in range(leaves))
+        parts.append(f'<Section{s}><Group item="1">{body}</Group><Group item="2">{body}</Group><Mode valueSpaceRef="/Valuespace/Mode">Auto</Mode></Section{s}>')
+    parts.append("<SystemUnit><Name>Room-1</Name></SystemUnit></Configuration>")
+    return "".join(parts)
+
+
+def record(address, username, password, directory="."):
+    codec = Cisco_RoomOS_Lib.Cisco_RoomOS(address, username, password)
+    files = []
+    for name in ("status.xml", "configuration.xml"):
+        response = codec._request("GET", f"{codec.base_url}/{name}")
+        path = os.path.join(directory, name)
+        with open(path, "wb") as f:
+            f.write(response.content)
+        files.append(path)
+    codec.close()
+    return files
+
+
+def bench(label, document, repeat):
+    parsers = Cisco_RoomOS_Lib._PARSERS
+    same = json.dumps(parsers["fast"](document)) == json.dumps(parsers["jxmlease"](document))
+    times = {}
+    for name, parse in parsers.items():
+        runs = max(3, repeat)
+        times[name] = min(timeit.repeat(lambda: parse(document), number=1, repeat=runs))
+    print(f"{label:<28} {len(document) / 1024:8.0f} KB   fast {times['fast'] * 1000:8.2f} ms   jxmlease {times['jxmlease'] * 1000:8.2f} ms"
+          f"   {times['jxmlease'] / times['fast']:5.1f}x   same shape: {same}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("files", nargs="*", help="recorded XML documents")
+    parser.add_argument("--record", nargs=3, metavar=("ADDRESS", "USERNAME", "PASSWORD"), help="save status.xml and configuration.xml of a codec first")
+    parser.add_argument("-r", "--repeat", type=int, default=20)
+    args = parser.parse_args()
+    files = args.files + (record(*args.record) if args.record else [])
+    if files:
+        documents = []
+        for path in files:
+            with open(path, "rb") as f:
+                documents.append((os.path.basename(path), f.read().decode("utf-8")))
+    else:
+        documents = [("synthetic status", synthetic_status()), ("synthetic configuration", synthetic_configuration())]
+    for label, document in documents:
+        bench(label, document, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+"""
+Memory held by results kept in a collector: the parsed dict representation (fast parser and jxmlease)
+against the __slots__ records of get_status_call_records, get_status_netStat_records,
+get_status_connectedHardware_records and get_call_history_records.
+Each document is parsed once per sample and every result is kept alive, as a poller storing samples would.
+
+Usage: python benchmarks/bench_records.py
+       python benchmarks/bench_records.py --samples 500
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(here, ".."))
+sys.path.insert(0, here)
+import Cisco_RoomOS_Lib
+from bench_parser import synthetic_status
+
+
+def synthetic_call_history(entries=200):
+    parts = ['<?xml version="1.0"?>\n<Command><CallHistoryGetResult status="OK">']
+    for e in range(1, entries + 1):
+        parts.append(f'<Entry item="{e}"><CallHistoryId>{e}</CallHistoryId><CallbackNumber>sip:room{e}@example.com</CallbackNumber>'
+                     f'<RemoteNumber>room{e}@example.com</RemoteNumber><DisplayName>Room {e}</DisplayName><Direction>Outgoing</Direction>'
+                     f'<CallType>Video</CallType><OccurrenceType>Placed</OccurrenceType><IsAcknowledged>Acknowledged</IsAcknowledged>'
+                     f'<Protocol>Sip</Protocol><CallRate>6000</CallRate><Encryption>Aes-128</Encryption>'
+                     f'<StartTime>2022-07-03T18:{e % 60:02d}:00</StartTime><StartTimeUTC>2022-07-03T13:{e % 60:02d}:00Z</StartTimeUTC>'
+                     f'<EndTime>2022-07-03T19:{e % 60:02d}:00</EndTime><EndTimeUTC>2022-07-03T14:{e % 60:02d}:00Z</EndTimeUTC>'
+                     f'<Duration>{e * 37}</Duration><DisconnectCause>Normal</DisconnectCause><DisconnectCauseType>LocalDisconnect</DisconnectCauseType>'
+                     f'<DisconnectCauseCode>16</DisconnectCauseCode><DisconnectCauseOrigin>Internal</DisconnectCauseOrigin></Entry>')
+    parts.append("</CallHistoryGetResult></Command>")
+    return "".join(parts).encode()
+
+
+def held(build, samples):
+    """Bytes still allocated after building and keeping samples results, and the seconds it took"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    kept = [build() for _ in range(samples)]
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, elapsed, kept
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=200, help="documents parsed and kept per representation")
+    args = parser.parse_args()
+    status = synthetic_status().encode()
+    snapshot = Cisco_RoomOS_Lib._StatusSnapshot(0)
+    snapshot.load(status)
+    cases = [
+        ("calls", snapshot.render(["Status", "Call"]), Cisco_RoomOS_Lib.CallStatus),
+        ("media channels", snapshot.render(["Status", "MediaChannels"]), Cisco_RoomOS_Lib.MediaChannelStat),
+        ("peripherals", snapshot.render(["Status", "Peripherals", "ConnectedDevice"]), Cisco_RoomOS_Lib.ConnectedDevice),
+        ("call history", synthetic_call_history(), Cisco_RoomOS_Lib.CallHistoryEntry),
+    ]
+    parsers = Cisco_RoomOS_Lib._PARSERS
+    print(f"{'result':<16} {'records':>8} {'jxmlease':>12} {'fast dict':>12} {'records':>12} {'per record':>22} {'vs fast':>8}")
+    for label, document, record in cases:
+        count = len(record.parse(document)) * args.samples
+        sizes = {}
+        for name, build in (("jxmlease", lambda: parsers["jxmlease"](document)), ("fast", lambda: parsers["fast"](document)),
+                            ("records", lambda: record.parse(document))):
+            sizes[name], _, kept = held(build, args.samples)
+            del kept
+        print(f"{label:<16} {count:>8} {sizes['jxmlease'] / 2**20:>10.2f}MB {sizes['fast'] / 2**20:>10.2f}MB {sizes['records'] / 2**20:>10.2f}MB"
+              f" {sizes['fast'] / count:>9.0f} B -> {sizes['records'] / count:>6.0f} B {sizes['fast'] / sizes['records']:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+Startup budget of `from Cisco_RoomOS_Lib import Cisco_RoomOS` in a fresh interpreter, read from python -X importtime.
+Prints the median cumulative import time, the heaviest modules it pulls in, and fails (exit status 1) when the median
+exceeds the budget or when a dependency that should only load on first network or parse use was imported.
+
+Usage: python benchmarks/bench_startup.py -n 20 --budget 50
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+
+root = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# imported on first use only, importing one of them at startup is a regression
+DEFERRED = ("requests", "urllib3", "jxmlease", "aiohttp", "asyncio", "datetime", "typing", "concurrent.futures",
+            "multiprocessing", "xml.sax.saxutils", "urllib.request", "http.client", "email", "ssl", "_ssl", "socket",
+            "base64", "json", "random")
+
+STATEMENT = "from Cisco_RoomOS_Lib import Cisco_RoomOS"
+
+
+def importtime(directory : str):
+    """Cumulative microseconds of every module imported by the statement run in directory, keyed by module name"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", STATEMENT], cwd=directory, check=True, capture_output=True, text=True)
+    modules = {}
+    for line in result.stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[1].strip().isdigit():
+            modules[fields[2].strip()] = int(fields[1])
+    return modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-n", type=int, default=15, help="interpreters started")
+    # the median is 25-30 ms on an idle machine, the budget leaves room for a loaded one
+    parser.add_argument("--budget", type=float, default=50.0, help="allowed median import time in milliseconds")
+    parser.add_argument("--top", type=int, default=8, help="heaviest imported modules to list")
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        # imported from a copy compiled up front, so that neither the compilation is timed nor bytecode written to the source tree
+        library = shutil.copy(os.path.join(root, "Cisco_RoomOS_Lib.py"), directory)
+        subprocess.run([sys.executable, "-m", "py_compile", library], check=True)
+        runs = [importtime(directory) for _ in range(args.n)]
+    total = statistics.median(run["Cisco_RoomOS_Lib"] for run in runs) / 1000
+    names = set().union(*runs) - {"Cisco_RoomOS_Lib"}
+    heaviest = sorted(names, key=lambda name: -statistics.median(run.get(name, 0) for run in runs))
+    print(f"{STATEMENT}: median {total:.2f} ms over {args.n} interpreters, budget {args.budget:.2f} ms")
+    for name in heaviest[:args.top]:
+        print(f"  {name:<28} {statistics.median(run.get(name, 0) for run in runs) / 1000:7.2f} ms")
+    loaded = [deferred for deferred in DEFERRED if any(name == deferred or name.startswith(deferred + ".") for name in names)]
+    failed = False
+    if loaded:
+        print(f"imported at startup although deferred: {', '.join(loaded)}")
+        failed = True
+    if total > args.budget:
+        print(f"over budget by {total - args.budget:.2f} ms")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Compares the cost of opening HTTPS connections to a codec with a fresh SSL context
+every time (full handshake) against the shared context of Cisco_RoomOS_Lib (TLS session resumption)
+
+Usage: python benchmarks/bench_tls_resumption.py 10.10.10.10 -n 50
+       python benchmarks/bench_tls_resumption.py 10.10.10.10:8443 --cafile codec-ca.pem
+"""
+
+import argparse
+import os
+import socket
+import ssl
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import Cisco_RoomOS_Lib
+
+
+def fresh_context(verify, min_tls):
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    context.minimum_version = ssl.TLSVersion[Cisco_RoomOS_Lib._TLS_VERSIONS[min_tls]]
+    if verify is False:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    elif isinstance(verify, str):
+        context.load_verify_locations(cafile=verify)
+    else:
+        context.load_default_certs()
+    return context
+
+
+def connect_once(context, host, port):
+    """Opens one connection, sends a HEAD request and reads the answer so TLS 1.3 tickets arrive, returns seconds and whether the session was reused"""
+    start = time.perf_counter()
+    with socket.create_connection((host, port), timeout=10) as sock:
+        with context.wrap_socket(sock, server_hostname=host) as tls:
+            elapsed = time.perf_counter() - start
+            reused = tls.session_reused
+            tls.sendall(f"HEAD / HTTP/1.1\r\nHost: {host}\r\nConnection: close\r\n\r\n".encode())
+            tls.recv(4096)
+    return elapsed, reused
+
+
+def run(label, make_context, host, port, count):
+    timings, reused = [], 0
+    for _ in range(count):
+        elapsed, was_reused = connect_once(make_context(), host, port)
+        timings.append(elapsed)
+        reused += was_reused
+    print(f"{label:<22} mean {statistics.mean(timings) * 1000:8.2f} ms   median {statistics.median(timings) * 1000:8.2f} ms   resumed {reused}/{count}")
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("address", help="codec host or host:port")
+    parser.add_argument("-n", type=int, default=30, help="connections per mode")
+    parser.add_argument("--cafile", default=False, help="CA bundle to verify the codec certificate, certificates are not verified by default")
+    parser.add_argument("--min-tls", default="TLSv1.2", choices=sorted(Cisco_RoomOS_Lib._TLS_VERSIONS))
+    args = parser.parse_args()
+    host, _, port = args.address.partition(":")
+    port = int(port or 443)
+
+    full = run("full handshake", lambda: fresh_context(args.cafile, args.min_tls), host, port, args.n)
+    shared = Cisco_RoomOS_Lib._shared_ssl_context(args.cafile, args.min_tls)
+    connect_once(shared, host, port)
+    resumed = run("session resumption", lambda: shared, host, port, args.n)
+    print(f"speedup (median)       {full / resumed:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+A provisioning playbook of N configuration writes sent one putxml request per set_config call, sent in one
+codec.transaction(), and left out by skip_unchanged. The playbook writes back the current values of the first N leaves
+of configuration.xml, so it leaves a real codec unchanged and is the compliance run where every value is already right. Runs against the local stand-in codec unless an address is given.
+
+Usage: python benchmarks/bench_transaction.py -n 30
+       python benchmarks/bench_transaction.py 10.10.10.10 -u admin -p secret --scheme https
+"""
+
+import argparse
+import os
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(here, ".."))
+sys.path.insert(0, here)
+import Cisco_RoomOS_Lib
+import xapi_standin
+
+
+def playbook(codec, count):
+    """(path, value) of the first count leaves of the configuration of the device, repeated when it has fewer
+    (the transaction then sends a repeated leaf once)"""
+    response = codec._request("GET", f"{codec.base_url}/configuration.xml")
+    leaves = [(path[1:], value) for path, value in Cisco_RoomOS_Lib._config_leaves(ET.fromstring(response.content))]
+    return [leaves[i % len(leaves)] for i in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("address", nargs="?", help="codec host[:port], a local stand-in is started when omitted")
+    parser.add_argument("-u", "--username", default="admin")
+    parser.add_argument("-p", "--password", default="admin")
+    parser.add_argument("--scheme", default="http", choices=("http", "https"))
+    parser.add_argument("-n", type=int, default=30, help="set_config calls in the playbook")
+    parser.add_argument("--transport", default="http", choices=("http", "websocket"))
+    args = parser.parse_args()
+    address = args.address
+    if address is None:
+        server = xapi_standin.start(username=args.username, password=args.password)
+        address = f"127.0.0.1:{server.server_address[1]}"
+
+    with Cisco_RoomOS_Lib.Cisco_RoomOS(address, args.username, args.password, scheme=args.scheme, transport=args.transport) as codec:
+        writes = playbook(codec, args.n)
+        start = time.perf_counter()
+        results = [codec.set_config(path, value) for path, value in writes]
+        sequential = time.perf_counter() - start
+        failed = sum(isinstance(result, Exception) for result in results)
+        print(f"one request per call   {len(writes):4d} requests   {sequential * 1000:8.2f} ms   {failed} failed")
+        start = time.perf_counter()
+        with codec.transaction() as transaction:
+            for path, value in writes:
+                codec.set_config(path, value)
+        batched = time.perf_counter() - start
+        print(f"transaction            {transaction.requests:4d} requests   {batched * 1000:8.2f} ms   {len(transaction.failed)} failed"
+              f"   {sequential / batched:.1f}x")
+    with Cisco_RoomOS_Lib.Cisco_RoomOS(address, args.username, args.password, scheme=args.scheme, transport=args.transport,
+                                      skip_unchanged=True) as codec:
+        start = time.perf_counter()
+        results = [codec.set_config(path, value) for path, value in writes]
+        skipped = time.perf_counter() - start
+        failed = sum(isinstance(result, Exception) for result in results)
+        # configuration.xml is read once to know the current values
+        print(f"skip_unchanged         {len(writes) - codec.skipped_writes + 1:4d} requests   {skipped * 1000:8.2f} ms   {failed} failed"
+              f"   {sequential / skipped:.1f}x   {codec.skipped_writes} skipped")
+
+
+if __name__ == "__main__":
+    main()
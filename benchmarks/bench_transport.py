@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+Throughput of the same Cisco_RoomOS calls over the HTTP transport (getxml/putxml) and the WebSocket
+JSON-RPC transport, sequentially and from several threads sharing one client.
+Runs against the local stand-in codec unless an address is given.
+
+Usage: python benchmarks/bench_transport.py -n 500 --threads 1 8
+       python benchmarks/bench_transport.py 10.10.10.10 -u admin -p secret --scheme https
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(here, ".."))
+sys.path.insert(0, here)
+import Cisco_RoomOS_Lib
+import xapi_standin
+
+WORKLOADS = {
+    "status get": lambda codec: codec.get_status_call_duration(3),
+    "config set": lambda codec: codec.set_default_call_rate(6000),
+    "command": lambda codec: codec.command_music_mode(),
+}
+
+
+def measure(codec, call, count, threads):
+    start = time.perf_counter()
+    if threads == 1:
+        results = [call(codec) for _ in range(count)]
+    else:
+        with ThreadPoolExecutor(threads) as pool:
+            results = list(pool.map(lambda _: call(codec), range(count)))
+    elapsed = time.perf_counter() - start
+    errors = sum(isinstance(result, Exception) for result in results)
+    return count / elapsed, errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("address", nargs="?", help="codec host[:port], a local stand-in is started when omitted")
+    parser.add_argument("-u", "--username", default="admin")
+    parser.add_argument("-p", "--password", default="admin")
+    parser.add_argument("--scheme", default="http", choices=("http", "https"))
+    parser.add_argument("-n", type=int, default=300, help="calls per measurement")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 8])
+    args = parser.parse_args()
+    address = args.address
+    if address is None:
+        server = xapi_standin.start(username=args.username, password=args.password)
+        address = f"127.0.0.1:{server.server_address[1]}"
+
+    print(f"{'workload':<12} {'threads':>7} {'http req/s':>12} {'websocket req/s':>16} {'ratio':>7}")
+    for name, call in WORKLOADS.items():
+        for threads in args.threads:
+            rates = []
+            for transport in ("http", "websocket"):
+                with Cisco_RoomOS_Lib.Cisco_RoomOS(address, args.username, args.password, scheme=args.scheme,
+                                                  transport=transport, pool_maxsize=max(args.threads)) as codec:
+                    call(codec)
+                    rate, errors = measure(codec, call, args.n, threads)
+                if errors:
+                    print(f"  {transport}: {errors} of {args.n} {name} calls failed")
+                rates.append(rate)
+            print(f"{name:<12} {threads:>7} {rates[0]:>12.0f} {rates[1]:>16.0f} {rates[1] / rates[0]:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
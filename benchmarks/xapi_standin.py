@@ -0,0 +1,372 @@
+# -*- coding: utf-8 -*-
+"""
+Local stand-in for a RoomOS codec: answers status.xml, configuration.xml, getxml and putxml over HTTP and
+xGet, xSet and xCommand over the JSON-RPC WebSocket (/ws) on the same port, from one small in-memory device.
+HTTP answers are gzip or deflate encoded when the client accepts it, and can be sent at a limited rate to
+stand for a slow link. Only the standard library is used, the WebSocket framing is implemented here.
+
+Usage: python benchmarks/xapi_standin.py --port 8080 --username admin --password admin
+       or from Python: server = xapi_standin.start(); address = f"127.0.0.1:{server.server_address[1]}"
+"""
+
+import argparse
+import base64
+import gzip
+import hashlib
+import json
+import struct
+import threading
+import time
+import zlib
+import xml.etree.ElementTree as ET
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+from xml.sax.saxutils import escape
+
+STATUS = """<Status>
+<Audio><Volume>50</Volume><Microphones><Mute>Off</Mute><MusicMode>Off</MusicMode></Microphones>
+<Input><Connectors><Microphone item="1"><Mute>Off</Mute></Microphone><Microphone item="2"><Mute>On</Mute></Microphone></Connectors></Input></Audio>
+<Call item="3"><Duration>42</Duration><Status>Connected</Status><Direction>Outgoing</Direction><RemoteNumber>room@example.com</RemoteNumber><Protocol>Sip</Protocol><ReceiveCallRate>6000</ReceiveCallRate><TransmitCallRate>6000</TransmitCallRate><DisplayName>Board &amp; Room</DisplayName><CallType>Video</CallType></Call>
+<Network item="1"><Ethernet><Speed>1000full</Speed><MacAddress>00:11:22:33:44:55</MacAddress></Ethernet><IPv4><Address>10.0.0.5</Address><Gateway>10.0.0.1</Gateway><SubnetMask>255.255.255.0</SubnetMask></IPv4></Network>
+<SIP><Registration item="1"><Status>Registered</Status><URI>room@example.com</URI></Registration></SIP>
+<SystemUnit><Uptime>1234</Uptime><ProductId>Cisco Room Kit</ProductId><Software><Version>ce10.0.0</Version></Software></SystemUnit>
+<UserInterface><ContactInfo><Name>Room-1</Name></ContactInfo></UserInterface>
+</Status>"""
+
+CONFIGURATION = """<Configuration>
+<Audio><DefaultVolume>50</DefaultVolume><Microphones><NoiseRemoval><Mode>Disabled</Mode></NoiseRemoval></Microphones></Audio>
+<Conference><AutoAnswer><Mode>Off</Mode><Delay>0</Delay><Mute>Off</Mute></AutoAnswer><DefaultCall><Protocol>Sip</Protocol><Rate>6000</Rate></DefaultCall><Encryption><Mode>BestEffort</Mode></Encryption></Conference>
+<NetworkServices><SSH><Mode>On</Mode></SSH><NTP><Mode>Auto</Mode><Server item="1"><Address>pool.ntp.org</Address></Server><Server item="2"><Address></Address></Server></NTP></NetworkServices>
+<SystemUnit><Name>Room-1</Name></SystemUnit>
+<Video><Selfview><OnCall><Mode>On</Mode><Duration>10</Duration></OnCall></Selfview></Video>
+</Configuration>"""
+
+NO_MATCH = {"code": -32602, "message": "No match on Path argument"}
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+class Device:
+    """In-memory status and configuration trees shared by the HTTP and WebSocket front ends"""
+
+    def __init__(self, status=STATUS, configuration=CONFIGURATION):
+        self.trees = {"Status": ET.fromstring(status), "Configuration": ET.fromstring(configuration)}
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.calls = 0
+        # entries answered to CallHistory/Get
+        self.history = 1
+
+    def select(self, path):
+        """Elements addressed by a path like ["Status", "Call", 3, "Duration"], None when the root is unknown"""
+        root = self.trees.get(path[0]) if path else None
+        if root is None:
+            return None
+        elements = [root]
+        for part in path[1:]:
+            if isinstance(part, int):
+                elements = [element for element in elements if element.get("item") == str(part)]
+            else:
+                elements = [child for element in elements for child in element if child.tag == part]
+        return elements
+
+    def get(self, path):
+        """xGet: JSON value of the path"""
+        with self.lock:
+            elements = self.select(path)
+            if not elements:
+                raise LookupError(path)
+            if len(elements) > 1 or (not isinstance(path[-1], int) and elements[0].get("item")):
+                return [to_json(element) for element in elements]
+            return to_json(elements[0])
+
+    def set(self, path, value):
+        """xSet: change one configuration value"""
+        with self.lock:
+            elements = self.select(path) if path[0] == "Configuration" else None
+            if not elements or len(elements) != 1 or len(elements[0]):
+                raise LookupError(path)
+            elements[0].text = str(value)
+
+    def command(self, path, params):
+        """xCommand: result dict of the command, raises ValueError with the reason on failure"""
+        name = "/".join(path)
+        with self.lock:
+            self.calls += 1
+            if name == "Dial":
+                if not params.get("Number"):
+                    raise ValueError("Missing or invalid parameter(s): Number")
+                return {"CallId": 3, "ConferenceId": 1}
+            if name == "Call/Disconnect":
+                return {}
+            if name == "Audio/Microphones/ToggleMute":
+                mute = self.trees["Status"].find("Audio/Microphones/Mute")
+                mute.text = "Off" if mute.text == "On" else "On"
+                return {}
+            if name == "CallHistory/Get":
+                return {"Entry": [{"id": e, "CallHistoryId": e, "CallbackNumber": "sip:room@example.com", "DisplayName": "Room",
+                                   "StartTime": "2022-07-01T10:00:00", "Duration": 30, "DisappearanceReason": "LocalDisconnect",
+                                   "Direction": "Outgoing", "OccurrenceType": "Placed", "Protocol": "Sip", "CallRate": 6000}
+                                  for e in range(1, self.history + 1)]}
+            if name in ("Audio/Microphones/MusicMode/Start", "Audio/Microphones/NoiseRemoval/Activate",
+                        "Audio/Microphones/NoiseRemoval/Deactivate", "Audio/Diagnostics/MeasureDelay", "Bookings/NotificationSnooze"):
+                return {}
+        raise ValueError(f"Unknown command: {name}")
+
+
+def to_json(element):
+    """JSON-RPC form of an element: repeated or numbered children become lists of objects carrying their id"""
+    children = list(element)
+    if not children:
+        text = element.text or ""
+        return int(text) if text.isdigit() else text
+    value = {"id": int(element.get("item"))} if element.get("item") else {}
+    for tag in dict.fromkeys(child.tag for child in children):
+        group = [child for child in children if child.tag == tag]
+        if len(group) > 1 or group[0].get("item"):
+            value[tag] = [to_json(child) for child in group]
+        else:
+            value[tag] = to_json(group[0])
+    return value
+
+
+def to_xml(name, value):
+    if isinstance(value, list):
+        return "".join(to_xml(name, entry) for entry in value)
+    if isinstance(value, dict):
+        item = f' item="{value["id"]}"' if "id" in value else ""
+        return f"<{name}{item}>" + "".join(to_xml(key, child) for key, child in value.items() if key != "id") + f"</{name}>"
+    return f"<{name}>{escape(str(value))}</{name}>"
+
+
+def xml_path(location):
+    return [int(part) if part.isdigit() else part for part in location.strip("/").split("/") if part]
+
+
+def command_call(root):
+    path, node = [], root
+    while True:
+        children = list(node)
+        if len(children) == 1 and (len(children[0]) or not (children[0].text or "").strip()):
+            node = children[0]
+            path.append(node.tag)
+        else:
+            break
+    return path, {child.tag: child.text or "" for child in children}
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # headers and body go out in separate writes, without this delayed ACKs cap keep-alive clients at ~25 req/s
+    disable_nagle_algorithm = True
+    device = None
+    credentials = None
+    # encode answers larger than this when the client accepts gzip or deflate, None to never encode
+    compress_above = 1024
+    # bytes per second the answers are written at, None for no limit
+    rate = None
+
+    def log_message(self, *args):
+        pass
+
+    def _authorised(self):
+        return self.headers.get("Authorization") == f"Basic {self.credentials}"
+
+    def _reply(self, status, body=""):
+        data = body.encode()
+        accepted = [coding.split(";")[0].strip() for coding in self.headers.get("Accept-Encoding", "").split(",")]
+        encoding = None
+        if self.compress_above is not None and len(data) > self.compress_above:
+            if "gzip" in accepted:
+                data, encoding = gzip.compress(data), "gzip"
+            elif "deflate" in accepted:
+                data, encoding = zlib.compress(data), "deflate"
+        self.send_response(status)
+        self.send_header("Content-Type", "text/xml")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        if self.command == "HEAD":
+            return
+        if self.rate is None:
+            self.wfile.write(data)
+            return
+        for start in range(0, len(data), 16384):
+            chunk = data[start:start + 16384]
+            self.wfile.write(chunk)
+            self.wfile.flush()
+            time.sleep(len(chunk) / self.rate)
+
+    def do_HEAD(self):
+        self._reply(200)
+
+    def do_GET(self):
+        if self.headers.get("Upgrade", "").lower() == "websocket":
+            return self._websocket()
+        self.device.requests += 1
+        if not self._authorised():
+            return self._reply(401)
+        parts = urlsplit(self.path)
+        if parts.path in ("/status.xml", "/configuration.xml"):
+            root = self.device.trees[parts.path[1:-4].capitalize()]
+            with self.device.lock:
+                return self._reply(200, '<?xml version="1.0"?>\n' + ET.tostring(root, encoding="unicode"))
+        if parts.path != "/getxml":
+            return self._reply(404)
+        path = xml_path(parse_qs(parts.query).get("location", [""])[0])
+        try:
+            value = self.device.get(path)
+        except LookupError:
+            return self._reply(200, f'<?xml version="1.0"?>\n<{path[0]}/>' if path else "")
+        names = []
+        for part in path:
+            if isinstance(part, int):
+                names[-1] = (names[-1][0], part)
+            else:
+                names.append((part, None))
+        if isinstance(value, dict) and names[-1][1] is not None:
+            value = dict(value, id=names[-1][1])
+        body = to_xml(names[-1][0], value)
+        for name, item in reversed(names[:-1]):
+            attribute = f' item="{item}"' if item is not None else ""
+            body = f"<{name}{attribute}>{body}</{name}>"
+        self._reply(200, '<?xml version="1.0"?>\n' + body)
+
+    def do_POST(self):
+        self.device.requests += 1
+        data = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if not self._authorised():
+            return self._reply(401)
+        if urlsplit(self.path).path != "/putxml":
+            return self._reply(404)
+        try:
+            root = ET.fromstring(data)
+        except ET.ParseError:
+            return self._reply(400)
+        if root.tag == "Configuration":
+            errors = ""
+            for path, value in config_leaves(root):
+                try:
+                    self.device.set(path, value)
+                except LookupError:
+                    errors += f"<Error><Details>{NO_MATCH['message']}</Details><XPath>/{'/'.join(map(str, path))}</XPath></Error>"
+            return self._reply(200, f"<Configuration>{errors or '<Success/>'}</Configuration>")
+        path, params = command_call(root)
+        name = "".join(path[-2:]) + "Result"
+        try:
+            result = self.device.command(path, params)
+        except ValueError as e:
+            return self._reply(200, f'<Command><{name} status="Error"><Reason>{escape(str(e))}</Reason></{name}></Command>')
+        body = "".join(to_xml(key, value) for key, value in result.items())
+        self._reply(200, f'<Command><{name} status="OK">{body}</{name}></Command>')
+
+    def _websocket(self):
+        if not self._authorised():
+            return self._reply(401)
+        accept = base64.b64encode(hashlib.sha1((self.headers["Sec-WebSocket-Key"] + WEBSOCKET_GUID).encode()).digest()).decode()
+        self.send_response(101)
+        self.send_header("Upgrade", "websocket")
+        self.send_header("Connection", "Upgrade")
+        self.send_header("Sec-WebSocket-Accept", accept)
+        self.end_headers()
+        self.wfile.flush()
+        while True:
+            opcode, payload = self._read_frame()
+            if opcode is None or opcode == 0x8:
+                self._write_frame(0x8, b"")
+                break
+            if opcode == 0x9:
+                self._write_frame(0xA, payload)
+            elif opcode == 0x1:
+                self._write_frame(0x1, json.dumps(self._rpc(json.loads(payload))).encode())
+        self.close_connection = True
+
+    def _read_frame(self):
+        header = self.rfile.read(2)
+        if len(header) < 2:
+            return None, b""
+        opcode, length = header[0] & 0x0F, header[1] & 0x7F
+        if length == 126:
+            length = struct.unpack("!H", self.rfile.read(2))[0]
+        elif length == 127:
+            length = struct.unpack("!Q", self.rfile.read(8))[0]
+        mask = self.rfile.read(4) if header[1] & 0x80 else b"\0\0\0\0"
+        payload = self.rfile.read(length)
+        return opcode, bytes(byte ^ mask[i % 4] for i, byte in enumerate(payload))
+
+    def _write_frame(self, opcode, payload):
+        length = len(payload)
+        if length < 126:
+            header = struct.pack("!BB", 0x80 | opcode, length)
+        elif length < 65536:
+            header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+        else:
+            header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+        self.wfile.write(header + payload)
+        self.wfile.flush()
+
+    def _rpc(self, request):
+        self.device.requests += 1
+        method, params = request.get("method", ""), request.get("params") or {}
+        reply = {"jsonrpc": "2.0", "id": request.get("id")}
+        try:
+            if method == "xGet":
+                reply["result"] = self.device.get(params["Path"])
+            elif method == "xSet":
+                self.device.set(params["Path"], params["Value"])
+                reply["result"] = True
+            elif method.startswith("xCommand/"):
+                reply["result"] = self.device.command(method.split("/")[1:], params)
+            else:
+                reply["error"] = {"code": -32601, "message": "Method not found"}
+        except (LookupError, KeyError):
+            reply["error"] = NO_MATCH
+        except ValueError as e:
+            reply["error"] = {"code": 1, "message": "Command returned an error.", "data": {"Reason": str(e)}}
+        return reply
+
+
+def config_leaves(root):
+    leaves = []
+    def walk(element, path):
+        children = list(element)
+        if not children:
+            leaves.append((path, element.text or ""))
+        for child in children:
+            walk(child, path + [child.tag] + ([int(child.get("item"))] if child.get("item") else []))
+    walk(root, [root.tag])
+    return leaves
+
+
+def start(port=0, username="admin", password="admin", host="127.0.0.1", status=STATUS, compress_above=1024, rate=None,
+          configuration=CONFIGURATION):
+    """Serve a fresh stand-in device in a background thread, returns the server, its .device holds the state.
+    status, configuration: documents of the device, compress_above and rate: see Handler"""
+    handler = type("StandInHandler", (Handler,), {"device": Device(status, configuration), "compress_above": compress_above, "rate": rate,
+                                                  "credentials": base64.b64encode(f"{username}:{password}".encode()).decode()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.device = handler.device
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--password", default="admin")
+    parser.add_argument("--rate", type=float, help="bytes per second to send the answers at")
+    parser.add_argument("--no-compression", action="store_true", help="never gzip or deflate encode the answers")
+    args = parser.parse_args()
+    server = start(args.port, args.username, args.password, args.host, compress_above=None if args.no_compression else 1024, rate=args.rate)
+    print(f"RoomOS stand-in listening on {args.host}:{server.server_address[1]}, Ctrl+C to stop")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()